@@ -0,0 +1,147 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+
+# Dimensi dan metrik yang dirangkum di dalam cube
+CUBE_DIMENSIONS = ["season", "weathersit", "workingday", "holiday", "mnth", "yr", "hr"]
+CUBE_METRICS = ["cnt", "casual", "registered"]
+
+
+# Cube agregat: satu kali groupby atas semua dimensi, lalu semua statistik per musim,
+# cuaca, hari kerja, dst. dibaca dari sel-sel cube tanpa memindai ulang DataFrame.
+# Tiap sel menyimpan count, sum, sum kuadrat, min, max, perkalian silang antar metrik,
+# dan indeks baris anggotanya (format CSR: order + offsets).
+class AggregateCube:
+    def __init__(self, df, dimensions=None, metrics=None):
+        self.dimensions = [col for col in (dimensions or CUBE_DIMENSIONS) if col in df.columns]
+        self.metrics = [col for col in (metrics or CUBE_METRICS) if col in df.columns]
+        if not self.dimensions or not self.metrics:
+            raise ValueError("Data tidak memiliki kolom dimensi atau metrik untuk cube")
+
+        grouped = df.groupby(self.dimensions, observed=True, sort=True)
+        codes = grouped.ngroup().to_numpy()
+        valid = codes >= 0
+        n_groups = grouped.ngroups
+
+        cells = grouped.size().index.to_frame(index=False)
+        cells["count"] = np.bincount(codes[valid], minlength=n_groups)
+
+        self.values = {}
+        for metric in self.metrics:
+            values = df[metric].to_numpy()
+            self.values[metric] = values
+            weights = values[valid].astype("float64")
+            cells[f"{metric}_sum"] = np.bincount(codes[valid], weights, minlength=n_groups)
+            cells[f"{metric}_sumsq"] = np.bincount(codes[valid], weights * weights, minlength=n_groups)
+
+        extremes = grouped[self.metrics].agg(["min", "max"])
+        for metric in self.metrics:
+            cells[f"{metric}_min"] = extremes[(metric, "min")].to_numpy()
+            cells[f"{metric}_max"] = extremes[(metric, "max")].to_numpy()
+
+        # Perkalian silang antar metrik untuk korelasi
+        for left, right in itertools.combinations(self.metrics, 2):
+            product = self.values[left][valid].astype("float64") * self.values[right][valid]
+            cells[f"{left}*{right}_sum"] = np.bincount(codes[valid], product, minlength=n_groups)
+
+        self.cells = cells
+        self.n_rows = int(cells["count"].sum())
+
+        # Indeks baris per sel: baris sel g ada di order[offsets[g]:offsets[g + 1]]
+        self.order = np.argsort(np.where(valid, codes, n_groups), kind="stable")[:self.n_rows]
+        self.offsets = np.concatenate([[0], np.cumsum(cells["count"].to_numpy())])
+
+    # Posisi baris (urut seperti DataFrame asal) untuk sel yang memenuhi filter dimensi
+    def row_indices(self, **filters):
+        selected = np.ones(len(self.cells), dtype=bool)
+        for dim, value in filters.items():
+            selected &= self.cells[dim].to_numpy() == value
+        groups = np.flatnonzero(selected)
+        if len(groups) == 0:
+            return np.empty(0, dtype=np.intp)
+        parts = [self.order[self.offsets[g]:self.offsets[g + 1]] for g in groups]
+        return np.sort(np.concatenate(parts))
+
+    # Sampel nilai metrik untuk satu kombinasi dimensi, misalnya samples("cnt", season=1)
+    def samples(self, metric, **filters):
+        return self.values[metric][self.row_indices(**filters)]
+
+    # Rangkuman sel digabung ke level dimensi yang diminta
+    def marginal(self, dims):
+        dims = [dims] if isinstance(dims, str) else list(dims)
+        columns = ["count"] + [col for col in self.cells.columns if col.endswith(("_sum", "_sumsq"))]
+        grouped = self.cells.groupby(dims, sort=True)
+        table = grouped[columns].sum()
+        for metric in self.metrics:
+            table[f"{metric}_min"] = grouped[f"{metric}_min"].min()
+            table[f"{metric}_max"] = grouped[f"{metric}_max"].max()
+        return table
+
+    # Rata-rata metrik per kategori dimensi (setara groupby(dim)[metric].mean())
+    def mean(self, dim, metric):
+        table = self.marginal(dim)
+        return (table[f"{metric}_sum"] / table["count"]).rename(metric)
+
+    # Statistik deskriptif per kategori dimensi (setara groupby(dim)[metric].describe())
+    def describe(self, dim, metric):
+        table = self.marginal(dim)
+        count = table["count"].astype("float64")
+        total = table[f"{metric}_sum"]
+        variance = (table[f"{metric}_sumsq"] - total * total / count) / (count - 1)
+
+        quartiles = []
+        for value in table.index:
+            samples = self.samples(metric, **{dim: value})
+            quartiles.append(np.quantile(samples, [0.25, 0.5, 0.75]))
+        quartiles = np.array(quartiles).reshape(-1, 3)
+
+        return pd.DataFrame({
+            "count": count,
+            "mean": total / count,
+            "std": np.sqrt(variance.clip(lower=0)),
+            "min": table[f"{metric}_min"].astype("float64"),
+            "25%": quartiles[:, 0],
+            "50%": quartiles[:, 1],
+            "75%": quartiles[:, 2],
+            "max": table[f"{metric}_max"].astype("float64"),
+        }, index=table.index)
+
+    # Nilai kolom dimensi per sel sebagai float64; kolom dimensi bertipe int8 (lihat ingestion.py)
+    # akan overflow jika dikalikan langsung, misalnya hr * hr * count
+    def _dimension_values(self, col):
+        return self.cells[col].to_numpy(dtype="float64")
+
+    # Jumlah (Σx) dan perkalian silang (Σxy) sebuah kolom dimensi/metrik per sel
+    def _column_sum(self, col):
+        if col in self.metrics:
+            return self.cells[f"{col}_sum"].to_numpy()
+        return self._dimension_values(col) * self.cells["count"].to_numpy()
+
+    def _cross_sum(self, left, right):
+        count = self.cells["count"].to_numpy()
+        if left in self.dimensions and right in self.dimensions:
+            return self._dimension_values(left) * self._dimension_values(right) * count
+        if left in self.dimensions:
+            return self._dimension_values(left) * self._column_sum(right)
+        if right in self.dimensions:
+            return self._dimension_values(right) * self._column_sum(left)
+        if left == right:
+            return self.cells[f"{left}_sumsq"].to_numpy()
+        key = f"{left}*{right}_sum" if f"{left}*{right}_sum" in self.cells else f"{right}*{left}_sum"
+        return self.cells[key].to_numpy()
+
+    # Matriks korelasi Pearson antar kolom dimensi/metrik dari statistik sel
+    def corr(self, columns):
+        # Dihitung dalam float agar perkalian jumlah besar tidak overflow pada kolom bertipe integer
+        n = float(self.n_rows)
+        sums = {col: float(self._column_sum(col).sum()) for col in columns}
+        matrix = np.empty((len(columns), len(columns)))
+        for i, left in enumerate(columns):
+            for j, right in enumerate(columns):
+                covariance = n * float(self._cross_sum(left, right).sum()) - sums[left] * sums[right]
+                left_var = n * float(self._cross_sum(left, left).sum()) - sums[left] ** 2
+                right_var = n * float(self._cross_sum(right, right).sum()) - sums[right] ** 2
+                matrix[i, j] = covariance / np.sqrt(left_var * right_var)
+        return pd.DataFrame(matrix, index=columns, columns=columns)
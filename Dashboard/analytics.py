@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import f_oneway, ttest_ind
+
+import charts
+import resampling
+from charts import render_chart
+from outliers import count_outliers, split_numeric_columns
+from pipeline import DEFAULT_MULTIPLIER, run_stages
+from segmentation import RENTAL_LABELS, segment, segment_counts
+
+
+# Mode pembersihan outlier (label di dashboard -> mode inlier_mask)
+CLEANING_MODES = {"Berurutan (per kolom)": "sequential", "Serentak (semua kolom)": "simultaneous"}
+
+SEASONS = [1, 2, 3, 4]
+
+# Grafik laporan: nama artefak -> (fungsi gambar, tabel hasil analisis, parameter gambar).
+# Dashboard dan batch memakai definisi yang sama sehingga gambar hasil batch identik.
+REPORT_CHARTS = {
+    "correlation_heatmap": ("draw_correlation_heatmap", ["correlation"], {"figsize": (6, 5)}),
+    "correlation_heatmap_anova": ("draw_correlation_heatmap", ["correlation"], {"fmt": ".2f", "linewidths": 0.5, "square": True, "figsize": (6, 4)}),
+    "workingday_bar": ("draw_workingday_bar", ["workingday_means"], {"figsize": (8, 5)}),
+    "season_means_bar": ("draw_season_means_bar", ["season_means"], {"figsize": (10, 6)}),
+    "weather_means_bar": ("draw_weather_means_bar", ["weather_means"], {"figsize": (10, 6)}),
+    "seasonal_trend_line": ("draw_seasonal_trend_line", ["season_means"], {"figsize": (8, 5)}),
+    "rental_segments_bar": ("draw_category_counts_bar", ["segment_counts"], {"figsize": (8, 5)}),
+    "weather_category_bar": ("draw_category_means_bar", ["weather_means"], {
+        "title": "Rata-rata Penyewaan Berdasarkan Kategori Cuaca", "xlabel": "Kategori Cuaca",
+        "xticklabels": ["Cerah", "Mendung", "Hujan/Salju"], "figsize": (8, 5)}),
+    "season_category_bar": ("draw_category_means_bar", ["season_means"], {
+        "title": "Rata-rata Penyewaan Berdasarkan Kategori Musim", "xlabel": "Kategori Musim",
+        "xticklabels": ["Spring", "Summer", "Fall", "Winter"], "figsize": (8, 5)}),
+}
+
+
+# Ubah skalar numpy menjadi tipe Python agar hasil bisa ditulis sebagai JSON
+def _plain(result):
+    return {key: value.item() if isinstance(value, np.generic) else value for key, value in result.items()}
+
+
+# Pengecekan kualitas data: missing values, duplikat, deskripsi dan jumlah outlier IQR
+def assess_dataset(df, multiplier=1.5):
+    binary_columns, continuous_columns = split_numeric_columns(df)
+    return {
+        "missing": df.isnull().sum(),
+        "duplicates": int(df.duplicated().sum()),
+        "describe": df.describe(),
+        "continuous_columns": continuous_columns,
+        "outliers": count_outliers(df, continuous_columns, multiplier=multiplier),
+    }
+
+
+# Konversi kolom tanggal lalu hapus outlier dari kolom kontinu (semua tahap pipeline.py tanpa cache);
+# DataFrame asal tidak diubah
+def clean_dataset(df, mode="sequential", multiplier=DEFAULT_MULTIPLIER):
+    return run_stages(df, mode=mode, multiplier=multiplier)
+
+
+# Semua tabel dan uji statistik halaman analisis, dihitung dari cube agregat data bersih
+# `progress(done, total, message)` opsional dipanggil di antara langkah (lihat executor.Job.report)
+def analyze(cube, n_resamples=resampling.DEFAULT_RESAMPLES, workers=None, progress=None):
+    # Satu pool proses untuk semua uji resampling di bawah (lihat resampling.ResamplingPool)
+    with resampling.resampling_pool(workers) as pool:
+        return _analyze(cube, n_resamples, pool, report=progress or (lambda done, total, message: None))
+
+
+def _analyze(cube, n_resamples, workers, report):
+    steps = len(SEASONS) + 5
+
+    workday_rentals = cube.samples("cnt", workingday=1)
+    weekend_rentals = cube.samples("cnt", workingday=0)
+    season_samples = [cube.samples("cnt", season=season) for season in SEASONS]
+
+    season_intervals = {}
+    for step, (season, samples) in enumerate(zip(SEASONS, season_samples)):
+        report(step, steps, f"Bootstrap musim {charts.SEASON_LABELS[season]}")
+        if len(samples) > 0:
+            interval = resampling.bootstrap_mean_ci(samples, n_resamples=n_resamples, seed=season, workers=workers)
+            season_intervals[charts.SEASON_LABELS[season]] = interval
+
+    report(len(SEASONS), steps, "Tabel ringkasan")
+    tables = {
+        "season_stats": cube.describe("season", "cnt"),
+        "weather_stats": cube.describe("weathersit", "cnt"),
+        "correlation": cube.corr(["season", "weathersit", "cnt"]),
+        "workingday_means": cube.mean("workingday", "cnt"),
+        "season_means": cube.mean("season", "cnt"),
+        "weather_means": cube.mean("weathersit", "cnt"),
+        "segment_counts": segment_counts(segment(cube.values["cnt"], quantiles=(0.25, 0.75), labels=RENTAL_LABELS)),
+        "season_intervals": pd.DataFrame.from_dict(season_intervals, orient="index"),
+    }
+
+    t_stat, t_p_value = ttest_ind(workday_rentals, weekend_rentals, equal_var=False)
+    anova = f_oneway(*season_samples)
+    report(len(SEASONS) + 1, steps, "Uji permutasi hari kerja vs akhir pekan")
+    permutation = resampling.permutation_test(workday_rentals, weekend_rentals, n_resamples=n_resamples, workers=workers)
+    report(len(SEASONS) + 2, steps, "Bootstrap selisih rata-rata")
+    bootstrap_diff = resampling.bootstrap_diff_ci(workday_rentals, weekend_rentals, n_resamples=n_resamples, workers=workers)
+    report(len(SEASONS) + 3, steps, "Uji normalitas")
+    normality = resampling.normality_test(cube.values["cnt"])
+    report(len(SEASONS) + 4, steps, "ANOVA permutasi")
+    permutation_anova = resampling.permutation_anova(season_samples, n_resamples=n_resamples, workers=workers)
+    stats = {
+        "n_rows": cube.n_rows,
+        "n_resamples": n_resamples,
+        "ttest": _plain({"statistic": t_stat, "p_value": t_p_value}),
+        "permutation": _plain(permutation),
+        "bootstrap_diff": _plain(bootstrap_diff),
+        "normality": _plain(normality),
+        "anova": _plain({"statistic": anova.statistic, "p_value": anova.pvalue}),
+        "permutation_anova": _plain(permutation_anova),
+    }
+    return {"tables": tables, "stats": stats}
+
+
+# Data dan parameter untuk menggambar satu grafik laporan
+def report_chart_inputs(name, results):
+    draw_name, table_names, params = REPORT_CHARTS[name]
+    return getattr(charts, draw_name), [results["tables"][table] for table in table_names], params
+
+
+# Gambar semua grafik laporan ke bytes PNG
+def render_report_charts(results):
+    images = {}
+    for name in REPORT_CHARTS:
+        draw, data, params = report_chart_inputs(name, results)
+        images[name] = render_chart(draw, *data, **params)
+    return images
@@ -0,0 +1,171 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ingestion import CHUNK_SIZE
+from timeseries import build_hourly_index
+
+
+# Kolom yang dibutuhkan untuk menentukan baseline musiman tiap jam
+ANOMALY_COLUMNS = ["dteday", "hr", "weekday", "season"]
+
+# Satu deret baseline per kombinasi musim x hari x jam
+N_BASELINES = 4 * 7 * 24
+
+# Jumlah pengamatan sebelumnya pada deret yang sama (jam dan hari yang sama = satu pengamatan per minggu)
+DEFAULT_WINDOW = 8
+# Baseline baru dipakai jika deret sudah memiliki sekurangnya sekian pengamatan
+DEFAULT_MIN_PERIODS = 4
+# Batas skor z robust (Iglewicz & Hoaglin); |skor| di atas batas ditandai anomali
+DEFAULT_THRESHOLD = 3.5
+# Batas bawah skala (MAD): minimal MIN_SCALE satuan metrik dan MIN_RELATIVE_SCALE x baseline. Deret dengan
+# sedikit pengamatan sering memiliki MAD hampir nol, sehingga selisih kecil (beberapa persen) akan ditandai anomali.
+MIN_SCALE = 5.0
+MIN_RELATIVE_SCALE = 0.1
+
+# Skor z robust = 0.6745 (x - median) / MAD; 0.6745 membuat MAD setara simpangan baku pada distribusi normal
+MAD_TO_Z = 0.6745
+
+DIRECTION_LABELS = {True: "Lonjakan", False: "Penurunan"}
+
+
+# Nomor deret baseline tiap baris: ((season - 1) x 7 + weekday) x 24 + hr
+def baseline_keys(df):
+    season = df["season"].to_numpy().astype("int64") - 1
+    return (season * 7 + df["weekday"].to_numpy().astype("int64")) * 24 + df["hr"].to_numpy().astype("int64")
+
+
+# Median tiap baris dari jendela yang sudah diurutkan (NaN di akhir) dengan `counts` nilai valid per baris
+def _sorted_median(ordered, counts):
+    rows = np.arange(len(ordered))
+    low, high = np.maximum((counts - 1) // 2, 0), np.maximum(counts // 2, 0)
+    with np.errstate(invalid="ignore"):
+        return (ordered[rows, low] + ordered[rows, high]) / 2
+
+
+# Median dan MAD tiap baris matriks jendela (n x window, NaN = slot kosong), dihitung dengan dua sort per baris.
+# Baris dengan nilai valid kurang dari min_periods mendapat NaN.
+def window_stats(windows, min_periods=DEFAULT_MIN_PERIODS):
+    counts = np.count_nonzero(~np.isnan(windows), axis=1)
+    median = _sorted_median(np.sort(windows, axis=1), counts)
+    mad = _sorted_median(np.sort(np.abs(windows - median[:, None]), axis=1), counts)
+    median[counts < min_periods] = np.nan
+    return median, mad
+
+
+def robust_scores(values, median, mad, min_scale=MIN_SCALE):
+    return MAD_TO_Z * (values - median) / np.maximum(mad, np.maximum(min_scale, MIN_RELATIVE_SCALE * np.abs(median)))
+
+
+# Tabel hasil per baris: nilai, baseline (median), skala (MAD), skor dan tanda anomali
+def _result(index, keys, values, median, mad, metric, threshold, min_scale):
+    scores = robust_scores(values, median, mad, min_scale)
+    with np.errstate(invalid="ignore"):
+        anomaly = np.abs(scores) > threshold
+    return pd.DataFrame({
+        metric: values,
+        "baseline": median,
+        "mad": mad,
+        "score": scores,
+        "anomaly": anomaly,
+        "direction": np.where(scores > 0, DIRECTION_LABELS[True], DIRECTION_LABELS[False]),
+        "season": keys // (7 * 24) + 1,
+        "weekday": keys // 24 % 7,
+        "hr": keys % 24,
+    }, index=index)
+
+
+# Deteksi anomali batch: tiap jam dibandingkan dengan median dan MAD `window` pengamatan sebelumnya pada deret
+# musim x hari x jam yang sama. Baris diurutkan per deret lalu waktu, sehingga jendela bergulir semua deret adalah
+# satu sliding_window_view atas seluruh nilai; slot yang berasal dari deret lain dikosongkan. Matriks jendela
+# dibentuk per potongan baris sehingga memori tambahan sebanding dengan chunksize x window.
+def detect_anomalies(df, metric="cnt", window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD,
+                     min_periods=DEFAULT_MIN_PERIODS, min_scale=MIN_SCALE, chunksize=CHUNK_SIZE, progress=None):
+    index = build_hourly_index(df)
+    keys = baseline_keys(df)
+    order = np.lexsort((index.to_numpy(), keys))
+    values = df[metric].to_numpy(dtype="float64", na_value=np.nan)[order]
+    sorted_keys = keys[order]
+
+    # Baris i dari jendela = values[i - window : i] (pengamatan sebelum baris i)
+    windows = sliding_window_view(np.concatenate([np.full(window, np.nan), values]), window)[:len(values)]
+    window_keys = sliding_window_view(np.concatenate([np.full(window, -1), sorted_keys]), window)[:len(values)]
+    median, mad = np.empty(len(values)), np.empty(len(values))
+    starts = range(0, len(values), chunksize)
+    for done, start in enumerate(starts):
+        if progress is not None:
+            progress(done, len(starts), f"Baris {start:,} dari {len(values):,}")
+        stop = start + chunksize
+        block = np.where(window_keys[start:stop] == sorted_keys[start:stop, None], windows[start:stop], np.nan)
+        median[start:stop], mad[start:stop] = window_stats(block, min_periods)
+
+    result = _result(index[order], sorted_keys, values, median, mad, metric, threshold, min_scale)
+    return result.iloc[np.argsort(index.to_numpy()[order], kind="stable")]
+
+
+# Deteksi anomali streaming: baris baru diskor saat datang dengan baseline yang sama seperti detect_anomalies.
+# State tetap per deret (ring buffer `window` nilai terakhir), sehingga memori konstan berapa pun jumlah baris
+# yang sudah diproses. Satu batch diskor per putaran: putaran ke-r berisi kemunculan ke-r tiap deret di batch,
+# sehingga tiap putaran adalah satu operasi vektor dan baris dalam deret yang sama tetap berurutan.
+class StreamingDetector:
+    def __init__(self, metric="cnt", window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD,
+                 min_periods=DEFAULT_MIN_PERIODS, min_scale=MIN_SCALE):
+        self.metric = metric
+        self.window = window
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self.min_scale = min_scale
+        self.buffers = np.full((N_BASELINES, window), np.nan)
+        self.counts = np.zeros(N_BASELINES, dtype="int64")
+        self.n_seen = 0
+
+    # Isi buffer dari data historis tanpa menskor tiap baris: `window` nilai terakhir per deret
+    def warm(self, df):
+        index = build_hourly_index(df)
+        keys = baseline_keys(df)
+        order = np.lexsort((index.to_numpy(), keys))
+        values = df[self.metric].to_numpy(dtype="float64", na_value=np.nan)[order]
+        sorted_keys = keys[order]
+        # Posisi tiap baris dihitung dari akhir deretnya (0 = pengamatan terakhir)
+        starts = np.searchsorted(sorted_keys, sorted_keys, side="left")
+        ends = np.searchsorted(sorted_keys, sorted_keys, side="right")
+        from_end = ends - 1 - np.arange(len(sorted_keys))
+        recent = from_end < self.window
+        self._push(sorted_keys[recent], values[recent], from_end[recent], (ends - starts)[recent])
+        self.n_seen += len(df)
+        return self
+
+    # Tulis nilai ke slot ring buffer; `from_end` menentukan urutan (0 = terbaru), `total` jumlah nilai deret
+    def _push(self, keys, values, from_end, total):
+        filled = self.counts[keys] + total
+        slots = (filled - 1 - from_end) % self.window
+        self.buffers[keys, slots] = values
+        np.maximum.at(self.counts, keys, filled)
+
+    # Skor baris baru (urutan waktu), lalu masukkan ke buffer; mengembalikan tabel seperti detect_anomalies
+    def score(self, df):
+        index = build_hourly_index(df)
+        order = np.argsort(index.to_numpy(), kind="stable")
+        index = index[order]
+        keys = baseline_keys(df)[order]
+        values = df[self.metric].to_numpy(dtype="float64", na_value=np.nan)[order]
+        occurrence = pd.Series(keys).groupby(keys).cumcount().to_numpy()
+
+        median, mad = np.empty(len(values)), np.empty(len(values))
+        for round_number in range(occurrence.max() + 1 if len(values) else 0):
+            rows = np.flatnonzero(occurrence == round_number)
+            round_keys = keys[rows]
+            median[rows], mad[rows] = window_stats(self.buffers[round_keys], self.min_periods)
+            self._push(round_keys, values[rows], np.zeros(len(rows), dtype="int64"), np.ones(len(rows), dtype="int64"))
+        self.n_seen += len(df)
+        return _result(index, keys, values, median, mad, self.metric, self.threshold, self.min_scale)
+
+    def copy(self):
+        clone = StreamingDetector(self.metric, self.window, self.threshold, self.min_periods, self.min_scale)
+        clone.buffers, clone.counts, clone.n_seen = self.buffers.copy(), self.counts.copy(), self.n_seen
+        return clone
+
+    @property
+    def nbytes(self):
+        return self.buffers.nbytes + self.counts.nbytes
+
@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+
+
+# Lokasi bawaan laporan hasil batch (satu subfolder per file CSV)
+REPORTS_DIR = Path(__file__).resolve().parent.parent / "reports"
+
+MANIFEST_NAME = "manifest.json"
+
+
+# Tulis hasil analisis ke folder laporan:
+#   manifest.json  : sidik jari data, statistik uji dan daftar artefak
+#   tables/*.csv   : tabel hasil analisis
+#   charts/*.png   : grafik laporan
+def write_report(directory, manifest, results, images):
+    directory = Path(directory)
+    (directory / "tables").mkdir(parents=True, exist_ok=True)
+    (directory / "charts").mkdir(parents=True, exist_ok=True)
+
+    tables = {}
+    for name, table in results["tables"].items():
+        table.to_csv(directory / "tables" / f"{name}.csv")
+        tables[name] = "series" if isinstance(table, pd.Series) else "frame"
+
+    for name, image in images.items():
+        (directory / "charts" / f"{name}.png").write_bytes(image)
+
+    manifest = dict(manifest, stats=results["stats"], tables=tables, charts=sorted(images))
+    # Manifest ditulis terakhir sehingga folder tanpa manifest dianggap belum selesai
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    return directory / MANIFEST_NAME
+
+
+def read_manifest(directory):
+    return json.loads((Path(directory) / MANIFEST_NAME).read_text())
+
+
+# Baca kembali laporan dalam bentuk yang sama dengan hasil analytics.analyze,
+# ditambah path grafik yang sudah digambar
+def read_report(directory):
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    tables = {}
+    for name, kind in manifest["tables"].items():
+        table = pd.read_csv(directory / "tables" / f"{name}.csv", index_col=0)
+        tables[name] = table.iloc[:, 0] if kind == "series" else table
+    charts = {name: str(directory / "charts" / f"{name}.png") for name in manifest["charts"]}
+    return {"tables": tables, "stats": manifest["stats"], "charts": charts}
+
+
+# Indeks laporan yang tersedia: sidik jari data bersih -> folder laporan
+def report_index(reports_dir=REPORTS_DIR):
+    index = {}
+    for path in sorted(Path(reports_dir).glob(f"*/{MANIFEST_NAME}")):
+        manifest = json.loads(path.read_text())
+        index[manifest["clean_fingerprint"]] = str(path.parent)
+    return index
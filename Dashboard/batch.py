@@ -0,0 +1,107 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aggregates import AggregateCube
+from analytics import analyze, clean_dataset, render_report_charts
+from artifacts import REPORTS_DIR, write_report
+from fingerprint import fingerprint_file
+from ingestion import read_bike_file
+from pipeline import DEFAULT_MULTIPLIER, clean_fingerprint
+from resampling import DEFAULT_RESAMPLES
+
+
+# Daftar file CSV dari argumen (file atau folder)
+def collect_csv_files(inputs):
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.csv")))
+        else:
+            files.append(path)
+    return files
+
+
+# File dengan isi yang sama hanya diproses sekali: {sidik jari: path}, dan daftar path yang dilewati
+def unique_files(files):
+    unique, skipped = {}, []
+    for path in files:
+        fingerprint = fingerprint_file(path)
+        if fingerprint in unique:
+            skipped.append((path, unique[fingerprint]))
+        else:
+            unique[fingerprint] = path
+    return unique, skipped
+
+
+# Folder laporan: nama file ditambah awal sidik jari data bersih, sehingga file bernama sama dari folder berbeda
+# (misalnya a/day.csv dan b/day.csv) atau parameter pembersihan lain tidak menimpa laporan yang sama
+def report_directory(output_dir, path, clean_fp):
+    return Path(output_dir) / f"{Path(path).stem}-{clean_fp[:12]}"
+
+
+# Proses satu file: baca, bersihkan, analisis, gambar grafik, lalu tulis laporannya.
+# Resampling di dalam satu file berjalan berurutan karena paralelisme ada di tingkat file.
+def process_file(path, output_dir, mode="sequential", n_resamples=DEFAULT_RESAMPLES, multiplier=DEFAULT_MULTIPLIER, fingerprint=None):
+    started = time.perf_counter()
+    fingerprint = fingerprint or fingerprint_file(path)
+    df = read_bike_file(path)
+    df_clean = clean_dataset(df, mode=mode, multiplier=multiplier)
+    if df_clean.empty:
+        raise ValueError(f"{path}: data kosong setelah pembersihan outlier")
+
+    results = analyze(AggregateCube(df_clean), n_resamples=n_resamples)
+    images = render_report_charts(results)
+    clean_fp = clean_fingerprint(fingerprint, mode=mode, multiplier=multiplier)
+    manifest = {
+        "source": str(path),
+        "fingerprint": fingerprint,
+        "clean_fingerprint": clean_fp,
+        "mode": mode,
+        "multiplier": multiplier,
+        "rows": len(df),
+        "clean_rows": len(df_clean),
+    }
+    write_report(report_directory(output_dir, path, clean_fp), manifest, results, images)
+    return str(path), len(df_clean), time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat laporan analisis Bike Sharing dari file CSV tanpa Streamlit")
+    parser.add_argument("inputs", nargs="+", help="File CSV atau folder berisi file CSV")
+    parser.add_argument("-o", "--output", default=str(REPORTS_DIR), help="Folder laporan (bawaan: reports/)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="Jumlah proses paralel")
+    parser.add_argument("--mode", choices=["sequential", "simultaneous"], default="sequential", help="Mode pembersihan outlier")
+    parser.add_argument("--multiplier", type=float, default=DEFAULT_MULTIPLIER, help="Pengali IQR pembersihan outlier")
+    parser.add_argument("--resamples", type=int, default=DEFAULT_RESAMPLES, help="Jumlah resample uji permutasi/bootstrap")
+    args = parser.parse_args(argv)
+
+    files = collect_csv_files(args.inputs)
+    if not files:
+        parser.error("Tidak ada file CSV yang ditemukan")
+
+    unique, skipped = unique_files(files)
+    for path, original in skipped:
+        print(f"{path}: isi sama dengan {original}, dilewati")
+
+    failed = 0
+    workers = max(1, min(args.workers, len(unique)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(process_file, path, args.output, args.mode, args.resamples, args.multiplier, fingerprint)
+                   for fingerprint, path in unique.items()]
+        for path, future in zip(unique.values(), futures):
+            try:
+                source, clean_rows, elapsed = future.result()
+                print(f"{source}: {clean_rows} baris bersih, {elapsed:.1f} detik")
+            except Exception as error:
+                failed += 1
+                print(f"{path}: gagal ({error})", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
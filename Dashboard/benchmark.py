@@ -0,0 +1,228 @@
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import f_oneway, ttest_ind
+
+import resampling
+import synthetic
+from aggregates import AggregateCube
+from analytics import SEASONS, assess_dataset, clean_dataset, render_report_charts
+from artifacts import REPORTS_DIR
+from charts import draw_boxplot, render_chart
+from correlation import correlation_matrix
+from ingestion import read_bike_file
+from outliers import split_numeric_columns
+from profiler import profile_frame
+from segmentation import RENTAL_LABELS, segment, segment_counts
+
+
+BENCHMARK_FILE = REPORTS_DIR / "benchmark.jsonl"
+
+# Skala bawaan; 1000x (17 juta baris untuk hour.csv) butuh beberapa GB memori
+DEFAULT_SCALES = [1, 10, 100]
+
+# Resampling di benchmark memakai jumlah resample kecil agar skala besar tetap selesai
+BENCHMARK_RESAMPLES = 200
+
+# Stage dianggap regresi jika lebih lambat dari baseline melebihi rasio ini
+REGRESSION_TOLERANCE = 1.25
+
+
+# Jalankan satu stage dan ukur waktu (wall dan CPU) serta puncak memori (tracemalloc).
+# tracemalloc memperlambat eksekusi, jadi waktu diambil dari putaran tanpa tracing.
+def measure(func, repeat=1, trace_memory=True):
+    walls, cpus = [], []
+    for _ in range(repeat):
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        result = func()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, {"wall_s": min(walls), "cpu_s": min(cpus), "peak_mb": None if peak is None else peak / 2**20}
+
+
+# Stage pipeline dashboard secara berurutan; tiap stage memakai keluaran stage sebelumnya
+def run_stages(csv_path, n_resamples=BENCHMARK_RESAMPLES, repeat=1, trace_memory=True):
+    state = {}
+
+    def read_csv():
+        return read_bike_file(csv_path)
+
+    def assess():
+        return assess_dataset(state["df"])
+
+    def profile():
+        return profile_frame(state["df"])
+
+    def clean():
+        return clean_dataset(state["df"])
+
+    def cube():
+        return AggregateCube(state["clean"])
+
+    def describe():
+        cube = state["cube"]
+        return {
+            "season_stats": cube.describe("season", "cnt"),
+            "weather_stats": cube.describe("weathersit", "cnt"),
+            "correlation": cube.corr(["season", "weathersit", "cnt"]),
+            "workingday_means": cube.mean("workingday", "cnt"),
+            "season_means": cube.mean("season", "cnt"),
+            "weather_means": cube.mean("weathersit", "cnt"),
+        }
+
+    def segmentation():
+        return segment_counts(segment(state["cube"].values["cnt"], quantiles=(0.25, 0.75), labels=RENTAL_LABELS))
+
+    def scipy_tests():
+        cube = state["cube"]
+        return (ttest_ind(cube.samples("cnt", workingday=1), cube.samples("cnt", workingday=0), equal_var=False),
+                f_oneway(*[cube.samples("cnt", season=season) for season in SEASONS]),
+                resampling.normality_test(cube.values["cnt"]))
+
+    def correlation():
+        return correlation_matrix(state["clean"], "pearson"), correlation_matrix(state["clean"], "spearman")
+
+    def resampling_tests():
+        cube = state["cube"]
+        workers = resampling.resampling_workers(cube.n_rows)
+        workday, weekend = cube.samples("cnt", workingday=1), cube.samples("cnt", workingday=0)
+        return (resampling.permutation_test(workday, weekend, n_resamples=n_resamples, workers=workers),
+                resampling.bootstrap_diff_ci(workday, weekend, n_resamples=n_resamples, workers=workers),
+                resampling.permutation_anova([cube.samples("cnt", season=season) for season in SEASONS], n_resamples=n_resamples, workers=workers))
+
+    def render_boxplot():
+        binary_columns, continuous_columns = split_numeric_columns(state["clean"])
+        return render_chart(draw_boxplot, state["clean"], columns=continuous_columns, figsize=(10, 5))
+
+    def render_charts():
+        return render_report_charts({"tables": dict(state["tables"], segment_counts=state["segments"])})
+
+    stages = [
+        ("read_csv", read_csv, "df"),
+        ("assess", assess, None),
+        ("profile", profile, None),
+        ("clean", clean, "clean"),
+        ("cube", cube, "cube"),
+        ("describe", describe, "tables"),
+        ("segment", segmentation, "segments"),
+        ("scipy_tests", scipy_tests, None),
+        ("correlation", correlation, None),
+        ("resampling", resampling_tests, None),
+        ("render_boxplot", render_boxplot, None),
+        ("render_charts", render_charts, None),
+    ]
+    for name, func, key in stages:
+        result, metrics = measure(func, repeat=repeat, trace_memory=trace_memory)
+        if key is not None:
+            state[key] = result
+        yield name, metrics
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Baca hasil benchmark; untuk tiap (dataset, skala, stage) ambil catatan terakhir
+def load_results(path):
+    latest = {}
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                latest[(record["dataset"], record["scale"], record["stage"])] = record
+    return latest
+
+
+# Bandingkan catatan baru dengan baseline; kembalikan daftar stage yang melambat
+def compare(records, baseline, tolerance=REGRESSION_TOLERANCE):
+    regressions = []
+    for record in records:
+        previous = baseline.get((record["dataset"], record["scale"], record["stage"]))
+        if previous is None or previous["wall_s"] <= 0:
+            continue
+        ratio = record["wall_s"] / previous["wall_s"]
+        flag = "  REGRESI" if ratio > tolerance else ""
+        print(f"{record['dataset']:>5} x{record['scale']:<5} {record['stage']:<15} "
+              f"{previous['wall_s']:8.3f}s -> {record['wall_s']:8.3f}s ({ratio:5.2f}x){flag}")
+        if flag:
+            regressions.append(record)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tiap stage pipeline dashboard pada data sintetis berskala")
+    parser.add_argument("--datasets", nargs="+", choices=list(synthetic.SOURCES), default=list(synthetic.SOURCES))
+    parser.add_argument("--scales", nargs="+", type=int, default=DEFAULT_SCALES, help="Faktor skala data (misalnya 1 10 100 1000)")
+    parser.add_argument("--repeat", type=int, default=1, help="Jumlah pengulangan per stage (waktu terbaik yang dicatat)")
+    parser.add_argument("--resamples", type=int, default=BENCHMARK_RESAMPLES, help="Jumlah resample untuk stage resampling")
+    parser.add_argument("--no-memory", action="store_true", help="Lewati pengukuran memori dengan tracemalloc")
+    parser.add_argument("-o", "--output", default=str(BENCHMARK_FILE), help="File JSON lines untuk menyimpan hasil")
+    parser.add_argument("--baseline", help="File hasil sebelumnya untuk mendeteksi regresi")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="Rasio perlambatan yang dianggap regresi")
+    args = parser.parse_args(argv)
+
+    # Baseline dibaca sebelum hasil baru ditambahkan (baseline boleh file yang sama dengan output)
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    run = {
+        "run": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    records = []
+    with tempfile.TemporaryDirectory() as tmp, open(output, "a") as log:
+        for dataset in args.datasets:
+            for scale in args.scales:
+                csv_path = Path(tmp) / f"{dataset}_x{scale}.csv"
+                df = synthetic.generate(dataset, scale)
+                rows = len(df)
+                synthetic.write_csv(df, csv_path)
+                del df
+                size_mb = csv_path.stat().st_size / 2**20
+                for stage, metrics in run_stages(csv_path, args.resamples, args.repeat, not args.no_memory):
+                    record = dict(run, dataset=dataset, scale=scale, rows=rows, csv_mb=round(size_mb, 2), stage=stage, **metrics)
+                    records.append(record)
+                    log.write(json.dumps(record) + "\n")
+                    log.flush()
+                    peak = "" if metrics["peak_mb"] is None else f", puncak {metrics['peak_mb']:.1f} MB"
+                    print(f"{dataset} x{scale} {stage}: {metrics['wall_s']:.3f}s (CPU {metrics['cpu_s']:.3f}s{peak})")
+                csv_path.unlink()
+
+    if baseline is not None:
+        return 1 if compare(records, baseline, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import io
+
+import seaborn as sns
+from matplotlib.figure import Figure
+
+
+# Warna dasar dan highlight yang dipakai di semua grafik
+BASE_COLOR = "#A6D785"  # Light green
+HIGHLIGHT_COLOR = "#228B22"  # Dark green
+
+# Resolusi gambar grafik (titik per inci)
+CHART_DPI = 200
+
+SEASON_LABELS = {1: "Winter", 2: "Spring", 3: "Summer", 4: "Fall"}
+WEATHER_LABELS = {1: "Clear", 2: "Mist", 3: "Light Rain/Snow", 4: "Heavy Rain/Snow"}
+
+
+# Gambar grafik ke bytes PNG/SVG lalu selalu lepaskan figure-nya.
+# Figure dibuat tanpa pyplot sehingga tidak tersimpan di state global matplotlib.
+def render_chart(draw, *args, figsize=(8, 5), image_format="png", **kwargs):
+    fig = Figure(figsize=figsize)
+    try:
+        ax = fig.subplots()
+        draw(ax, *args, **kwargs)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=image_format, dpi=CHART_DPI, bbox_inches="tight")
+        return buffer.getvalue()
+    finally:
+        fig.clear()
+
+
+# Tambahkan angka di atas setiap batang
+def annotate_bars(ax, fmt="{:.0f}", **kwargs):
+    for p in ax.patches:
+        ax.annotate(fmt.format(p.get_height()),
+                    (p.get_x() + p.get_width() / 2., p.get_height()),
+                    ha='center', va='bottom', fontsize=12, fontweight='bold', **kwargs)
+
+
+# Warna highlight untuk batang dengan nilai tertinggi
+def highlight_palette(values):
+    return [HIGHLIGHT_COLOR if value == values.max() else BASE_COLOR for value in values]
+
+
+def draw_boxplot(ax, df, columns):
+    sns.boxplot(data=df[columns], ax=ax)
+    ax.tick_params(axis="x", labelrotation=40)
+
+
+def draw_correlation_heatmap(ax, correlation, **heatmap_kwargs):
+    sns.heatmap(correlation, annot=True, cmap="coolwarm", ax=ax, **heatmap_kwargs)
+
+
+# Heatmap korelasi dengan tanda * pada pasangan yang signifikan (p-value < alpha)
+def draw_correlation_significance(ax, correlation, pvalues, alpha=0.05):
+    labels = correlation.map("{:.2f}".format) + pvalues.map(lambda p: "*" if p < alpha else "")
+    sns.heatmap(correlation, annot=labels, fmt="", cmap="coolwarm", vmin=-1, vmax=1, ax=ax, annot_kws={"size": 7})
+
+
+def draw_workingday_bar(ax, workingday_means):
+    sns.barplot(
+        x=workingday_means.index,
+        y=workingday_means.values,
+        ci=None,
+        palette=[BASE_COLOR, HIGHLIGHT_COLOR],
+        ax=ax
+    )
+
+    ax.set_title("Perbandingan Penyewaan Sepeda: Hari Kerja vs Akhir Pekan", fontsize=12)
+    ax.set_ylabel("Rata-rata Penyewaan Sepeda", fontsize=12)
+    ax.set_xlabel("Jenis Hari", fontsize=12)
+    ax.set_xticks([0, 1])
+    ax.set_xticklabels(["Akhir Pekan/Libur", "Hari Kerja"], fontsize=11)
+    annotate_bars(ax, color='black')
+
+
+def draw_season_means_bar(ax, season_means):
+    season_means = season_means.rename(index=SEASON_LABELS)
+    sns.barplot(x=season_means.index, y=season_means.values, palette=highlight_palette(season_means), ci=None, ax=ax)
+    annotate_bars(ax)
+
+    ax.set_title("Rata-rata Penyewaan Sepeda Berdasarkan Musim", fontsize=14)
+    ax.set_xlabel("Musim", fontsize=12)
+    ax.set_ylabel("Rata-rata Jumlah Penyewaan Sepeda", fontsize=12)
+    ax.set_ylim(0, season_means.max() * 1.1)
+
+
+def draw_weather_means_bar(ax, weather_means):
+    sns.barplot(x=[WEATHER_LABELS[w] for w in weather_means.index], y=weather_means.values, palette=highlight_palette(weather_means), ci=None, ax=ax)
+    annotate_bars(ax)
+
+    ax.set_title("Rata-rata Penyewaan Sepeda Berdasarkan Kondisi Cuaca", fontsize=14)
+    ax.set_xlabel("Kondisi Cuaca", fontsize=12)
+    ax.set_ylabel("Rata-rata Jumlah Penyewaan Sepeda", fontsize=12)
+    ax.set_ylim(0, weather_means.max() * 1.1)
+
+
+def draw_category_counts_bar(ax, category_counts):
+    sns.barplot(x=category_counts.index, y=category_counts.values, palette=highlight_palette(category_counts), ax=ax)
+    annotate_bars(ax, fmt="{:.0f}", color="black")
+
+    ax.set_title("Distribusi Kategori Penyewaan Sepeda", fontsize=12)
+    ax.set_xlabel("Kategori Rental", fontsize=12)
+    ax.set_ylabel("Jumlah Hari", fontsize=12)
+    ax.tick_params(labelsize=11)
+    sns.despine(ax=ax)
+
+
+def draw_seasonal_trend_line(ax, seasonal_trend):
+    sns.lineplot(
+        x=seasonal_trend.index,
+        y=seasonal_trend.values,
+        marker="o",
+        color=HIGHLIGHT_COLOR,
+        linewidth=2.5,
+        ax=ax
+    )
+
+    # Tambahkan angka di setiap titik
+    for x, y in zip(seasonal_trend.index, seasonal_trend.values):
+        ax.annotate(f"{int(y)}", (x, y), textcoords="offset points", xytext=(0, 8), ha='center', fontsize=11, fontweight='bold', color="black")
+
+    # Atur sumbu Y agar mulai dari 0
+    ax.set_ylim(0, seasonal_trend.max() + 500)
+
+    ax.set_title("Rata-rata Penyewaan Sepeda Berdasarkan Musim", fontsize=12)
+    ax.set_ylabel("Rata-rata Penyewaan", fontsize=12)
+    ax.set_xlabel("Musim", fontsize=12)
+    ax.set_xticks([1, 2, 3, 4], labels=["Winter", "Spring", "Summer", "Fall"], fontsize=11)
+    ax.tick_params(axis="y", labelsize=11)
+    sns.despine(ax=ax)
+
+
+def draw_category_means_bar(ax, means, title, xlabel, xticklabels):
+    sns.barplot(
+        x=means.index,
+        y=means.values,
+        ax=ax,
+        palette=[BASE_COLOR if i != means.idxmax() else HIGHLIGHT_COLOR for i in means.index]
+    )
+    annotate_bars(ax, color='black')
+
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel("Rata-rata Penyewaan", fontsize=12)
+    ax.set_xticklabels(xticklabels, fontsize=11)
+
+
+def draw_time_series_line(ax, series, smoothed=None, title="", ylabel="Jumlah Penyewaan"):
+    ax.plot(series.index, series.values, color=BASE_COLOR, linewidth=1, label="Aktual")
+    if smoothed is not None:
+        ax.plot(smoothed.index, smoothed.values, color=HIGHLIGHT_COLOR, linewidth=2.5, label="Rata-rata")
+        ax.legend(fontsize=10)
+
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel("Waktu", fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_ylim(bottom=0)
+    sns.despine(ax=ax)
+
+
+# Deret per jam dengan baseline musiman; jam anomali ditandai titik (merah = lonjakan, biru = penurunan)
+def draw_anomaly_line(ax, series, baseline, spikes, dips, title="", ylabel="Jumlah Penyewaan"):
+    ax.plot(series.index, series.values, color=BASE_COLOR, linewidth=1, label="Aktual")
+    ax.plot(baseline.index, baseline.values, color=HIGHLIGHT_COLOR, linewidth=1, linestyle="--", label="Baseline musiman")
+    ax.scatter(spikes.index, spikes.values, color="crimson", s=18, zorder=3, label="Lonjakan")
+    ax.scatter(dips.index, dips.values, color="royalblue", s=18, zorder=3, label="Penurunan")
+    ax.legend(fontsize=9)
+
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel("Waktu", fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_ylim(bottom=0)
+    sns.despine(ax=ax)
+
+
+# Tingkat layanan (proporsi hari yang permintaannya terpenuhi) terhadap jumlah sepeda, dengan titik kebutuhan terpilih
+def draw_service_curve(ax, curve, fleet, service_level, title="Tingkat Layanan vs Jumlah Sepeda"):
+    ax.plot(curve.index, curve.values * 100, color=HIGHLIGHT_COLOR, linewidth=2)
+    ax.axhline(service_level * 100, color="gray", linestyle="--", linewidth=1)
+    ax.axvline(fleet, color="gray", linestyle="--", linewidth=1)
+    ax.scatter([fleet], [service_level * 100], color="crimson", s=40, zorder=3)
+    ax.annotate(f"{fleet} sepeda", (fleet, service_level * 100), textcoords="offset points", xytext=(8, -14), fontsize=10)
+
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel("Jumlah Sepeda", fontsize=12)
+    ax.set_ylabel("Hari Terpenuhi (%)", fontsize=12)
+    ax.set_ylim(0, 101)
+    sns.despine(ax=ax)
+
+
+def draw_forecast_line(ax, predicted, baseline, actual=None, title="Prediksi Penyewaan Harian"):
+    if actual is not None:
+        ax.plot(actual.index, actual.values, color="lightgray", linewidth=1, label="Aktual")
+    ax.plot(baseline.index, baseline.values, color=BASE_COLOR, linewidth=1.5, label="Prediksi (cuaca sesuai data)")
+    ax.plot(predicted.index, predicted.values, color=HIGHLIGHT_COLOR, linewidth=2, label="Prediksi skenario")
+    ax.legend(fontsize=10)
+
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel("Tanggal", fontsize=12)
+    ax.set_ylabel("Jumlah Penyewaan", fontsize=12)
+    ax.set_ylim(bottom=0)
+    sns.despine(ax=ax)
+
+
+def draw_hour_weekday_heatmap(ax, profile):
+    sns.heatmap(profile, cmap="Greens", ax=ax, cbar_kws={"label": "Rata-rata Penyewaan"})
+    ax.set_title("Rata-rata Penyewaan per Jam dan Hari", fontsize=12)
+    ax.set_xlabel("Hari", fontsize=12)
+    ax.set_ylabel("Jam", fontsize=12)
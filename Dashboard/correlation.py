@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from scipy import special
+
+from ingestion import CHUNK_SIZE
+
+
+# Metode korelasi yang didukung
+METHODS = ["pearson", "spearman"]
+
+
+# Semua kolom angka (termasuk dimensi seperti season dan hr) dikorelasikan
+def numeric_columns(df):
+    return list(df.select_dtypes(include="number").columns)
+
+
+# Statistik cukup untuk korelasi Pearson antar k kolom: n, Σ(x - c) dan Σ(x - c)(x - c)ᵀ.
+# Pergeseran c (rata-rata baris pertama yang diterima) menjaga presisi float pada nilai besar.
+# Baris dengan NaN di salah satu kolom dilewati, sehingga semua pasangan memakai baris yang sama.
+# Statistik bisa ditambah per potongan, dikurangi (bobot -1) dan digabung, sehingga korelasi
+# diperbarui dari baris baru saja tanpa membaca ulang data lama.
+class CorrelationStats:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n = 0.0
+        self.shift = None
+        self.sums = np.zeros(len(self.columns))
+        self.cross = np.zeros((len(self.columns), len(self.columns)))
+
+    @classmethod
+    def from_frame(cls, df, columns=None, chunksize=CHUNK_SIZE, progress=None):
+        stats = cls(columns or numeric_columns(df))
+        starts = range(0, len(df), chunksize)
+        for done, start in enumerate(starts):
+            if progress is not None:
+                progress(done, len(starts), f"Baris {start:,} dari {len(df):,}")
+            stats.update(df.iloc[start:start + chunksize])
+        return stats
+
+    # Bobot 1 menambah baris, -1 mengurangi baris yang sebelumnya ditambahkan
+    def update(self, df, weights=None):
+        self.update_array(df[self.columns].to_numpy(dtype="float64", na_value=np.nan), weights)
+
+    def update_array(self, values, weights=None):
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype="float64")
+        valid = ~np.isnan(values).any(axis=1)
+        values, weights = values[valid], weights[valid]
+        if len(values) == 0:
+            return
+        if self.shift is None:
+            self.shift = values.mean(axis=0)
+        centered = values - self.shift
+        self.n += weights.sum()
+        self.sums += weights @ centered
+        self.cross += (centered * weights[:, None]).T @ centered
+
+    # Gabungkan statistik lain (kolom sama) ke statistik ini
+    def merge(self, other):
+        if other.columns != self.columns:
+            raise ValueError("Kolom statistik korelasi berbeda")
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        # x - c = (x - c_lain) + d
+        d = other.shift - self.shift
+        self.sums += other.sums + other.n * d
+        self.cross += other.cross + np.outer(other.sums, d) + np.outer(d, other.sums) + other.n * np.outer(d, d)
+        self.n += other.n
+        return self
+
+    def covariance(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.cross - np.outer(self.sums, self.sums) / self.n) / (self.n - 1)
+
+    def pearson(self):
+        covariance = self.covariance()
+        scale = np.sqrt(np.clip(np.diag(covariance), 0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix = np.clip(covariance / np.outer(scale, scale), -1, 1)
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    # Matriks korelasi, p-value dua sisi dan jumlah baris yang dipakai
+    def result(self):
+        r = self.pearson()
+        return {"r": r, "p": pd.DataFrame(correlation_pvalues(r.to_numpy(), self.n), index=r.index, columns=r.columns),
+                "n": int(round(self.n))}
+
+
+# p-value dua sisi uji korelasi nol dengan statistik t = r √((n - 2) / (1 - r²)) berderajat bebas n - 2
+# (sama dengan scipy.stats.pearsonr, dan pendekatan yang dipakai scipy.stats.spearmanr)
+def correlation_pvalues(r, n):
+    dof = n - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt(dof / ((1 - r) * (1 + r)))
+        p = 2 * special.stdtr(dof, -np.abs(t))
+    return np.where(np.abs(r) >= 1, 0.0, p)
+
+
+# Statistik korelasi Spearman: Pearson atas peringkat rata-rata (ties) tiap kolom.
+# Tiap kolom disimpan sebagai kode nilai unik (tipe integer sekecil mungkin) dan tabel peringkat per nilai,
+# lalu matriks peringkat dibentuk per potongan baris sehingga memori tambahan tetap kecil.
+def spearman_stats(df, columns=None, chunksize=CHUNK_SIZE, progress=None):
+    columns = columns or numeric_columns(df)
+    valid = df[columns].notna().all(axis=1).to_numpy()
+    codes, ranks = [], []
+    for done, col in enumerate(columns):
+        if progress is not None:
+            progress(done, len(columns) + 1, f"Peringkat {col}")
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)[valid]
+        unique, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+        # Peringkat rata-rata nilai dengan c kemunculan = jumlah nilai lebih kecil + (c + 1) / 2
+        ranks.append(np.cumsum(counts) - (counts - 1) / 2.0)
+        codes.append(inverse.astype(np.min_scalar_type(max(len(unique) - 1, 0))))
+
+    if progress is not None:
+        progress(len(columns), len(columns) + 1, "Korelasi peringkat")
+    stats = CorrelationStats(columns)
+    for start in range(0, int(valid.sum()), chunksize):
+        stats.update_array(np.column_stack([rank[code[start:start + chunksize]] for rank, code in zip(ranks, codes)]))
+    return stats
+
+
+# Korelasi semua kolom numerik dengan p-value: {"r": DataFrame, "p": DataFrame, "n": jumlah baris}
+def correlation_matrix(df, method="pearson", columns=None, progress=None):
+    if method == "pearson":
+        return CorrelationStats.from_frame(df, columns, progress=progress).result()
+    if method == "spearman":
+        return spearman_stats(df, columns, progress=progress).result()
+    raise ValueError(f"Metode korelasi tidak dikenal: {method} (pilihan: {METHODS})")
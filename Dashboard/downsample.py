@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+
+# Jumlah titik per level piramida dibagi dua dari level sebelumnya (bucket 4 titik -> min + max)
+PYRAMID_BUCKET = 4
+
+# Level piramida berhenti dibuat jika jumlah titiknya sudah sekecil ini
+PYRAMID_MIN_POINTS = 1000
+
+DOWNSAMPLE_METHODS = ["minmax", "lttb"]
+
+
+# Batas bucket berukuran (hampir) sama untuk n titik dibagi ke n_buckets bucket
+def _bucket_edges(n, n_buckets):
+    return np.linspace(0, n, n_buckets + 1).astype(np.int64)
+
+
+# Min/max bucketing: tiap bucket diwakili titik minimum dan maksimumnya (urut waktu),
+# sehingga puncak dan lembah tetap terlihat. Hasil berisi paling banyak n_out titik.
+def minmax(series, n_out):
+    n = len(series)
+    n_buckets = max(1, n_out // 2)
+    if n <= n_out or n_buckets >= n:
+        return series
+
+    values = series.to_numpy()
+    edges = _bucket_edges(n, n_buckets)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Urutkan per bucket lalu per nilai: elemen pertama tiap bucket = min, terakhir = max
+    order = np.lexsort((values, bucket))
+    first = order[edges[:-1]]
+    last = order[edges[1:] - 1]
+    keep = np.unique(np.concatenate([first, last]))
+    return series.iloc[keep]
+
+
+# Largest-Triangle-Three-Buckets: pilih satu titik per bucket yang membentuk segitiga terbesar
+# dengan titik terpilih sebelumnya dan rata-rata bucket berikutnya. Titik pertama dan terakhir selalu ikut.
+def lttb(series, n_out):
+    n = len(series)
+    if n <= n_out or n_out < 3:
+        return series
+
+    x = series.index.asi8.astype("float64") if isinstance(series.index, pd.DatetimeIndex) else np.arange(n, dtype="float64")
+    y = series.to_numpy().astype("float64")
+    # Titik 1..n-2 dibagi ke n_out-2 bucket; "bucket" sesudah bucket terakhir adalah titik terakhir
+    edges = np.concatenate([_bucket_edges(n - 2, n_out - 2) + 1, [n]])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_start, next_stop = edges[i + 1], edges[i + 2]
+        next_x, next_y = x[next_start:next_stop].mean(), y[next_start:next_stop].mean()
+        area = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return series.iloc[selected]
+
+
+def downsample(series, n_out, method="minmax"):
+    if method == "minmax":
+        return minmax(series, n_out)
+    if method == "lttb":
+        return lttb(series, n_out)
+    raise ValueError(f"Metode downsampling tidak dikenal: {method}")
+
+
+# Jumlah titik yang masih bisa dibedakan pada gambar: satu titik per kolom piksel
+def pixel_points(figsize, dpi):
+    return int(figsize[0] * dpi)
+
+
+# Piramida multi-resolusi: level 0 adalah deret asli, tiap level berikutnya hasil min/max
+# bucketing dari level sebelumnya. Zoom ke rentang sempit memakai level yang lebih detail.
+class SeriesPyramid:
+    def __init__(self, series, bucket=PYRAMID_BUCKET, min_points=PYRAMID_MIN_POINTS):
+        series = series.dropna()
+        self.levels = [series]
+        while len(self.levels[-1]) > min_points:
+            coarser = minmax(self.levels[-1], 2 * len(self.levels[-1]) // bucket)
+            if len(coarser) >= len(self.levels[-1]):
+                break
+            self.levels.append(coarser)
+
+    # Potongan [start, end] dari level paling detail yang jumlah titiknya masih dekat target,
+    # lalu dirapikan ke paling banyak max_points titik
+    def window(self, start, end, max_points, method="minmax"):
+        for level in self.levels:
+            part = level.loc[start:end]
+            if len(part) <= 2 * max_points:
+                break
+        return downsample(part, max_points, method)
@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# Jumlah analisis latar belakang yang berjalan bersamaan untuk seluruh proses
+DEFAULT_JOB_WORKERS = min(4, os.cpu_count() or 1)
+
+# Jumlah proses maksimal per analisis yang dijalankan dari dashboard; beberapa job bisa berjalan bersamaan,
+# sehingga satu simulasi tidak boleh memakai semua CPU server
+DEFAULT_PROCESS_WORKERS = int(os.environ.get("DASHBOARD_PROCESS_WORKERS", min(4, os.cpu_count() or 1)))
+
+# Job yang sudah selesai disimpan sebentar agar sesi lain dengan kunci yang sama bisa mengambil hasilnya
+DEFAULT_KEEP_SECONDS = 120
+
+
+# Pool proses untuk kernel CPU berat (resampling, simulasi). Proses anak dibuat dengan "spawn", bukan fork:
+# kernel ini dipanggil dari thread job di server Streamlit yang multithread, dan proses hasil fork hanya
+# menyalin thread pemanggil sehingga lock yang sedang dipegang thread lain tetap terkunci selamanya (deadlock).
+def process_pool(max_workers):
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+# Dilempar oleh Job.report saat job dibatalkan; fungsi job berhenti di titik laporan progres berikutnya
+class JobCancelled(Exception):
+    pass
+
+
+# Satu analisis di thread latar belakang. Fungsi job menerima `progress(done, total, message)`
+# dan memanggilnya di antara langkah; pembatalan bersifat kooperatif lewat panggilan ini.
+class Job:
+    def __init__(self, key):
+        self.key = key
+        self.owners = set()
+        self.progress = 0.0
+        self.message = ""
+        self.started = time.monotonic()
+        self.finished = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    def report(self, done, total, message=""):
+        if self._cancel.is_set():
+            raise JobCancelled(self.key)
+        self.progress = done / total if total else 0.0
+        self.message = message
+
+    def cancel(self):
+        self._cancel.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    def wait(self, timeout=None):
+        try:
+            self.future.exception(timeout=timeout)
+        except (TimeoutError, CancelledError):
+            pass
+        return self.done()
+
+    # Hasil job; exception dari fungsi job dilempar ulang
+    def result(self):
+        return self.future.result()
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def status(self):
+        if not self.future.done():
+            return "cancelling" if self.cancelled else "running"
+        if self.future.cancelled() or isinstance(self.future.exception(), JobCancelled):
+            return "cancelled"
+        return "failed" if self.future.exception() is not None else "done"
+
+
+# Pool thread bersama untuk analisis berat, dengan kunci job sebagai identitas pekerjaan:
+#   - job dengan kunci yang sama (misalnya sidik jari data + parameter) hanya dijalankan sekali,
+#     berapa pun sesi atau rerun yang memintanya
+#   - tiap sesi tercatat sebagai pemilik; job yang tidak lagi dimiliki sesi mana pun dibatalkan
+#   - job selesai dibuang setelah keep_seconds (hasil jangka panjang disimpan oleh cache pemanggil)
+class JobExecutor:
+    def __init__(self, max_workers=DEFAULT_JOB_WORKERS, keep_seconds=DEFAULT_KEEP_SECONDS):
+        self.keep_seconds = keep_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    # Jalankan `task(progress)` di latar belakang, atau pakai job berjalan/selesai dengan kunci yang sama
+    def submit(self, key, task, owner=None):
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(key)
+            if job is None or job.cancelled or job.status == "failed":
+                job = Job(key)
+                job.future = self._pool.submit(self._run, job, task)
+                self._jobs[key] = job
+            if owner is not None:
+                job.owners.add(owner)
+            return job
+
+    @staticmethod
+    def _run(job, task):
+        try:
+            result = task(job.report)
+            job.progress = 1.0
+            return result
+        finally:
+            job.finished = time.monotonic()
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    # Batalkan job untuk semua pemiliknya
+    def cancel(self, key):
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None and not job.done():
+            job.cancel()
+
+    # Lepas kepemilikan sesi atas semua job kecuali `keep`; job berjalan tanpa pemilik dibatalkan
+    def release(self, owner, keep=()):
+        with self._lock:
+            orphaned = []
+            for key, job in list(self._jobs.items()):
+                if owner not in job.owners or key in keep:
+                    continue
+                job.owners.discard(owner)
+                if not job.owners and not job.done():
+                    orphaned.append(self._jobs.pop(key))
+        for job in orphaned:
+            job.cancel()
+
+    def _prune(self):
+        now = time.monotonic()
+        for key, job in list(self._jobs.items()):
+            if job.done() and now - (job.finished or job.started) > self.keep_seconds:
+                del self._jobs[key]
+
+    # Ringkasan job untuk panel diagnostik (pandas diimpor di sini, executor sendiri tidak membutuhkannya)
+    def stats(self):
+        import pandas as pd
+
+        with self._lock:
+            rows = [{"key": str(key)[:40], "status": job.status, "progress": job.progress,
+                     "owners": len(job.owners), "elapsed_s": job.elapsed}
+                    for key, job in self._jobs.items()]
+        return pd.DataFrame(rows, columns=["key", "status", "progress", "owners", "elapsed_s"])
@@ -0,0 +1,23 @@
+import hashlib
+
+
+# Sidik jari (fingerprint) isi data, dipakai sebagai kunci cache
+def fingerprint_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Sidik jari turunan: gabungan sidik jari induk dan parameter tahap
+def derive_fingerprint(parent, *params):
+    digest = hashlib.sha256(parent.encode())
+    for param in params:
+        digest.update(repr(param).encode())
+    return digest.hexdigest()
+
+
+# Sidik jari file dibaca per blok agar file besar tidak dimuat utuh ke memori
+def fingerprint_file(path, block_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+from scipy import linalg
+
+
+# Fitur cuaca (sudah dinormalisasi di dataset) dan fitur kategori beserta levelnya
+NUMERIC_FEATURES = ["temp", "atemp", "hum", "windspeed"]
+CATEGORY_LEVELS = {
+    "season": [1, 2, 3, 4],
+    "weathersit": [1, 2, 3, 4],
+    "workingday": [0, 1],
+    "hr": list(range(24)),
+}
+TARGET = "cnt"
+
+# Kolom yang dibaca untuk melatih model (dteday dan yr untuk memilih tahun skenario)
+FORECAST_COLUMNS = ["dteday", "yr", *NUMERIC_FEATURES, *CATEGORY_LEVELS, TARGET]
+
+# Kolom minimum: tanpa hr (day.csv) model memakai fitur harian (lihat FeatureSpec)
+REQUIRED_COLUMNS = [col for col in FORECAST_COLUMNS if col != "hr"]
+
+# Pembagi normalisasi kolom cuaca pada Bike Sharing Dataset (temp = (t + 8) / 47, atemp = (t + 16) / 66, ...)
+WEATHER_SCALES = {"temp": 47.0, "atemp": 66.0, "hum": 100.0, "windspeed": 67.0}
+
+DEFAULT_ALPHA = 1.0
+HOLDOUT_FRACTION = 0.2
+
+
+# Susunan kolom matriks fitur:
+#   intercept | cuaca | kuadrat temp & hum | tren tahun (yr) | one-hot season | one-hot weathersit | one-hot (hr x workingday)
+# Tanpa kolom hr (day.csv) blok terakhir menjadi one-hot workingday saja; tanpa yr kolom tren bernilai 0.
+class FeatureSpec:
+    def __init__(self, columns):
+        missing = [col for col in NUMERIC_FEATURES + ["season", "weathersit", "workingday", TARGET] if col not in columns]
+        if missing:
+            raise ValueError(f"Kolom fitur tidak ditemukan: {missing}")
+        self.hourly = "hr" in columns
+        self.names = ["intercept", *NUMERIC_FEATURES, "temp^2", "hum^2", "yr"]
+        self.offsets = {}
+        for col in ["season", "weathersit"]:
+            self.offsets[col] = len(self.names)
+            self.names += [f"{col}={level}" for level in CATEGORY_LEVELS[col]]
+        self.offsets["calendar"] = len(self.names)
+        if self.hourly:
+            self.names += [f"hr={hr},workingday={day}" for day in CATEGORY_LEVELS["workingday"] for hr in CATEGORY_LEVELS["hr"]]
+        else:
+            self.names += [f"workingday={day}" for day in CATEGORY_LEVELS["workingday"]]
+
+    @property
+    def n_features(self):
+        return len(self.names)
+
+    # Posisi level kategori (level tidak dikenal -> -1, baris tersebut tidak mendapat kolom one-hot)
+    @staticmethod
+    def _codes(values, levels):
+        levels = np.asarray(levels)
+        codes = np.clip(np.searchsorted(levels, values), 0, len(levels) - 1)
+        return np.where(levels[codes] == values, codes, -1)
+
+    def _one_hot(self, X, offset, codes):
+        rows = np.flatnonzero(codes >= 0)
+        X[rows, offset + codes[rows]] = 1.0
+
+    def matrix(self, df):
+        n = len(df)
+        X = np.zeros((n, self.n_features))
+        X[:, 0] = 1.0
+        for i, col in enumerate(NUMERIC_FEATURES, start=1):
+            X[:, i] = df[col].to_numpy()
+        self.set_squares(X)
+        if "yr" in df.columns:
+            X[:, 7] = df["yr"].to_numpy()
+        for col in ["season", "weathersit"]:
+            self._one_hot(X, self.offsets[col], self._codes(df[col].to_numpy(), CATEGORY_LEVELS[col]))
+        workingday = self._codes(df["workingday"].to_numpy(), CATEGORY_LEVELS["workingday"])
+        if self.hourly:
+            hours = self._codes(df["hr"].to_numpy(), CATEGORY_LEVELS["hr"])
+            codes = np.where((hours >= 0) & (workingday >= 0), workingday * 24 + hours, -1)
+        else:
+            codes = workingday
+        self._one_hot(X, self.offsets["calendar"], codes)
+        return X
+
+    # Kolom kuadrat dihitung ulang dari kolom cuaca (dipakai juga saat skenario mengubah cuaca)
+    def set_squares(self, X):
+        X[:, 5] = X[:, 1] ** 2
+        X[:, 6] = X[:, 3] ** 2
+
+    def column(self, name):
+        return self.names.index(name)
+
+
+# Regresi ridge pada log(1 + cnt) dengan persamaan normal. Koefisien diselesaikan dari XᵀX dan Xᵀy, sehingga:
+#   - partial_fit menambah baris baru tanpa menghitung ulang XᵀX data lama (warm start)
+#   - with_alpha mengganti regularisasi tanpa menyusun ulang matriks fitur
+# Prediksi dikembalikan ke skala jumlah penyewaan dengan koreksi smearing Duan (rata-rata exp(residual)).
+# Residual bergantung pada koefisien, jadi matriks fitur dan target pelatihan disimpan (`_rows`) dan smearing
+# dihitung ulang dengan satu perkalian matriks-vektor setiap kali koefisien berubah.
+class RidgeForecaster:
+    def __init__(self, spec, alpha=DEFAULT_ALPHA):
+        self.spec = spec
+        self.alpha = alpha
+        self.gram = np.zeros((spec.n_features, spec.n_features))
+        self.moment = np.zeros(spec.n_features)
+        self.n_rows = 0
+        self.coef = None
+        self.smearing = 1.0
+        self._rows = []
+
+    def partial_fit(self, X, y):
+        z = np.log1p(np.asarray(y, dtype="float64"))
+        self.gram += X.T @ X
+        self.moment += X.T @ z
+        self.n_rows += len(z)
+        if len(z):
+            self._rows.append((X, z))
+        self._solve()
+        return self
+
+    def _solve(self):
+        # Intercept tidak diregularisasi; kolom one-hot yang tidak pernah muncul tetap bernilai 0
+        penalty = np.full(self.spec.n_features, self.alpha)
+        penalty[0] = 0.0
+        self.coef = linalg.solve(self.gram + np.diag(penalty), self.moment, assume_a="pos")
+        if self.n_rows:
+            self.smearing = sum(np.exp(z - X @ self.coef).sum() for X, z in self._rows) / self.n_rows
+
+    # Data pelatihan dipakai bersama (tidak disalin); model baru hanya berbeda koefisien dan smearing-nya
+    def with_alpha(self, alpha):
+        model = RidgeForecaster(self.spec, alpha)
+        model.gram, model.moment, model.n_rows = self.gram.copy(), self.moment.copy(), self.n_rows
+        model._rows = list(self._rows)
+        model._solve()
+        return model
+
+    def predict(self, X):
+        return np.clip(np.expm1(X @ self.coef) * self.smearing, 0, None)
+
+
+def evaluate(model, X, y):
+    y = np.asarray(y, dtype="float64")
+    residual = y - model.predict(X)
+    return {
+        "r2": float(1 - (residual ** 2).sum() / ((y - y.mean()) ** 2).sum()),
+        "mae": float(np.abs(residual).mean()),
+        "rmse": float(np.sqrt((residual ** 2).mean())),
+    }
+
+
+# Urutan waktu baris (dteday lalu hr) agar holdout berisi periode paling akhir
+def _time_order(df):
+    dates = pd.to_datetime(df["dteday"].astype(str)).to_numpy() if "dteday" in df.columns else np.arange(len(df))
+    keys = (dates, df["hr"].to_numpy()) if "hr" in df.columns else (dates,)
+    return np.lexsort(keys[::-1])
+
+
+# Latih model sekali: fit pada 80% data paling awal, evaluasi pada 20% terakhir,
+# lalu tambahkan baris holdout dengan partial_fit sehingga model akhir memakai semua data
+def train(df, alpha=DEFAULT_ALPHA, holdout=HOLDOUT_FRACTION):
+    spec = FeatureSpec(df.columns)
+    order = _time_order(df)
+    X = spec.matrix(df.iloc[order])
+    y = df[TARGET].to_numpy()[order]
+    split = int(len(y) * (1 - holdout))
+
+    model = RidgeForecaster(spec, alpha).partial_fit(X[:split], y[:split])
+    metrics = evaluate(model, X[split:], y[split:]) if split < len(y) else {}
+    model.partial_fit(X[split:], y[split:])
+    return model, metrics
+
+
+# Grid skenario satu tahun (baris data tahun terakhir). Matriks fitur dibangun sekali;
+# skenario cuaca hanya mengubah beberapa kolom salinannya lalu dikalikan dengan koefisien model.
+class ScenarioGrid:
+    def __init__(self, spec, df):
+        if "yr" in df.columns:
+            df = df[df["yr"] == df["yr"].max()]
+        order = _time_order(df)
+        df = df.iloc[order]
+        self.spec = spec
+        self.base = spec.matrix(df)
+        self.actual = df[TARGET].to_numpy().astype("float64") if TARGET in df.columns else None
+        dates = pd.to_datetime(df["dteday"].astype(str)) if "dteday" in df.columns else pd.RangeIndex(len(df))
+        self.index = pd.DatetimeIndex(dates).normalize() if "dteday" in df.columns else dates
+
+    def __len__(self):
+        return len(self.base)
+
+    # temp_shift dalam °C, hum_shift dalam persen; weathersit None berarti sesuai data
+    def matrix(self, temp_shift=0.0, hum_shift=0.0, weathersit=None):
+        X = self.base.copy()
+        X[:, 1] += temp_shift / WEATHER_SCALES["temp"]
+        X[:, 2] += temp_shift / WEATHER_SCALES["atemp"]
+        X[:, 3] = np.clip(X[:, 3] + hum_shift / WEATHER_SCALES["hum"], 0, 1)
+        self.spec.set_squares(X)
+        if weathersit is not None:
+            offset = self.spec.offsets["weathersit"]
+            X[:, offset:offset + len(CATEGORY_LEVELS["weathersit"])] = 0.0
+            X[:, offset + CATEGORY_LEVELS["weathersit"].index(weathersit)] = 1.0
+        return X
+
+    def score(self, model, **scenario):
+        return model.predict(self.matrix(**scenario))
+
+    # Total harian dari prediksi per baris
+    def daily(self, values):
+        return pd.Series(values, index=self.index).groupby(level=0).sum()
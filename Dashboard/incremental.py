@@ -0,0 +1,423 @@
+import copy
+import itertools
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from aggregates import CUBE_METRICS, AggregateCube
+from correlation import CorrelationStats, numeric_columns
+from fingerprint import derive_fingerprint
+from outliers import split_numeric_columns
+
+
+# Dimensi kelompok yang dirangkum secara inkremental
+GROUP_DIMENSIONS = ["season", "weathersit", "workingday"]
+
+# Jumlah nilai unik maksimal per sketch sebelum nilai dibulatkan ke grid yang lebih kasar
+MAX_SKETCH_VALUES = 4096
+
+
+# Sketch kuantil yang bisa digabung dan dikurangi: daftar nilai unik terurut beserta jumlahnya.
+# Kuantil tepat (interpolasi linear seperti np.quantile) selama jumlah nilai unik <= max_values;
+# di atas itu nilai dibulatkan ke kelipatan `resolution`. Tiap pembulatan ulang (resolusi digandakan,
+# atau merge) bisa menggeser nilai lagi, jadi pergeseran terbesar yang terkumpul dicatat di `error`;
+# galat kuantil dan min/max <= error.
+class ValueCounts:
+    def __init__(self, values=None, max_values=MAX_SKETCH_VALUES):
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.resolution = 0.0
+        self.error = 0.0
+        self.max_values = max_values
+        if values is not None:
+            self.add(values)
+
+    def _snap(self, values):
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if self.resolution > 0:
+            values = np.round(values / self.resolution) * self.resolution
+        return values
+
+    # Nilai yang dibulatkan beserta pergeseran terbesarnya
+    def _snap_shift(self, values):
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        snapped = self._snap(values)
+        return snapped, float(np.abs(snapped - values).max()) if len(values) else 0.0
+
+    def _combine(self, values, counts):
+        unique, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+        counts = np.bincount(inverse, np.concatenate([self.counts, counts]), minlength=len(unique)).astype(np.int64)
+        keep = counts != 0
+        self.values, self.counts = unique[keep], counts[keep]
+        while len(self.values) > self.max_values:
+            self.resolution = self.resolution * 2 or (self.values[-1] - self.values[0]) / self.max_values
+            values, counts = self.values, self.counts
+            self.values, self.counts = np.empty(0), np.empty(0, dtype=np.int64)
+            values, shift = self._snap_shift(values)
+            self.error += shift
+            self._combine(values, counts)
+
+    # sign=-1 mengurangi nilai yang sebelumnya ditambahkan
+    def add(self, values, sign=1):
+        values, shift = self._snap_shift(values)
+        self.error = max(self.error, shift)
+        unique, counts = np.unique(values, return_counts=True)
+        self._combine(unique, sign * counts)
+
+    def remove(self, values):
+        self.add(values, sign=-1)
+
+    def merge(self, other):
+        merged = ValueCounts(max_values=self.max_values)
+        merged.resolution = max(self.resolution, other.resolution)
+        for sketch in (self, other):
+            values, shift = merged._snap_shift(sketch.values)
+            merged.error = max(merged.error, sketch.error + shift)
+            merged._combine(values, sketch.counts)
+        return merged
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def _value_at(self, cumulative, rank):
+        return self.values[np.searchsorted(cumulative, rank, side="right")]
+
+    def quantile(self, q):
+        q = np.asarray(q, dtype="float64")
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        cumulative = np.cumsum(self.counts)
+        position = (self.n - 1) * q
+        lower = np.floor(position)
+        low = self._value_at(cumulative, lower)
+        high = self._value_at(cumulative, np.minimum(lower + 1, self.n - 1))
+        return low + (high - low) * (position - lower)
+
+    # Jumlah nilai di [low, high] (dilebarkan sebesar galat pembulatan agar tidak ada yang terlewat)
+    def count_between(self, low, high):
+        start = np.searchsorted(self.values, low - self.error, side="left")
+        stop = np.searchsorted(self.values, high + self.error, side="right")
+        return int(self.counts[start:stop].sum())
+
+    def min(self):
+        return self.values[0] if len(self.values) else np.nan
+
+    def max(self):
+        return self.values[-1] if len(self.values) else np.nan
+
+
+# Sidik jari data bersih dataset inkremental, turunan sidik jari data mentah gabungannya
+def incremental_clean_fingerprint(fingerprint, multiplier=1.0):
+    return derive_fingerprint(fingerprint, "incremental clean", float(multiplier))
+
+
+# Kunci dataset inkremental di store bersama, diturunkan dari sidik jari data bersihnya sehingga
+# halaman analisis bisa menemukan dataset (dan cube-nya) hanya dari sidik jari data bersih sesi
+def dataset_key(clean_fingerprint):
+    return derive_fingerprint(clean_fingerprint, "incremental")
+
+
+# Dataset yang bisa ditambah baris baru tanpa menghitung ulang semuanya.
+# Pembersihan memakai mode "simultaneous" (batas IQR dari seluruh data mentah, lihat outliers.inlier_mask):
+#   - sketch kuantil per kolom kontinu (data mentah) -> batas IQR terbaru
+#   - count, Σx, Σx², Σxy dan sketch kuantil per kelompok (season, weathersit, workingday) dari baris bersih
+#   - jumlah dan hasil kali silang semua kolom numerik dari baris bersih -> matriks korelasi Pearson lengkap
+# Saat append, hanya baris baru yang dirangkum. Jika batas IQR bergeser, baris lama yang nilainya berada
+# di antara batas lama dan batas baru diperiksa ulang; langkah ini dilewati jika sketch menunjukkan
+# tidak ada nilai di rentang tersebut (kasus paling umum).
+class IncrementalDataset:
+    def __init__(self, df, multiplier=1.0, dimensions=None, metrics=None):
+        self.multiplier = multiplier
+        self.dimensions = [col for col in (dimensions or GROUP_DIMENSIONS) if col in df.columns]
+        self.metrics = [col for col in (metrics or CUBE_METRICS) if col in df.columns]
+        if not self.dimensions or not self.metrics:
+            raise ValueError("Data tidak memiliki kolom dimensi atau metrik untuk cube")
+        # Kolom kontinu ditetapkan dari data awal (potongan harian bisa saja hanya berisi satu nilai)
+        binary_columns, self.columns = split_numeric_columns(df)
+
+        self.source_columns = list(df.columns)
+        self.chunks = []
+        self.masks = []
+        self.sizes = []
+        self.sketches = {col: ValueCounts() for col in self.columns}
+        self.group_sketches = {}
+        self.cells = None
+        self.bounds = None
+        self.correlation = CorrelationStats(numeric_columns(df))
+        self.append(df)
+
+    @property
+    def n_raw(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    # Perkiraan memori potongan data dan mask-nya (dipakai SharedStore untuk budget memori)
+    @property
+    def nbytes(self):
+        return sum(self.sizes) + sum(mask.nbytes for mask in self.masks)
+
+    # Salinan untuk append berikutnya: potongan data dan mask tidak pernah diubah di tempat sehingga
+    # dipakai bersama, hanya daftar dan rangkuman kecil (sketch, statistik korelasi) yang disalin.
+    # Dataset di store bersama jadi tidak berubah saat satu sesi menambah data.
+    # Dipanggil oleh SharedStore.get seperti DataFrame.copy(deep=False).
+    def copy(self, deep=False):
+        dataset = copy.copy(self)
+        dataset.chunks = list(self.chunks)
+        dataset.masks = list(self.masks)
+        dataset.sizes = list(self.sizes)
+        dataset.sketches = {col: copy.copy(sketch) for col, sketch in self.sketches.items()}
+        dataset.group_sketches = {key: copy.copy(sketch) for key, sketch in self.group_sketches.items()}
+        dataset.correlation = copy.deepcopy(self.correlation)
+        return dataset
+
+    # Tambahkan baris baru; mengembalikan jumlah baris lama yang status outlier-nya berubah
+    def append(self, df):
+        missing = [col for col in self.source_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Kolom tidak ditemukan pada data baru: {missing}")
+        df = df[self.source_columns].reset_index(drop=True)
+
+        for col in self.columns:
+            self.sketches[col].add(df[col].to_numpy())
+        previous_bounds = self.bounds
+        self.bounds = self._bounds()
+
+        changes = []
+        if previous_bounds is not None:
+            changes = self._reclassify(previous_bounds)
+        flipped = sum(len(rows) for rows, sign in changes)
+
+        mask = self._inliers(df)
+        self.chunks.append(df)
+        self.masks.append(mask)
+        self.sizes.append(int(df.memory_usage(deep=True).sum()))
+        self._update(changes + [(df[mask], 1)])
+        self._compact()
+        return flipped
+
+    # Gabungkan potongan terakhir jika ukurannya sudah menyamai potongan sebelumnya (seperti
+    # LSM tree): jumlah potongan tetap O(log n) dan tiap baris hanya disalin O(log n) kali
+    def _compact(self):
+        while len(self.chunks) > 1 and len(self.chunks[-2]) <= len(self.chunks[-1]) * 2:
+            self.chunks[-2:] = [pd.concat(self.chunks[-2:], ignore_index=True)]
+            self.masks[-2:] = [np.concatenate(self.masks[-2:])]
+            self.sizes[-2:] = [sum(self.sizes[-2:])]
+
+    def _bounds(self):
+        bounds = {}
+        for col in self.columns:
+            q1, q3 = self.sketches[col].quantile([0.25, 0.75])
+            iqr = q3 - q1
+            bounds[col] = (q1 - self.multiplier * iqr, q3 + self.multiplier * iqr)
+        return pd.DataFrame.from_dict(bounds, orient="index", columns=["lower", "upper"])
+
+    def _inliers(self, df):
+        mask = np.ones(len(df), dtype=bool)
+        for col in self.columns:
+            values = df[col].to_numpy()
+            mask &= (values >= self.bounds.at[col, "lower"]) & (values <= self.bounds.at[col, "upper"])
+        return mask
+
+    # Rentang nilai yang status inlier-nya bisa berubah karena batas bergeser
+    def _bands(self, previous):
+        bands = {}
+        for col in self.columns:
+            ranges = []
+            for side in ("lower", "upper"):
+                old, new = previous.at[col, side], self.bounds.at[col, side]
+                if old != new:
+                    low, high = (old, new) if old < new else (new, old)
+                    if np.isnan(low) or self.sketches[col].count_between(low, high) > 0:
+                        ranges.append((low, high))
+            if ranges:
+                bands[col] = ranges
+        return bands
+
+    # Baris lama yang keluar (sign -1) atau masuk (sign 1) data bersih karena batas bergeser
+    def _reclassify(self, previous):
+        bands = self._bands(previous)
+        changes = []
+        if not bands:
+            return changes
+
+        for index, (chunk, mask) in enumerate(zip(self.chunks, self.masks)):
+            candidates = np.zeros(len(chunk), dtype=bool)
+            for col, ranges in bands.items():
+                values = chunk[col].to_numpy()
+                for low, high in ranges:
+                    candidates |= np.isnan(low) | ((values >= low) & (values <= high))
+            rows = np.flatnonzero(candidates)
+            if len(rows) == 0:
+                continue
+            status = self._inliers(chunk.iloc[rows])
+            entering = rows[status & ~mask[rows]]
+            leaving = rows[~status & mask[rows]]
+            changes += [(chunk.iloc[leaving], -1), (chunk.iloc[entering], 1)]
+            # Mask diganti, bukan diubah di tempat, karena salinan dataset lain bisa memakai array yang sama
+            mask = mask.copy()
+            mask[entering] = True
+            mask[leaving] = False
+            self.masks[index] = mask
+        return [(rows, sign) for rows, sign in changes if not rows.empty]
+
+    # Tambah (sign=1) atau kurangi (sign=-1) kontribusi baris bersih ke rangkuman kelompok;
+    # semua perubahan satu append dirangkum dengan satu groupby
+    def _update(self, changes):
+        changes = [(rows, sign) for rows, sign in changes if not rows.empty]
+        if not changes:
+            return
+        rows = pd.concat([rows for rows, sign in changes], ignore_index=True)
+        signs = np.concatenate([np.full(len(rows), float(sign)) for rows, sign in changes])
+        self.correlation.update(rows, signs)
+
+        parts = {dim: rows[dim].to_numpy() for dim in self.dimensions}
+        parts["count"] = signs
+        values = {metric: rows[metric].to_numpy().astype("float64") for metric in self.metrics}
+        for metric in self.metrics:
+            parts[f"{metric}_sum"] = signs * values[metric]
+            parts[f"{metric}_sumsq"] = signs * values[metric] * values[metric]
+        for left, right in itertools.combinations(self.metrics, 2):
+            parts[f"{left}*{right}_sum"] = signs * values[left] * values[right]
+        grouped = pd.DataFrame(parts).groupby(self.dimensions, observed=True)
+        delta = grouped.sum()
+
+        cells = delta if self.cells is None else self.cells.add(delta, fill_value=0)
+        self.cells = cells[cells["count"] > 0].sort_index()
+
+        for key, positions in grouped.indices.items():
+            key = key if isinstance(key, tuple) else (key,)
+            for metric in self.metrics:
+                sketch = self.group_sketches.setdefault((key, metric), ValueCounts())
+                for sign in (1, -1):
+                    selected = positions[signs[positions] == sign]
+                    if len(selected):
+                        sketch.add(values[metric][selected], sign)
+
+    # Baris pertama data mentah tanpa menggabungkan semua potongan
+    def head(self, n=5):
+        return self.chunks[0].head(n)
+
+    # Data mentah hasil gabungan semua potongan
+    def frame(self):
+        return pd.concat(self.chunks, ignore_index=True)
+
+    # Data bersih (setara clean_dataset(frame(), mode="simultaneous"))
+    def clean_frame(self):
+        return pd.concat([chunk[mask] for chunk, mask in zip(self.chunks, self.masks)], ignore_index=True)
+
+    def cube(self):
+        return IncrementalCube(self)
+
+
+# Antarmuka AggregateCube (mean, describe, corr, samples, values, n_rows) di atas rangkuman
+# IncrementalDataset, sehingga analytics.analyze dan uji di bawah bisa langsung memakainya
+class IncrementalCube(AggregateCube):
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.dimensions = dataset.dimensions
+        self.metrics = dataset.metrics
+        cells = dataset.cells.reset_index()
+        keys = [tuple(row) for row in cells[self.dimensions].itertuples(index=False)]
+        for metric in self.metrics:
+            sketches = [dataset.group_sketches[(key, metric)] for key in keys]
+            cells[f"{metric}_min"] = [sketch.min() for sketch in sketches]
+            cells[f"{metric}_max"] = [sketch.max() for sketch in sketches]
+        self.cells = cells
+        self.n_rows = int(cells["count"].sum())
+        self.values = _CleanValues(self)
+
+    # Sketch gabungan metrik untuk semua kelompok dengan nilai dimensi `dim` = value
+    def sketch(self, metric, dim, value):
+        merged = ValueCounts()
+        for (key, name), sketch in self.dataset.group_sketches.items():
+            if name == metric and key[self.dimensions.index(dim)] == value:
+                merged = merged.merge(sketch)
+        return merged
+
+    # Sampel membutuhkan baris bersih utuh (dipakai uji resampling dan normalitas)
+    def samples(self, metric, **filters):
+        for dim in filters:
+            if dim not in self.dimensions:
+                raise KeyError(f"Dimensi tidak dikenal: {dim}")
+        parts = []
+        for chunk, mask in zip(self.dataset.chunks, self.dataset.masks):
+            selected = mask.copy()
+            for dim, value in filters.items():
+                selected &= chunk[dim].to_numpy() == value
+            parts.append(chunk[metric].to_numpy()[selected])
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def describe(self, dim, metric):
+        table = self.marginal(dim)
+        count = table["count"].astype("float64")
+        total = table[f"{metric}_sum"]
+        variance = (table[f"{metric}_sumsq"] - total * total / count) / (count - 1)
+        quartiles = np.array([self.sketch(metric, dim, value).quantile([0.25, 0.5, 0.75]) for value in table.index]).reshape(-1, 3)
+
+        return pd.DataFrame({
+            "count": count,
+            "mean": total / count,
+            "std": np.sqrt(variance.clip(lower=0)),
+            "min": table[f"{metric}_min"].astype("float64"),
+            "25%": quartiles[:, 0],
+            "50%": quartiles[:, 1],
+            "75%": quartiles[:, 2],
+            "max": table[f"{metric}_max"].astype("float64"),
+        }, index=table.index)
+
+
+class _CleanValues:
+    def __init__(self, cube):
+        self.cube = cube
+
+    def __getitem__(self, metric):
+        if metric not in self.cube.metrics:
+            raise KeyError(metric)
+        return self.cube.samples(metric)
+
+    def __contains__(self, metric):
+        return metric in self.cube.metrics
+
+
+# Uji Welch hari kerja vs akhir pekan dari count, mean dan varians per kelompok
+def welch_ttest(cube, metric="cnt", dim="workingday"):
+    table = cube.marginal(dim)
+    count = table["count"].astype("float64")
+    mean = table[f"{metric}_sum"] / count
+    std = np.sqrt((table[f"{metric}_sumsq"] - table[f"{metric}_sum"] ** 2 / count) / (count - 1))
+    result = stats.ttest_ind_from_stats(mean.get(1, np.nan), std.get(1, np.nan), count.get(1, 0),
+                                        mean.get(0, np.nan), std.get(0, np.nan), count.get(0, 0), equal_var=False)
+    return {"statistic": float(result.statistic), "p_value": float(result.pvalue)}
+
+
+# ANOVA satu arah dari Σx dan Σx² per kelompok (setara scipy.stats.f_oneway)
+def anova_from_sums(cube, metric="cnt", dim="season"):
+    table = cube.marginal(dim)
+    count = table["count"].astype("float64")
+    total = table[f"{metric}_sum"]
+    grand_mean = total.sum() / count.sum()
+    between = float((count * (total / count - grand_mean) ** 2).sum())
+    within = float((table[f"{metric}_sumsq"] - total * total / count).sum())
+    df_between, df_within = len(table) - 1, count.sum() - len(table)
+    statistic = (between / df_between) / (within / df_within)
+    return {"statistic": statistic, "p_value": float(stats.f.sf(statistic, df_between, df_within))}
+
+
+# Ringkasan yang diperbarui per append: batas IQR, rata-rata kelompok, korelasi dan uji statistik
+def summarize(dataset):
+    cube = dataset.cube()
+    return {
+        "bounds": dataset.bounds,
+        "season_means": cube.mean("season", "cnt"),
+        "weather_means": cube.mean("weathersit", "cnt"),
+        "workingday_means": cube.mean("workingday", "cnt"),
+        "correlation": cube.corr(["season", "weathersit", "cnt"]),
+        "pearson": dataset.correlation.result(),
+        "ttest": welch_ttest(cube),
+        "anova": anova_from_sums(cube),
+        "n_raw": dataset.n_raw,
+        "n_clean": cube.n_rows,
+    }
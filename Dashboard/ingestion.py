@@ -0,0 +1,124 @@
+import io
+import os
+
+import pandas as pd
+
+
+# Skema eksplisit kolom Bike Sharing Dataset (day.csv / hour.csv)
+BIKE_SCHEMA = {
+    "instant": "int32",
+    "dteday": "object",
+    "season": "int8",
+    "yr": "int8",
+    "mnth": "int8",
+    "hr": "int8",
+    "holiday": "int8",
+    "weekday": "int8",
+    "workingday": "int8",
+    "weathersit": "int8",
+    "temp": "float64",
+    "atemp": "float64",
+    "hum": "float64",
+    "windspeed": "float64",
+    "casual": "int32",
+    "registered": "int32",
+    "cnt": "int32",
+}
+
+# Kolom kode (kategori) dan kolom cuaca ternormalisasi
+CODE_COLUMNS = ["season", "yr", "mnth", "hr", "holiday", "weekday", "workingday", "weathersit"]
+WEATHER_COLUMNS = ["temp", "atemp", "hum", "windspeed"]
+
+# Jumlah baris per potongan saat membaca file secara bertahap
+CHUNK_SIZE = 100_000
+
+# File di atas ukuran ini dibaca dengan loader bertahap bertipe ringkas
+COMPACT_THRESHOLD_BYTES = 20 * 1024 * 1024
+
+
+# Terima bytes, path file atau objek file (misalnya file unggahan Streamlit) sebagai sumber CSV.
+# Objek file dikembalikan ke awal agar bisa dibaca lebih dari sekali (header lalu isi).
+def _as_source(source):
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+# Baca header saja untuk mengetahui kolom yang tersedia
+def read_columns(data):
+    return pd.read_csv(_as_source(data), nrows=0).columns.tolist()
+
+
+# Skema ringkas: kolom cuaca float32 dan tanggal sebagai kategori
+def compact_schema(columns):
+    dtype = {col: BIKE_SCHEMA[col] for col in columns if col in BIKE_SCHEMA}
+    for col in WEATHER_COLUMNS:
+        if col in dtype:
+            dtype[col] = "float32"
+    if "dteday" in dtype:
+        dtype["dteday"] = "category"
+    return dtype
+
+
+# Parse CSV dengan skema eksplisit untuk kolom yang dikenal
+def read_bike_csv(data):
+    columns = read_columns(data)
+    dtype = {col: BIKE_SCHEMA[col] for col in columns if col in BIKE_SCHEMA}
+    try:
+        return pd.read_csv(io.BytesIO(data), dtype=dtype)
+    except (ValueError, TypeError):
+        # Data tidak sesuai skema (misalnya ada nilai kosong), gunakan tipe bawaan pandas
+        return pd.read_csv(io.BytesIO(data))
+
+
+# Baca file CSV dari disk dengan aturan yang sama seperti unggahan di dashboard
+def read_bike_file(path):
+    if os.path.getsize(path) > COMPACT_THRESHOLD_BYTES:
+        return read_bike_csv_chunked(path)
+    with open(path, "rb") as file:
+        return read_bike_csv(file.read())
+
+
+# Skema longgar untuk data yang tidak sesuai skema ringkas (misalnya nilai kosong di kolom kode):
+# kolom bilangan bulat memakai tipe bawaan pandas (float64 jika ada nilai kosong)
+def relaxed_schema(dtype):
+    return {col: kind for col, kind in dtype.items() if not kind.startswith("int")}
+
+
+def _read_chunks(source, dtype, chunksize):
+    return list(pd.read_csv(_as_source(source), dtype=dtype, chunksize=chunksize))
+
+
+# Baca CSV per potongan dengan tipe data ringkas, lalu gabungkan sekali di akhir.
+# Sumber dibaca bertahap dari path atau objek file, sehingga salinan teks CSV tidak dibuat di memori.
+# Salinan ringkas di disk dibuat dengan storage.convert (Parquet atau .npy).
+def read_bike_csv_chunked(source, chunksize=CHUNK_SIZE, categorical=False):
+    columns = read_columns(source)
+    dtype = compact_schema(columns)
+
+    try:
+        chunks = _read_chunks(source, dtype, chunksize)
+    except (ValueError, TypeError):
+        # Seperti read_bike_csv: data tidak sesuai skema, kolom bilangan bulat dibaca dengan tipe bawaan
+        dtype = relaxed_schema(dtype)
+        chunks = _read_chunks(source, dtype, chunksize)
+
+    if chunks:
+        # union kategori tanggal antar potongan agar hasil gabungan tetap kategori
+        if "dteday" in dtype:
+            dates = pd.api.types.union_categoricals([chunk["dteday"] for chunk in chunks])
+        df = pd.concat(chunks, ignore_index=True)
+        if "dteday" in dtype:
+            df["dteday"] = dates
+    else:
+        df = pd.read_csv(_as_source(source), dtype=dtype)
+    del chunks
+
+    # Kolom kode bisa disimpan sebagai kategori (opsional)
+    if categorical:
+        for col in CODE_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+    return df
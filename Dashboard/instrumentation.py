@@ -0,0 +1,96 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+# Catat waktu wall, waktu CPU dan memori yang dialokasikan per stage.
+# Memori hanya diukur saat tracemalloc aktif (lihat set_memory_tracing).
+# Jika log_path diisi, tiap stage langsung ditulis sebagai satu baris JSON.
+class StageRecorder:
+    def __init__(self, log_path=None, **context):
+        self.log_path = Path(log_path) if log_path else None
+        self.context = dict(context, run=uuid.uuid4().hex[:12])
+        self.records = []
+        self._peaks = []
+
+    @contextmanager
+    def stage(self, name, **labels):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Puncak sebelum stage ini masuk ke stage induk, lalu mulai hitung puncak baru
+            current, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            start_memory = current
+            self._peaks.append(current)
+
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record = dict(self.context, stage=name, **labels)
+            record["wall_ms"] = (time.perf_counter() - start_wall) * 1000
+            record["cpu_ms"] = (time.process_time() - start_cpu) * 1000
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(self._peaks.pop(), peak)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                record["alloc_mb"] = (current - start_memory) / 2**20
+                record["peak_mb"] = (peak - start_memory) / 2**20
+            record["time"] = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+            self.records.append(record)
+            self._write(record)
+
+    def _write(self, record):
+        if self.log_path is None:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a") as log:
+            log.write(json.dumps(record, default=str) + "\n")
+
+    # Ringkasan stage dalam urutan selesai (stage anak muncul sebelum induknya).
+    # pandas diimpor di sini agar dashboard tidak memuatnya saat startup.
+    def table(self):
+        import pandas as pd
+
+        columns = ["stage", "wall_ms", "cpu_ms", "alloc_mb", "peak_mb"]
+        table = pd.DataFrame(self.records)
+        return table[[col for col in columns if col in table.columns]] if not table.empty else table
+
+
+# Nyalakan atau matikan tracemalloc untuk seluruh proses
+def set_memory_tracing(enabled):
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+# Profil cProfile untuk satu blok kode: simpan file .prof dan ringkasan fungsi terlama.
+# Hasil diisi ke dict `result` ("path" dan "summary") setelah blok selesai.
+@contextmanager
+def profile_block(directory, limit=25):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    result = {}
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        path = directory / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+        profiler.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(limit)
+        result["path"] = str(path)
+        result["summary"] = summary.getvalue()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+# Pisahkan kolom numerik menjadi kolom biner dan kolom kontinu
+def split_numeric_columns(df):
+    numeric_columns = df.select_dtypes(include="number").columns
+    binary_columns = [col for col in numeric_columns if df[col].nunique() == 2]
+    continuous_columns = [col for col in numeric_columns if col not in binary_columns]
+    return binary_columns, continuous_columns
+
+
+# Hitung batas bawah dan atas IQR untuk semua kolom dalam satu panggilan quantile
+def iqr_bounds(df, columns, multiplier=1.5):
+    quartiles = df[columns].quantile([0.25, 0.75])
+    q1 = quartiles.loc[0.25]
+    q3 = quartiles.loc[0.75]
+    iqr = q3 - q1
+    return pd.DataFrame({"lower": q1 - multiplier * iqr, "upper": q3 + multiplier * iqr})
+
+
+# Hitung jumlah outlier per kolom tanpa menyalin DataFrame per kolom
+def count_outliers(df, columns, multiplier=1.5):
+    bounds = iqr_bounds(df, columns, multiplier)
+    counts = {}
+    for col in columns:
+        values = df[col].to_numpy()
+        lower, upper = bounds.loc[col, "lower"], bounds.loc[col, "upper"]
+        counts[col] = int(((values < lower) | (values > upper)).sum())
+    return pd.Series(counts, dtype="int64")
+
+
+# Mask baris yang berada di dalam batas IQR
+#   mode "sequential"  : kuartil dihitung ulang dari baris yang tersisa setelah tiap kolom
+#                        (hasil sama dengan memfilter kolom satu per satu)
+#   mode "simultaneous": kuartil semua kolom dihitung sekali dari data awal
+def inlier_mask(df, columns, multiplier=1.0, mode="sequential"):
+    mask = np.ones(len(df), dtype=bool)
+
+    if mode == "simultaneous":
+        bounds = iqr_bounds(df, columns, multiplier)
+        for col in columns:
+            values = df[col].to_numpy()
+            mask &= (values >= bounds.loc[col, "lower"]) & (values <= bounds.loc[col, "upper"])
+        return mask
+
+    if mode != "sequential":
+        raise ValueError(f"Mode pembersihan tidak dikenal: {mode}")
+
+    for col in columns:
+        if not mask.any():
+            break
+        values = df[col].to_numpy()
+        remaining = values[mask]
+        remaining = remaining[~pd.isna(remaining)]
+        if len(remaining) == 0:
+            # Kuartil tidak terdefinisi sehingga semua baris tersisa ikut terbuang
+            mask[:] = False
+            break
+        q1, q3 = np.quantile(remaining, [0.25, 0.75])
+        iqr = q3 - q1
+        mask &= (values >= q1 - multiplier * iqr) & (values <= q3 + multiplier * iqr)
+    return mask
+
+
+# Hapus outlier dari kolom-kolom kontinu dengan satu kali filter di akhir
+def remove_outliers(df, columns, multiplier=1.0, mode="sequential"):
+    return df[inlier_mask(df, columns, multiplier, mode)]
@@ -0,0 +1,84 @@
+import pandas as pd
+
+from fingerprint import derive_fingerprint
+from outliers import remove_outliers, split_numeric_columns
+
+
+# Pengali IQR bawaan untuk pembersihan outlier (batas Q1 - k*IQR sampai Q3 + k*IQR)
+DEFAULT_MULTIPLIER = 1.0
+
+# Parameter bawaan pipeline; parameter yang tidak diberikan memakai nilai ini
+DEFAULT_PARAMS = {"mode": "sequential", "multiplier": DEFAULT_MULTIPLIER}
+
+
+# Tahap "prepare": kolom tanggal menjadi datetime (hanya tanggal, tanpa waktu).
+# Salinan dangkal cukup karena kolom diganti, bukan diubah di tempat; data masukan tidak berubah.
+def prepare_dates(df):
+    df = df.copy(deep=False)
+    if "dteday" in df.columns:
+        df["dteday"] = pd.to_datetime(df["dteday"]).dt.normalize()
+    return df
+
+
+# Tahap "clean": hapus baris outlier IQR dari kolom kontinu (kolom biner tidak ikut disaring)
+def clean_outliers(df, mode="sequential", multiplier=DEFAULT_MULTIPLIER):
+    binary_columns, continuous_columns = split_numeric_columns(df)
+    return remove_outliers(df, continuous_columns, multiplier=multiplier, mode=mode)
+
+
+# Tahap data wrangling setelah Gathering, berurutan: (nama, fungsi, nama parameter).
+# Tiap tahap adalah fungsi murni DataFrame -> DataFrame baru; hasilnya hanya bergantung pada
+# data masukan dan parameternya sendiri, sehingga bisa di-cache per sidik jari.
+STAGES = [
+    ("prepare", prepare_dates, ()),
+    ("clean", clean_outliers, ("mode", "multiplier")),
+]
+
+
+# Parameter satu tahap, dinormalisasi agar 1 dan 1.0 menghasilkan sidik jari yang sama
+def _stage_params(keys, params):
+    params = {**DEFAULT_PARAMS, **params}
+    return {key: float(params[key]) if key == "multiplier" else params[key] for key in keys}
+
+
+# Sidik jari tiap tahap: turunan sidik jari tahap sebelumnya ditambah nama dan parameter tahap ini.
+# Mengubah parameter satu tahap hanya mengubah sidik jari tahap itu dan tahap sesudahnya.
+def stage_fingerprints(fingerprint, **params):
+    fingerprints = {}
+    for name, func, keys in STAGES:
+        fingerprint = derive_fingerprint(fingerprint, name, *_stage_params(keys, params).values())
+        fingerprints[name] = fingerprint
+    return fingerprints
+
+
+# Sidik jari data bersih (tahap terakhir); dipakai dashboard, batch dan indeks laporan
+def clean_fingerprint(fingerprint, **params):
+    return stage_fingerprints(fingerprint, **params)[STAGES[-1][0]]
+
+
+# Jalankan semua tahap tanpa cache (batch dan benchmark)
+def run_stages(df, **params):
+    for name, func, keys in STAGES:
+        df = func(df, **_stage_params(keys, params))
+    return df
+
+
+def _stage_loader(func, upstream, kwargs):
+    return lambda: func(upstream.get(), **kwargs)
+
+
+# Jalankan pipeline lewat store bersama (lihat shared_store.py), mulai dari data yang sudah ada di store
+# dengan kunci `fingerprint`. Hasil tiap tahap disimpan dengan sidik jari tahapnya, sehingga tahap yang
+# sudah pernah dihitung (oleh sesi mana pun) langsung dipakai ulang dan hanya tahap setelah parameter
+# yang berubah yang dihitung. Loader tiap tahap memegang handle ke tahap sebelumnya, jadi hasil yang
+# dibuang saat memori penuh dibuat ulang dari tahap sebelumnya saat diminta lagi.
+# Mengembalikan {nama tahap: (sidik jari, handle)}.
+def run_pipeline(store, fingerprint, **params):
+    results = {}
+    upstream = store.acquire(fingerprint)
+    for name, func, keys in STAGES:
+        kwargs = _stage_params(keys, params)
+        fingerprint = derive_fingerprint(fingerprint, name, *kwargs.values())
+        upstream = store.get_or_create(fingerprint, _stage_loader(func, upstream, kwargs))
+        results[name] = (fingerprint, upstream)
+    return results
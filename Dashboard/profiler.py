@@ -0,0 +1,243 @@
+import argparse
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from incremental import ValueCounts
+from ingestion import CHUNK_SIZE
+
+
+# Nilai unik maksimal per sketch kuantil; di bawah batas ini kuartil dan jumlah outlier tepat
+PROFILE_SKETCH_VALUES = 65_536
+
+# Presisi HyperLogLog (2^12 register per kolom, galat relatif ±1.04/sqrt(4096) ≈ 1.6%)
+HLL_PRECISION = 12
+
+# Jumlah hash baris yang ditampung di memori sebelum ditulis ke partisi di disk (8 byte per hash)
+DUPLICATE_MEMORY_HASHES = 4_000_000
+DUPLICATE_PARTITIONS = 64
+
+
+# HyperLogLog untuk estimasi jumlah nilai unik dengan memori tetap
+class DistinctCounter:
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        # Posisi bit 1 pertama dari 32 bit teratas sisa hash (+1); sisa nol dianggap 33
+        top = (rest >> np.uint64(32)).astype("float64")
+        rank = np.where(top > 0, 32 - np.floor(np.log2(np.maximum(top, 1))), 33).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add(self, values):
+        values = pd.Series(values).dropna().to_numpy()
+        if len(values):
+            self.add_hashes(pd.util.hash_array(values))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype("float64"))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+
+# Hitung baris duplikat dari hash 64-bit tiap baris (galat hanya dari tabrakan hash, peluang ≈ n²/2^65).
+# Hash ditampung di memori sampai batas tertentu; selebihnya ditulis ke partisi di disk
+# berdasarkan bit teratas, lalu tiap partisi dihitung terpisah sehingga memori tetap terbatas.
+class DuplicateCounter:
+    def __init__(self, memory_hashes=DUPLICATE_MEMORY_HASHES, partitions=DUPLICATE_PARTITIONS):
+        self.memory_hashes = memory_hashes
+        self.partitions = partitions
+        self.buffer = []
+        self.buffered = 0
+        self.rows = 0
+        self.spill_dir = None
+
+    def add(self, chunk):
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        self.rows += len(hashes)
+        self.buffer.append(hashes)
+        self.buffered += len(hashes)
+        if self.buffered > self.memory_hashes:
+            # Buang duplikat di buffer dulu; tulis ke disk hanya jika masih melebihi batas
+            unique = np.unique(np.concatenate(self.buffer))
+            self.buffer, self.buffered = [unique], len(unique)
+            if self.buffered > self.memory_hashes:
+                self._spill()
+
+    def _partition(self, hashes):
+        return (hashes >> np.uint64(58)).astype(np.intp) * self.partitions >> 6
+
+    def _spill(self):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.TemporaryDirectory(prefix="bike_profile_")
+        hashes = np.concatenate(self.buffer)
+        partition = self._partition(hashes)
+        for part in np.unique(partition):
+            with open(Path(self.spill_dir.name) / f"{part}.bin", "ab") as file:
+                hashes[partition == part].tofile(file)
+        self.buffer, self.buffered = [], 0
+
+    def count(self):
+        if self.spill_dir is None:
+            hashes = np.concatenate(self.buffer) if self.buffer else np.empty(0, dtype=np.uint64)
+            return self.rows - len(np.unique(hashes))
+
+        if self.buffer:
+            self._spill()
+        distinct = 0
+        for path in Path(self.spill_dir.name).glob("*.bin"):
+            distinct += len(np.unique(np.fromfile(path, dtype=np.uint64)))
+        self.spill_dir.cleanup()
+        self.spill_dir = None
+        return self.rows - distinct
+
+
+# Profil data dalam satu kali lintasan per potongan: missing values, duplikat, statistik deskriptif,
+# jumlah nilai unik (untuk deteksi kolom biner) dan jumlah outlier IQR
+class DataProfiler:
+    def __init__(self, sketch_values=PROFILE_SKETCH_VALUES):
+        self.sketch_values = sketch_values
+        self.columns = None
+        self.numeric = None
+        self.missing = None
+        self.moments = {}
+        self.sketches = {}
+        self.distinct = {}
+        self.duplicates = DuplicateCounter()
+
+    def update(self, chunk):
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.numeric = list(chunk.select_dtypes(include="number").columns)
+            self.missing = pd.Series(0, index=self.columns, dtype="int64")
+            self.sketches = {col: ValueCounts(max_values=self.sketch_values) for col in self.numeric}
+            self.distinct = {col: DistinctCounter() for col in self.columns}
+        # Kolom yang berubah menjadi non-numerik di potongan berikutnya tidak lagi diprofilkan sebagai angka
+        self.numeric = [col for col in self.numeric if pd.api.types.is_numeric_dtype(chunk[col])]
+
+        self.missing += chunk.isnull().sum().astype("int64")
+        self.duplicates.add(chunk)
+        for col in self.columns:
+            self.distinct[col].add(chunk[col].to_numpy())
+        for col in self.numeric:
+            values = chunk[col].to_numpy().astype("float64")
+            values = values[~np.isnan(values)]
+            self.sketches[col].add(values)
+            self._merge_moments(col, values)
+
+    # Gabungan count, mean dan M2 (jumlah kuadrat selisih) antar potongan (Chan dkk.)
+    def _merge_moments(self, col, values):
+        if len(values) == 0:
+            return
+        n_b, mean_b = len(values), values.mean()
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n_a, mean_a, m2_a = self.moments.get(col, (0, 0.0, 0.0))
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self.moments[col] = (n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n)
+
+    def distinct_count(self, col):
+        sketch = self.sketches.get(col)
+        if sketch is not None and sketch.resolution == 0:
+            return len(sketch.values)
+        return int(round(self.distinct[col].estimate()))
+
+    def describe(self):
+        rows = {}
+        for col in self.numeric:
+            n, mean, m2 = self.moments.get(col, (0, np.nan, np.nan))
+            sketch = self.sketches[col]
+            rows[col] = [float(n), mean, np.sqrt(m2 / (n - 1)) if n > 1 else np.nan, sketch.min(),
+                         *sketch.quantile([0.25, 0.5, 0.75]), sketch.max()]
+        return pd.DataFrame(rows, index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"], columns=self.numeric)
+
+    # Jumlah nilai di luar batas IQR per kolom, dihitung dari sketch tanpa membaca ulang data
+    def outliers(self, columns, multiplier=1.5):
+        counts = {}
+        for col in columns:
+            sketch = self.sketches[col]
+            q1, q3 = sketch.quantile([0.25, 0.75])
+            iqr = q3 - q1
+            outside = (sketch.values < q1 - multiplier * iqr) | (sketch.values > q3 + multiplier * iqr)
+            counts[col] = int(sketch.counts[outside].sum())
+        return pd.Series(counts, dtype="int64")
+
+    # Batas galat: kuantil (pergeseran pembulatan yang terkumpul di sketch, 0 = tepat) dan jumlah nilai unik (relatif, 0 = tepat)
+    def errors(self):
+        rows = {}
+        for col in self.columns:
+            sketch = self.sketches.get(col)
+            exact = sketch is not None and sketch.resolution == 0
+            rows[col] = {"quantile": sketch.error if sketch is not None else np.nan,
+                         "distinct": 0.0 if exact else self.distinct[col].relative_error}
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+    # Hasil dengan format yang sama seperti analytics.assess_dataset
+    def result(self, multiplier=1.5):
+        continuous_columns = [col for col in self.numeric if self.distinct_count(col) != 2]
+        return {
+            "missing": self.missing,
+            "duplicates": self.duplicates.count(),
+            "describe": self.describe(),
+            "continuous_columns": continuous_columns,
+            "outliers": self.outliers(continuous_columns, multiplier=multiplier),
+            "distinct": pd.Series({col: self.distinct_count(col) for col in self.columns}, dtype="int64"),
+            "errors": self.errors(),
+        }
+
+
+# Profil DataFrame di memori, diproses per potongan baris.
+# `progress(done, total, message)` opsional dipanggil sebelum tiap potongan (lihat executor.Job.report).
+def profile_frame(df, multiplier=1.5, chunksize=CHUNK_SIZE, progress=None):
+    profiler = DataProfiler()
+    starts = range(0, max(len(df), 1), chunksize)
+    for done, start in enumerate(starts):
+        if progress is not None:
+            progress(done, len(starts), f"Baris {start:,} dari {len(df):,}")
+        profiler.update(df.iloc[start:start + chunksize])
+    return profiler.result(multiplier)
+
+
+# Profil file CSV (path atau bytes) tanpa memuat seluruh isinya ke memori
+# Tipe kolom disimpulkan pandas per potongan (int64/float64), sama seperti describe() pada data utuh.
+def profile_csv(source, multiplier=1.5, chunksize=CHUNK_SIZE):
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    profiler = DataProfiler()
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        profiler.update(chunk)
+    return profiler.result(multiplier)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profil data CSV Bike Sharing dalam satu lintasan")
+    parser.add_argument("input", help="File CSV")
+    parser.add_argument("--multiplier", type=float, default=1.5, help="Pengali IQR untuk deteksi outlier")
+    args = parser.parse_args(argv)
+
+    profile = profile_csv(args.input, multiplier=args.multiplier)
+    print("Missing values:\n", profile["missing"].to_string(), sep="")
+    print("Duplikat:", profile["duplicates"])
+    print(profile["describe"].to_string())
+    print("Outlier:\n", profile["outliers"].to_string(), sep="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import normaltest, shapiro
+
+from executor import DEFAULT_PROCESS_WORKERS, process_pool
+
+
+DEFAULT_RESAMPLES = 2000
+
+# Batas elemen matriks resampling per batch (baris resample x jumlah data)
+MAX_BATCH_ELEMENTS = 5_000_000
+
+# Shapiro-Wilk hanya akurat sampai 5000 sampel
+SHAPIRO_MAX_SAMPLES = 5000
+
+# Resampling disebar ke beberapa proses mulai dari jumlah baris ini
+PARALLEL_MIN_ROWS = 200_000
+
+
+# Bagi jumlah resample menjadi beberapa bagian dengan seed independen
+def _split_resamples(n_resamples, parts, seed):
+    sizes = [n_resamples // parts + (1 if i < n_resamples % parts else 0) for i in range(parts)]
+    seeds = np.random.SeedSequence(seed).spawn(parts)
+    return [(size, child) for size, child in zip(sizes, seeds) if size > 0]
+
+
+# Pool proses untuk serangkaian uji resampling (misalnya satu analytics.analyze): proses dibuat sekali
+# (spawn, lihat executor.process_pool) dan dipakai semua uji. Array data tiap uji ditulis sekali ke file .npy
+# sementara yang di-memory-map oleh proses anak, sehingga task hanya membawa path, ukuran dan seed.
+class ResamplingPool:
+    def __init__(self, workers):
+        self.workers = workers
+        self._pool = None
+        self._dir = None
+
+    def __enter__(self):
+        self._pool = process_pool(self.workers)
+        self._dir = tempfile.TemporaryDirectory(prefix="bike_resampling_")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._pool.shutdown()
+        self._dir.cleanup()
+
+    # Array ditulis ke file; nilai lain (misalnya jumlah anggota kelompok pertama) dikirim apa adanya
+    def _share(self, data):
+        if isinstance(data, tuple):
+            return tuple(self._share(item) for item in data)
+        if isinstance(data, np.ndarray):
+            path = Path(self._dir.name) / f"{uuid.uuid4().hex}.npy"
+            np.save(path, data)
+            return _SharedArray(str(path))
+        return data
+
+    def run(self, kernel, data, n_resamples, seed):
+        shared = self._share(data)
+        tasks = _split_resamples(n_resamples, self.workers, seed)
+        results = self._pool.map(_run_shared, [kernel] * len(tasks), [shared] * len(tasks),
+                                 [size for size, _ in tasks], [child for _, child in tasks])
+        distribution = np.concatenate(list(results))
+        _unshare(shared)
+        return distribution
+
+
+class _SharedArray:
+    def __init__(self, path):
+        self.path = path
+
+
+def _load_shared(data):
+    if isinstance(data, tuple):
+        return tuple(_load_shared(item) for item in data)
+    if isinstance(data, _SharedArray):
+        return np.load(data.path, mmap_mode="r")
+    return data
+
+
+def _unshare(data):
+    if isinstance(data, tuple):
+        for item in data:
+            _unshare(item)
+    elif isinstance(data, _SharedArray):
+        Path(data.path).unlink(missing_ok=True)
+
+
+# Dijalankan di proses anak: buka data dari file (memory-map) lalu jalankan kernel
+def _run_shared(kernel, data, n_resamples, seed):
+    return kernel(_load_shared(data), n_resamples, seed)
+
+
+# Jalankan kernel batch secara berurutan, di pool yang sudah ada, atau di pool baru untuk uji ini saja.
+# `workers` berupa jumlah proses atau ResamplingPool.
+def _run(kernel, data, n_resamples, seed, workers):
+    if isinstance(workers, ResamplingPool):
+        return workers.run(kernel, data, n_resamples, seed)
+    if not workers or workers <= 1:
+        return kernel(data, n_resamples, np.random.SeedSequence(seed))
+    with ResamplingPool(workers) as pool:
+        return pool.run(kernel, data, n_resamples, seed)
+
+
+# Pool bersama untuk beberapa uji; tanpa proses tambahan jika `workers` kosong atau 1
+@contextmanager
+def resampling_pool(workers):
+    if not workers or workers <= 1:
+        yield workers
+        return
+    with ResamplingPool(workers) as pool:
+        yield pool
+
+
+def _batch_sizes(n_resamples, n):
+    batch = max(1, MAX_BATCH_ELEMENTS // max(n, 1))
+    while n_resamples > 0:
+        size = min(batch, n_resamples)
+        yield size
+        n_resamples -= size
+
+
+# Kernel permutasi: selisih rata-rata kelompok pertama dan kedua untuk tiap permutasi label
+def _permutation_mean_diff(data, n_resamples, seed):
+    values, n_a = data
+    rng = np.random.default_rng(seed)
+    n, n_b = len(values), len(values) - n_a
+    total = values.sum()
+    results = []
+    for size in _batch_sizes(n_resamples, n):
+        permuted = rng.permuted(np.broadcast_to(values, (size, n)), axis=1)
+        sum_a = permuted[:, :n_a].sum(axis=1)
+        results.append(sum_a / n_a - (total - sum_a) / n_b)
+    return np.concatenate(results)
+
+
+# Kernel permutasi ANOVA: statistik F untuk tiap permutasi label kelompok.
+# Jumlah total dan jumlah kuadrat tidak berubah oleh permutasi, jadi cukup hitung jumlah per kelompok.
+def _permutation_f(data, n_resamples, seed):
+    values, sizes = data
+    rng = np.random.default_rng(seed)
+    n, k = len(values), len(sizes)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    correction = values.sum() ** 2 / n
+    total_ss = (values * values).sum() - correction
+    results = []
+    for size in _batch_sizes(n_resamples, n):
+        permuted = rng.permuted(np.broadcast_to(values, (size, n)), axis=1)
+        group_sums = np.add.reduceat(permuted, offsets, axis=1)
+        between = (group_sums * group_sums / sizes).sum(axis=1) - correction
+        results.append((between / (k - 1)) / ((total_ss - between) / (n - k)))
+    return np.concatenate(results)
+
+
+# Kernel bootstrap: rata-rata tiap sampel bootstrap (indeks acak dengan pengembalian)
+def _bootstrap_mean(data, n_resamples, seed):
+    values = data
+    rng = np.random.default_rng(seed)
+    n = len(values)
+    results = []
+    for size in _batch_sizes(n_resamples, n):
+        results.append(values[rng.integers(0, n, size=(size, n))].mean(axis=1))
+    return np.concatenate(results)
+
+
+def _f_statistic(groups):
+    values = np.concatenate(groups)
+    sizes = np.array([len(group) for group in groups])
+    correction = values.sum() ** 2 / len(values)
+    between = sum(group.sum() ** 2 / len(group) for group in groups) - correction
+    within = (values * values).sum() - correction - between
+    return (between / (len(groups) - 1)) / (within / (len(values) - len(groups))), values, sizes
+
+
+# Uji permutasi dua sisi untuk selisih rata-rata dua kelompok
+def permutation_test(a, b, n_resamples=DEFAULT_RESAMPLES, seed=0, workers=None):
+    a = np.asarray(a, dtype="float64")
+    b = np.asarray(b, dtype="float64")
+    observed = a.mean() - b.mean()
+    distribution = _run(_permutation_mean_diff, (np.concatenate([a, b]), len(a)), n_resamples, seed, workers)
+    extreme = np.count_nonzero(np.abs(distribution) >= abs(observed))
+    return {"statistic": observed, "p_value": (extreme + 1) / (len(distribution) + 1), "n_resamples": len(distribution)}
+
+
+# Uji permutasi untuk ANOVA satu arah (statistik F)
+def permutation_anova(groups, n_resamples=DEFAULT_RESAMPLES, seed=0, workers=None):
+    groups = [np.asarray(group, dtype="float64") for group in groups if len(group) > 0]
+    observed, values, sizes = _f_statistic(groups)
+    distribution = _run(_permutation_f, (values, sizes), n_resamples, seed, workers)
+    extreme = np.count_nonzero(distribution >= observed)
+    return {"statistic": observed, "p_value": (extreme + 1) / (len(distribution) + 1), "n_resamples": len(distribution)}
+
+
+# Interval kepercayaan bootstrap (persentil) untuk rata-rata
+def bootstrap_mean_ci(values, n_resamples=DEFAULT_RESAMPLES, confidence=0.95, seed=0, workers=None):
+    values = np.asarray(values, dtype="float64")
+    distribution = _run(_bootstrap_mean, values, n_resamples, seed, workers)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(distribution, [alpha, 1 - alpha])
+    return {"estimate": values.mean(), "low": low, "high": high, "n_resamples": len(distribution)}
+
+
+# Interval kepercayaan bootstrap untuk selisih rata-rata dua kelompok
+def bootstrap_diff_ci(a, b, n_resamples=DEFAULT_RESAMPLES, confidence=0.95, seed=0, workers=None):
+    a = np.asarray(a, dtype="float64")
+    b = np.asarray(b, dtype="float64")
+    seed_a, seed_b = np.random.SeedSequence(seed).generate_state(2)
+    distribution = (_run(_bootstrap_mean, a, n_resamples, int(seed_a), workers)
+                    - _run(_bootstrap_mean, b, n_resamples, int(seed_b), workers))
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(distribution, [alpha, 1 - alpha])
+    return {"estimate": a.mean() - b.mean(), "low": low, "high": high, "n_resamples": len(distribution)}
+
+
+# Uji normalitas: Shapiro-Wilk untuk sampel kecil, D'Agostino-Pearson di atas 5000 sampel
+def normality_test(values):
+    values = np.asarray(values, dtype="float64")
+    if len(values) <= SHAPIRO_MAX_SAMPLES:
+        stat, p_value = shapiro(values)
+        return {"test": "Shapiro-Wilk", "statistic": stat, "p_value": p_value}
+    stat, p_value = normaltest(values)
+    return {"test": "D'Agostino-Pearson", "statistic": stat, "p_value": p_value}
+
+
+# Jumlah proses untuk resampling: paralel hanya untuk data besar, paling banyak `max_workers`
+# (bawaan executor.DEFAULT_PROCESS_WORKERS, karena beberapa job latar belakang bisa berjalan bersamaan)
+def resampling_workers(n_rows, max_workers=DEFAULT_PROCESS_WORKERS):
+    if n_rows >= PARALLEL_MIN_ROWS:
+        return min(os.cpu_count() or 1, max_workers or os.cpu_count() or 1)
+    return None
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+
+RENTAL_LABELS = ["Low Rental", "Medium Rental", "High Rental"]
+
+
+# Tepi segmen dari kuantil data, misalnya (0.25, 0.75) untuk Q1 dan Q3
+def quantile_edges(values, quantiles=(0.25, 0.75)):
+    values = np.asarray(values, dtype="float64")
+    return np.nanquantile(values, quantiles)
+
+
+# Kode segmen untuk tepi e1 < ... < ek dengan interval
+#   [-inf, e1), [e1, e2), ..., [e(k-1), ek], (ek, inf)
+# sehingga untuk tepi (Q1, Q3) hasilnya sama dengan aturan Low < Q1 <= Medium <= Q3 < High.
+# Nilai kosong (NaN) mendapat kode -1.
+def segment_codes(values, edges):
+    values = np.asarray(values, dtype="float64")
+    edges = np.asarray(edges, dtype="float64")
+    codes = np.searchsorted(edges[:-1], values, side="right") + (values > edges[-1])
+    codes = codes.astype("int8")
+    codes[np.isnan(values)] = -1
+    return codes
+
+
+# Segmentasi satu kolom menjadi Categorical berurutan tanpa memanggil fungsi Python per baris
+def segment(values, edges=None, quantiles=(0.25, 0.75), labels=None):
+    if edges is None:
+        edges = quantile_edges(values, quantiles)
+    if labels is None:
+        labels = [f"Segmen {i + 1}" for i in range(len(edges) + 1)]
+    if len(labels) != len(edges) + 1:
+        raise ValueError("Jumlah label harus satu lebih banyak dari jumlah tepi segmen")
+    return pd.Categorical.from_codes(segment_codes(values, edges), categories=labels, ordered=True)
+
+
+# Segmentasi berdasarkan kuantil di dalam tiap kelompok (misalnya per musim atau per jam)
+def segment_within_groups(df, metric, by, quantiles=(0.25, 0.75), labels=None):
+    if labels is None:
+        labels = [f"Segmen {i + 1}" for i in range(len(quantiles) + 1)]
+    if len(labels) != len(quantiles) + 1:
+        raise ValueError("Jumlah label harus satu lebih banyak dari jumlah kuantil")
+
+    grouped = df.groupby(by, observed=True, sort=True)
+    group_codes = grouped.ngroup().to_numpy()
+    # Tabel tepi: satu baris per kelompok, satu kolom per kuantil (urutan sama dengan ngroup)
+    edges = grouped[metric].quantile(list(quantiles)).unstack().to_numpy()
+
+    values = df[metric].to_numpy().astype("float64")
+    valid = (group_codes >= 0) & ~np.isnan(values)
+    row_group = np.where(valid, group_codes, 0)
+
+    codes = np.zeros(len(values), dtype="int8")
+    for j in range(len(quantiles) - 1):
+        codes += values >= edges[row_group, j]
+    codes += values > edges[row_group, -1]
+    codes[~valid] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
+# Jumlah anggota tiap segmen langsung dari kode kategori
+def segment_counts(categorical):
+    codes = np.asarray(categorical.codes)
+    counts = np.bincount(codes[codes >= 0], minlength=len(categorical.categories))
+    return pd.Series(counts, index=categorical.categories, name="count")
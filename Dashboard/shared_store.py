@@ -0,0 +1,183 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+
+# Batas memori bawaan untuk semua DataFrame di store dan umur entri tanpa pemakai
+DEFAULT_BUDGET_BYTES = 1024 * 2**20
+DEFAULT_TTL_SECONDS = 3600
+
+
+# Ukuran entri: DataFrame lewat memory_usage, objek lain (misalnya incremental.IncrementalDataset) lewat nbytes.
+# Entri yang belum dimuat (frame None) belum memakai memori.
+def _frame_size(frame):
+    if frame is None:
+        return 0
+    nbytes = getattr(frame, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return int(frame.memory_usage(deep=True).sum())
+
+
+class _Entry:
+    def __init__(self, frame, loader):
+        self.frame = frame
+        self.loader = loader
+        self.size = _frame_size(frame)
+        self.refs = 0
+        self.last_access = time.monotonic()
+
+
+# Handle ringan yang disimpan di session_state; DataFrame-nya sendiri ada di store.
+# Referensi dilepas saat release() dipanggil atau saat handle dibuang oleh garbage collector.
+class DatasetHandle:
+    def __init__(self, store, key):
+        self.key = key
+        self._store = store
+        self._finalizer = weakref.finalize(self, store._release, key)
+
+    def get(self):
+        return self._store.get(self.key)
+
+    def release(self):
+        self._finalizer()
+
+    def __repr__(self):
+        return f"DatasetHandle({self.key[:12]})"
+
+
+# Store DataFrame bersama untuk seluruh proses, dengan kunci sidik jari dataset.
+#   - get() mengembalikan salinan dangkal (copy-on-write jika mode copy_on_write pandas aktif),
+#     sehingga perubahan oleh satu sesi tidak terlihat oleh sesi lain
+#   - entri yang masih dipegang handle tidak dibuang, kecuali punya loader untuk dibuat ulang;
+#     entri tanpa loader (misalnya dataset inkremental) tetap di memori selama dipegang sesi,
+#     walaupun total ukuran melebihi budget
+#   - entri tanpa pemakai dibuang setelah TTL, dan entri paling lama tidak dipakai (LRU)
+#     dibuang jika total ukuran melebihi budget
+class SharedStore:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.budget_bytes = budget_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    # Simpan DataFrame (jika belum ada) dan kembalikan handle baru untuknya.
+    # `loader` opsional: fungsi tanpa argumen untuk membuat ulang DataFrame setelah dibuang.
+    # Dengan frame None dan loader, DataFrame baru dibuat saat pertama kali diminta lewat get().
+    def put(self, key, frame, loader=None):
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = _Entry(frame, loader)
+            return self._acquire(key)
+
+    # Handle untuk kunci yang sudah ada, atau buat dulu dengan loader
+    def get_or_create(self, key, loader, keep_loader=True):
+        with self._lock:
+            if key in self._entries:
+                return self._acquire(key)
+        # Loader dijalankan di luar lock agar sesi lain tidak ikut menunggu
+        frame = loader()
+        return self.put(key, frame, loader if keep_loader else None)
+
+    # Pasang loader untuk entri yang dibuat tanpa loader, misalnya setelah data unggahan disalin ke disk
+    # (lihat views/gathering.py). Entri itu lalu bisa dilepas dari memori walaupun masih dipegang sesi.
+    def set_loader(self, key, loader):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.loader is None:
+                entry.loader = loader
+                self._evict()
+
+    # Handle tambahan untuk entri yang sudah ada (KeyError jika tidak ada)
+    def acquire(self, key):
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(f"Dataset {key} tidak ada di store")
+            return self._acquire(key)
+
+    def _acquire(self, key):
+        entry = self._entries[key]
+        entry.refs += 1
+        self._touch(key)
+        handle = DatasetHandle(self, key)
+        self._evict(keep=key)
+        return handle
+
+    def _release(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs -= 1
+                entry.last_access = time.monotonic()
+            self._evict()
+
+    def _touch(self, key):
+        self._entries[key].last_access = time.monotonic()
+        self._entries.move_to_end(key)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise KeyError(f"Dataset {key} tidak ada di store")
+            frame, loader = entry.frame, entry.loader
+            if frame is not None:
+                self._touch(key)
+                self._evict(keep=key)
+                return frame.copy(deep=False)
+
+        # Data yang sudah dibuang dibuat ulang di luar lock (seperti get_or_create) agar sesi lain tidak ikut menunggu.
+        # Jika sesi lain lebih dulu selesai memuat, hasil sesi itu yang dipakai.
+        frame = loader()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.frame is None:
+                    entry.frame = frame
+                    entry.size = _frame_size(frame)
+                frame = entry.frame
+                self._touch(key)
+                self._evict(keep=key)
+        return frame.copy(deep=False)
+
+    # Lepaskan data entri yang punya loader (dibuat ulang saat diminta lagi), misalnya data bersih
+    # saat analisis dihitung dari backend SQLite. Entri tanpa loader tidak berubah.
+    def unload(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.loader is not None:
+                entry.frame = None
+                entry.size = 0
+
+    def _evict(self, keep=None):
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.refs <= 0 and now - entry.last_access > self.ttl_seconds:
+                del self._entries[key]
+
+        # LRU: urutan OrderedDict dari yang paling lama tidak dipakai
+        for key, entry in list(self._entries.items()):
+            if self.total_bytes() <= self.budget_bytes:
+                break
+            if key == keep or entry.frame is None:
+                continue
+            if entry.refs <= 0:
+                del self._entries[key]
+            elif entry.loader is not None:
+                # Masih dipakai sesi: lepaskan datanya saja, dibuat ulang oleh loader saat diminta
+                entry.frame = None
+                entry.size = 0
+
+    def total_bytes(self):
+        return sum(entry.size for entry in self._entries.values())
+
+    # Ringkasan isi store untuk panel diagnostik (pandas diimpor di sini, store sendiri tidak membutuhkannya)
+    def stats(self):
+        import pandas as pd
+
+        with self._lock:
+            rows = [{"key": key[:12], "mb": entry.size / 2**20, "refs": entry.refs,
+                     "loaded": entry.frame is not None, "idle_s": time.monotonic() - entry.last_access}
+                    for key, entry in self._entries.items()]
+        return pd.DataFrame(rows, columns=["key", "mb", "refs", "loaded", "idle_s"])
@@ -0,0 +1,271 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import special
+
+from executor import process_pool
+
+
+# Kolom yang dibutuhkan model permintaan
+SIMULATION_COLUMNS = ["dteday", "season", "weathersit", "workingday", "hr", "cnt"]
+
+SEASONS = [1, 2, 3, 4]
+WEATHERS = [1, 2, 3, 4]
+HOURS = 24
+
+# Jumlah sel distribusi empiris (musim x cuaca x hari kerja x jam) dan sel gabungan semua cuaca (musim x hari kerja x jam)
+N_CELLS = len(SEASONS) * len(WEATHERS) * 2 * HOURS
+N_POOLED_CELLS = len(SEASONS) * 2 * HOURS
+
+DEFAULT_DAYS = 200_000
+DEFAULT_SERVICE_LEVEL = 0.95
+# Jumlah penyewaan yang dapat dilayani satu sepeda per jam (1 = tiap sepeda dipakai satu perjalanan per jam)
+DEFAULT_RENTALS_PER_BIKE = 1.0
+
+# Hari simulasi per batch (batch x 24 elemen per array) agar memori puncak tetap kecil.
+# Tiap batch memiliki seed sendiri, sehingga hasil sama berapa pun jumlah proses yang dipakai.
+BATCH_DAYS = 50_000
+
+# Sel dengan sampel kurang dari ini memakai sel gabungan semua cuaca (musim, hari kerja dan jam yang sama)
+MIN_CELL_SAMPLES = 5
+
+# Simulasi disebar ke beberapa proses mulai dari jumlah hari ini
+PARALLEL_MIN_DAYS = 500_000
+
+
+# Nomor sel distribusi empiris: (((season - 1) x 4 + weathersit - 1) x 2 + workingday) x 24 + hr
+def cell_keys(season, weathersit, workingday, hr):
+    return (((season - 1) * len(WEATHERS) + weathersit - 1) * 2 + workingday) * HOURS + hr
+
+
+# Nomor sel gabungan semua cuaca: ((season - 1) x 2 + workingday) x 24 + hr, setelah N_CELLS sel biasa
+def pooled_keys(season, workingday, hr):
+    return N_CELLS + ((season - 1) * 2 + workingday) * HOURS + hr
+
+
+# Korelasi antar jam dalam satu hari (intraclass correlation dari skor normal persentil tiap jam di selnya).
+# Hari yang ramai cenderung ramai di semua jam, sehingga jam tidak disampel secara independen.
+def day_correlation(keys, values, days):
+    order = np.lexsort((values, keys))
+    sorted_keys = keys[order]
+    starts = np.searchsorted(sorted_keys, sorted_keys, side="left")
+    ends = np.searchsorted(sorted_keys, sorted_keys, side="right")
+    scores = np.empty(len(values))
+    scores[order] = special.ndtri((np.arange(len(values)) - starts + 0.5) / (ends - starts))
+
+    day_index = np.unique(days, return_inverse=True)[1]
+    day_sizes = np.bincount(day_index)
+    n_days = len(day_sizes)
+    if n_days < 2 or len(scores) <= n_days:
+        return 0.0
+    day_means = np.bincount(day_index, weights=scores) / day_sizes
+    within = ((scores - day_means[day_index]) ** 2).sum() / (len(scores) - n_days)
+    between = (day_sizes * (day_means - scores.mean()) ** 2).sum() / (n_days - 1)
+    k = day_sizes.mean()
+    return float(np.clip((between - within) / (between + (k - 1) * within), 0.0, 1.0))
+
+
+# Faktor pengali cuaca per (musim, cuaca): total penyewaan jam dengan cuaca tersebut dibagi total yang diharapkan dari
+# rata-rata sel gabungan semua cuaca pada jam yang sama. Kombinasi dengan data terlalu sedikit memakai faktor cuaca
+# dari semua musim, dan cuaca yang tidak pernah tercatat memakai faktor 1.
+def weather_factors(season, weathersit, values, pooled):
+    pooled_counts = np.bincount(pooled - N_CELLS, minlength=N_POOLED_CELLS)
+    pooled_means = np.bincount(pooled - N_CELLS, weights=values, minlength=N_POOLED_CELLS) / np.maximum(pooled_counts, 1)
+    expected = pooled_means[pooled - N_CELLS]
+    groups = (season - 1) * len(WEATHERS) + weathersit - 1
+    observed_sum = np.bincount(groups, weights=values, minlength=len(SEASONS) * len(WEATHERS))
+    expected_sum = np.bincount(groups, weights=expected, minlength=len(SEASONS) * len(WEATHERS))
+    group_counts = np.bincount(groups, minlength=len(SEASONS) * len(WEATHERS))
+
+    overall_observed = np.bincount(weathersit - 1, weights=values, minlength=len(WEATHERS))
+    overall_expected = np.bincount(weathersit - 1, weights=expected, minlength=len(WEATHERS))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        overall = np.where(overall_expected > 0, overall_observed / overall_expected, 1.0)
+        factors = np.where(group_counts >= MIN_CELL_SAMPLES * HOURS, observed_sum / expected_sum, np.tile(overall, len(SEASONS)))
+    return factors.reshape(len(SEASONS), len(WEATHERS))
+
+
+# Distribusi empiris `cnt` per (musim, cuaca, hari kerja, jam) dari data per jam.
+# Nilai tiap sel disimpan terurut dalam satu array dengan offset per sel, sehingga menyampel semua jam
+# semua hari simulasi cukup satu operasi indeks (inverse CDF empiris). Nilai cnt ekstrem tetap dipakai:
+# puncak permintaan justru yang menentukan jumlah sepeda.
+# Jika ada kolom yr, bawaannya hanya tahun terakhir yang dipakai (seperti grid skenario forecast.py): permintaan
+# tumbuh antar tahun, dan mencampur tahun dalam satu sel membuat distribusi puncak harian terlalu lebar.
+class DemandModel:
+    def __init__(self, df, latest_year=True):
+        missing = [col for col in SIMULATION_COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"Kolom tidak ditemukan untuk simulasi: {missing}")
+        self.year = None
+        if latest_year and "yr" in df.columns:
+            self.year = int(df["yr"].max())
+            df = df[df["yr"] == self.year]
+        df = df[SIMULATION_COLUMNS].dropna()
+        # Baris dengan kode kategori tidak valid dan baris ganda (tanggal dan jam sama) dibuang
+        df = df[df["season"].isin(SEASONS) & df["weathersit"].isin(WEATHERS) & df["workingday"].isin([0, 1])
+                & df["hr"].between(0, HOURS - 1) & (df["cnt"] >= 0)]
+        df = df.drop_duplicates(["dteday", "hr"])
+        if df.empty:
+            raise ValueError("Data tidak memiliki baris per jam yang valid untuk simulasi")
+
+        season, weathersit = df["season"].to_numpy().astype("int64"), df["weathersit"].to_numpy().astype("int64")
+        workingday, hr = df["workingday"].to_numpy().astype("int64"), df["hr"].to_numpy().astype("int64")
+        values = df["cnt"].to_numpy().astype("float64")
+        keys = cell_keys(season, weathersit, workingday, hr)
+        self.n_rows = len(df)
+        self.day_correlation = day_correlation(keys, values, df["dteday"].astype(str).to_numpy())
+
+        # Tiap nilai masuk ke selnya dan ke sel gabungan semua cuaca
+        all_keys = np.concatenate([keys, pooled_keys(season, workingday, hr)])
+        all_values = np.concatenate([values, values])
+        order = np.lexsort((all_values, all_keys))
+        self.values = all_values[order]
+        self.counts = np.bincount(all_keys, minlength=N_CELLS + N_POOLED_CELLS)
+        self.offsets = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+
+        # Sel yang dipakai untuk tiap (musim, cuaca, hari kerja, jam); sel jarang diarahkan ke sel gabungannya
+        # dengan faktor pengali cuaca, sehingga skenario cuaca yang jarang terjadi tetap mengikuti efek cuacanya
+        self.lookup = np.arange(N_CELLS)
+        self.scale = np.ones(N_CELLS)
+        sparse = np.flatnonzero(self.counts[:N_CELLS] < MIN_CELL_SAMPLES)
+        sparse_season, sparse_weather, sparse_workingday, sparse_hr = np.unravel_index(sparse, (len(SEASONS), len(WEATHERS), 2, HOURS))
+        self.lookup[sparse] = pooled_keys(sparse_season + 1, sparse_workingday, sparse_hr)
+        factors = weather_factors(season, weathersit, values, pooled_keys(season, workingday, hr))
+        self.scale[sparse] = factors[sparse_season, sparse_weather]
+
+        # Peluang cuaca harian per musim (proporsi jam dengan tiap kode cuaca)
+        weather_counts = np.bincount((season - 1) * len(WEATHERS) + weathersit - 1, minlength=len(SEASONS) * len(WEATHERS))
+        self.weather_counts = weather_counts.reshape(len(SEASONS), len(WEATHERS))
+
+    # Skenario dapat disimulasikan jika semua jamnya memiliki data (setidaknya di sel gabungan)
+    def supports(self, season, workingday):
+        return bool((self.counts[pooled_keys(season, workingday, np.arange(HOURS))] > 0).all())
+
+    def weather_probs(self, season):
+        counts = self.weather_counts[season - 1]
+        return counts / counts.sum()
+
+    def tables(self):
+        return self.values, self.offsets, self.counts, self.lookup, self.scale
+
+
+# Kernel satu batch: permintaan per jam untuk `n_days` hari, lalu puncak per jam, total harian dan jam puncak.
+# Kuantil tiap jam berasal dari faktor normal harian bersama (korelasi rho) ditambah faktor per jam.
+def _simulate_batch(tables, season, workingday, weather_probs, rho, growth, n_days, seed):
+    values, offsets, counts, lookup, scale = tables
+    rng = np.random.default_rng(seed)
+    weather = rng.choice(len(WEATHERS), size=n_days, p=weather_probs) + 1
+    keys = cell_keys(season, weather[:, None], workingday, np.arange(HOURS))
+    cells = lookup[keys]
+    latent = np.sqrt(rho) * rng.standard_normal((n_days, 1)) + np.sqrt(1 - rho) * rng.standard_normal((n_days, HOURS))
+    ranks = np.minimum((special.ndtr(latent) * counts[cells]).astype("int64"), counts[cells] - 1)
+    demand = values[offsets[cells] + ranks] * scale[keys] * growth
+    return demand.max(axis=1), demand.sum(axis=1), demand.argmax(axis=1).astype("int8")
+
+
+# Jumlah proses bawaan: satu proses untuk simulasi kecil, semua CPU (paling banyak `max_workers`) untuk simulasi besar
+def simulation_workers(n_days, max_workers=None):
+    if n_days >= PARALLEL_MIN_DAYS:
+        return min(os.cpu_count() or 1, max_workers or os.cpu_count() or 1)
+    return None
+
+
+# Simulasikan `n_days` hari untuk musim dan hari kerja tertentu. Cuaca tiap hari diambil dari proporsi cuaca
+# musim tersebut di data, atau ditetapkan lewat `weathersit`. `growth` mengalikan permintaan (misalnya 1.1 = +10%).
+# Mengembalikan {"peaks", "totals", "peak_hours"}: permintaan jam tersibuk, total harian dan jam tersibuk tiap hari.
+def simulate(model, season, workingday, weathersit=None, n_days=DEFAULT_DAYS, growth=1.0, seed=0, workers=None, progress=None):
+    if not model.supports(season, workingday):
+        raise ValueError(f"Data tidak memiliki jam untuk musim {season} dan hari kerja {workingday}")
+    if weathersit is None:
+        weather_probs = model.weather_probs(season)
+    else:
+        weather_probs = np.eye(len(WEATHERS))[weathersit - 1]
+
+    sizes = [min(BATCH_DAYS, n_days - start) for start in range(0, n_days, BATCH_DAYS)]
+    seeds = np.random.SeedSequence([seed, season, workingday, weathersit or 0]).spawn(len(sizes))
+    args = [(model.tables(), season, workingday, weather_probs, model.day_correlation, growth, size, child)
+            for size, child in zip(sizes, seeds)]
+    report = progress or (lambda done, total, message: None)
+
+    results = []
+    if not workers or workers <= 1:
+        for done, batch in enumerate(args):
+            report(done, len(args), f"Hari {done * BATCH_DAYS:,} dari {n_days:,}")
+            results.append(_simulate_batch(*batch))
+    else:
+        # Proses spawn (lihat executor.process_pool): simulasi dari dashboard berjalan di thread job latar belakang
+        with process_pool(min(workers, len(args))) as pool:
+            for done, result in enumerate(pool.map(_simulate_batch, *zip(*args))):
+                report(done, len(args), f"Hari {done * BATCH_DAYS:,} dari {n_days:,}")
+                results.append(result)
+    peaks, totals, peak_hours = (np.concatenate(parts) for parts in zip(*results))
+    return {"peaks": peaks, "totals": totals, "peak_hours": peak_hours}
+
+
+# Jumlah sepeda agar semua permintaan terpenuhi pada proporsi hari `service_level`
+def fleet_size(peaks, service_level=DEFAULT_SERVICE_LEVEL, rentals_per_bike=DEFAULT_RENTALS_PER_BIKE):
+    return int(np.ceil(np.quantile(peaks, service_level, method="higher") / rentals_per_bike))
+
+
+# Proporsi hari yang permintaannya terpenuhi untuk tiap jumlah sepeda di `fleets`
+def service_curve(peaks, fleets, rentals_per_bike=DEFAULT_RENTALS_PER_BIKE):
+    sorted_peaks = np.sort(peaks)
+    served = np.searchsorted(sorted_peaks, np.asarray(fleets) * rentals_per_bike, side="right") / len(peaks)
+    return pd.Series(served, index=pd.Index(fleets, name="Jumlah Sepeda"), name="Tingkat Layanan")
+
+
+# Simulasi semua musim x hari kerja yang ada di data (cuaca sesuai proporsi data): {(season, workingday): hasil simulate}
+def simulate_scenarios(model, n_days=DEFAULT_DAYS, growth=1.0, seed=0, workers=None, progress=None):
+    scenarios = [(season, workingday) for season in SEASONS for workingday in (0, 1) if model.supports(season, workingday)]
+    report = progress or (lambda done, total, message: None)
+    results = {}
+    for done, (season, workingday) in enumerate(scenarios):
+        report(done, len(scenarios), f"Musim {season}, hari kerja {workingday}")
+        results[(season, workingday)] = simulate(model, season, workingday, n_days=n_days, growth=growth, seed=seed, workers=workers)
+    return results
+
+
+# Kebutuhan sepeda tiap skenario pada satu tingkat layanan; tingkat layanan lain tidak perlu simulasi ulang
+def fleet_table(results, service_level=DEFAULT_SERVICE_LEVEL, rentals_per_bike=DEFAULT_RENTALS_PER_BIKE):
+    rows = [{
+        "season": season,
+        "workingday": workingday,
+        "mean_peak": result["peaks"].mean(),
+        "mean_total": result["totals"].mean(),
+        "fleet": fleet_size(result["peaks"], service_level, rentals_per_bike),
+        "busiest_hour": int(np.bincount(result["peak_hours"], minlength=HOURS).argmax()),
+    } for (season, workingday), result in results.items()]
+    return pd.DataFrame(rows, columns=["season", "workingday", "mean_peak", "mean_total", "fleet", "busiest_hour"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulasi Monte Carlo kebutuhan jumlah sepeda per musim dan hari kerja")
+    parser.add_argument("csv", nargs="?", default=None, help="CSV per jam (bawaan: Data/hour.csv)")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Jumlah hari simulasi per skenario")
+    parser.add_argument("--service-level", type=float, default=DEFAULT_SERVICE_LEVEL)
+    parser.add_argument("--rentals-per-bike", type=float, default=DEFAULT_RENTALS_PER_BIKE)
+    parser.add_argument("--growth", type=float, default=1.0, help="Pengali permintaan (misalnya 1.1 = +10%%)")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses (bawaan: otomatis dari jumlah hari)")
+    parser.add_argument("--all-years", action="store_true", help="Pakai semua tahun, bukan hanya tahun terakhir")
+    args = parser.parse_args(argv)
+
+    from ingestion import read_bike_file
+    from timeseries import HOUR_CSV
+
+    model = DemandModel(read_bike_file(args.csv or HOUR_CSV), latest_year=not args.all_years)
+    workers = args.workers if args.workers is not None else simulation_workers(args.days)
+    started = time.perf_counter()
+    table = fleet_table(simulate_scenarios(model, args.days, args.growth, workers=workers), args.service_level, args.rentals_per_bike)
+    elapsed = time.perf_counter() - started
+    print(table.round(1).to_string(index=False))
+    print(f"{len(table) * args.days:,} hari disimulasikan dalam {elapsed:.2f} detik "
+          f"({workers or 1} proses, korelasi antar jam {model.day_correlation:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+import sqlite3
+import threading
+import uuid
+import weakref
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregates import CUBE_DIMENSIONS, CUBE_METRICS
+from ingestion import CHUNK_SIZE, compact_schema, read_columns
+
+
+TABLE_NAME = "bike"
+
+# Jumlah baris yang diambil per fetchmany saat membaca sampel
+FETCH_SIZE = 50_000
+
+
+# Backend agregasi SQLite dengan antarmuka yang sama seperti AggregateCube
+# (mean, describe, corr, samples, values, n_rows) sehingga analytics.analyze bisa memakai keduanya.
+# Data disimpan di file database dengan indeks (dimensi, metrik); semua statistik dihitung
+# dengan query sehingga data tidak perlu dimuat utuh ke memori proses.
+class SQLiteCube:
+    def __init__(self, path, dimensions=None, metrics=None):
+        self.path = str(path)
+        with self._connect() as connection:
+            columns = [row[1] for row in connection.execute(f"PRAGMA table_info({TABLE_NAME})")]
+            self.n_rows = connection.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+        self.dimensions = [col for col in (dimensions or CUBE_DIMENSIONS) if col in columns]
+        self.metrics = [col for col in (metrics or CUBE_METRICS) if col in columns]
+        if not self.dimensions or not self.metrics:
+            raise ValueError("Data tidak memiliki kolom dimensi atau metrik untuk cube")
+        self.values = _ColumnValues(self)
+
+    # Koneksi baru per operasi (ditutup setelahnya) agar aman dipakai dari beberapa thread Streamlit
+    def _connect(self):
+        return closing(sqlite3.connect(self.path))
+
+    @classmethod
+    def from_frame(cls, df, path, dimensions=None, metrics=None):
+        tmp = _temporary_path(path)
+        with closing(sqlite3.connect(tmp)) as connection:
+            for start in range(0, len(df), CHUNK_SIZE):
+                _append(connection, df.iloc[start:start + CHUNK_SIZE])
+            _create_indexes(connection, df.columns, dimensions, metrics)
+            connection.commit()
+        tmp.replace(path)
+        return cls(path, dimensions, metrics)
+
+    # Cube di file database sementara: file yang sudah ada dipakai ulang, dan dihapus saat cube terakhir
+    # yang memakainya dibuang garbage collector (misalnya setelah keluar dari cache dashboard) atau saat proses berhenti.
+    # Jumlah pemakai dihitung per proses, jadi `path` sebaiknya unik per proses (lihat views/results.py).
+    # `source` berupa DataFrame atau fungsi tanpa argumen yang mengembalikannya; fungsi hanya dipanggil
+    # jika database belum ada, sehingga data tidak perlu dimuat untuk memakai ulang database.
+    @classmethod
+    def temporary(cls, source, path, dimensions=None, metrics=None):
+        path = Path(path)
+        with _temporary_lock:
+            reuse = path.exists()
+            _temporary_refs[str(path)] = _temporary_refs.get(str(path), 0) + 1
+        try:
+            if reuse:
+                cube = cls(path, dimensions, metrics)
+            else:
+                cube = cls.from_frame(source() if callable(source) else source, path, dimensions, metrics)
+        except BaseException:
+            _release_temporary(str(path))
+            raise
+        weakref.finalize(cube, _release_temporary, str(path))
+        return cube
+
+    # Muat CSV per potongan langsung ke database tanpa menggabungkannya di memori
+    @classmethod
+    def from_csv(cls, csv_path, path, dimensions=None, metrics=None, chunksize=CHUNK_SIZE):
+        tmp = _temporary_path(path)
+        dtype = compact_schema(read_columns(csv_path))
+        dtype.pop("dteday", None)
+        with closing(sqlite3.connect(tmp)) as connection:
+            columns = []
+            for chunk in pd.read_csv(csv_path, dtype=dtype, chunksize=chunksize):
+                _append(connection, chunk)
+                columns = chunk.columns
+            _create_indexes(connection, columns, dimensions, metrics)
+            connection.commit()
+        tmp.replace(path)
+        return cls(path, dimensions, metrics)
+
+    def _where(self, filters):
+        for dim in filters:
+            if dim not in self.dimensions:
+                raise KeyError(f"Dimensi tidak dikenal: {dim}")
+        clause = " AND ".join(f"{dim} = ?" for dim in filters)
+        return (f" WHERE {clause}" if clause else ""), [_sql_value(value) for value in filters.values()]
+
+    # Sampel nilai metrik untuk satu kombinasi dimensi, urut seperti data asal (rowid)
+    def samples(self, metric, **filters):
+        where, params = self._where(filters)
+        with self._connect() as connection:
+            cursor = connection.execute(f"SELECT {metric} FROM {TABLE_NAME}{where} ORDER BY rowid", params)
+            chunks = []
+            while rows := cursor.fetchmany(FETCH_SIZE):
+                chunks.append(np.array(rows, dtype="float64")[:, 0])
+        return np.concatenate(chunks) if chunks else np.empty(0)
+
+    # Rangkuman per kategori dimensi dalam format yang sama dengan AggregateCube.marginal,
+    # ditambah jumlah nilai tidak kosong per metrik (`{metric}_count`, seperti pandas yang melewati NaN)
+    def marginal(self, dims):
+        dims = [dims] if isinstance(dims, str) else list(dims)
+        group = ", ".join(dims)
+        selects = ["COUNT(*) AS count"]
+        for metric in self.metrics:
+            selects += [f"COUNT({metric}) AS {metric}_count", f"SUM({metric}) AS {metric}_sum", f"SUM(1.0 * {metric} * {metric}) AS {metric}_sumsq",
+                        f"MIN({metric}) AS {metric}_min", f"MAX({metric}) AS {metric}_max"]
+        query = f"SELECT {group}, {', '.join(selects)} FROM {TABLE_NAME} GROUP BY {group} ORDER BY {group}"
+        with self._connect() as connection:
+            return pd.read_sql_query(query, connection).set_index(dims)
+
+    def mean(self, dim, metric):
+        table = self.marginal(dim)
+        return (table[f"{metric}_sum"] / table[f"{metric}_count"]).rename(metric)
+
+    # Kuartil dengan interpolasi linear (sama dengan np.quantile) dari indeks (dimensi, metrik):
+    # cukup dua nilai di sekitar posisi kuantil per kelompok. `count` adalah jumlah nilai tidak kosong;
+    # NULL (diurutkan paling awal oleh SQLite) tidak ikut dihitung.
+    def _quantile(self, connection, dim, value, metric, count, q):
+        if count == 0:
+            return np.nan
+        position = (count - 1) * q
+        lower = int(np.floor(position))
+        rows = connection.execute(
+            f"SELECT {metric} FROM {TABLE_NAME} WHERE {dim} = ? AND {metric} IS NOT NULL ORDER BY {metric} LIMIT 2 OFFSET ?",
+            (_sql_value(value), lower)).fetchall()
+        if len(rows) == 1 or position == lower:
+            return float(rows[0][0])
+        return rows[0][0] + (rows[1][0] - rows[0][0]) * (position - lower)
+
+    def describe(self, dim, metric):
+        table = self.marginal(dim)
+        count = table[f"{metric}_count"].astype("float64")
+        total = table[f"{metric}_sum"].astype("float64")
+        variance = (table[f"{metric}_sumsq"] - total * total / count) / (count - 1)
+
+        with self._connect() as connection:
+            quartiles = np.array([[self._quantile(connection, dim, value, metric, int(n), q) for q in (0.25, 0.5, 0.75)]
+                                  for value, n in zip(table.index, table[f"{metric}_count"])]).reshape(-1, 3)
+
+        return pd.DataFrame({
+            "count": count,
+            "mean": total / count,
+            "std": np.sqrt(variance.clip(lower=0)),
+            "min": table[f"{metric}_min"].astype("float64"),
+            "25%": quartiles[:, 0],
+            "50%": quartiles[:, 1],
+            "75%": quartiles[:, 2],
+            "max": table[f"{metric}_max"].astype("float64"),
+        }, index=table.index)
+
+    # Korelasi Pearson dari Σx, Σx² dan Σxy yang dihitung dalam satu query
+    def corr(self, columns):
+        sums = [f"SUM(1.0 * {col})" for col in columns]
+        cross = [f"SUM(1.0 * {left} * {right})" for left in columns for right in columns]
+        with self._connect() as connection:
+            row = connection.execute(f"SELECT COUNT(*), {', '.join(sums + cross)} FROM {TABLE_NAME}").fetchone()
+        n = float(row[0])
+        k = len(columns)
+        sums = np.array(row[1:1 + k], dtype="float64")
+        cross = np.array(row[1 + k:], dtype="float64").reshape(k, k)
+        covariance = n * cross - np.outer(sums, sums)
+        scale = np.sqrt(np.diag(covariance))
+        return pd.DataFrame(covariance / np.outer(scale, scale), index=columns, columns=columns)
+
+
+# Akses kolom metrik penuh (cube.values["cnt"]) yang dibaca dari database saat dibutuhkan
+class _ColumnValues:
+    def __init__(self, cube):
+        self.cube = cube
+
+    def __getitem__(self, metric):
+        if metric not in self.cube.metrics:
+            raise KeyError(metric)
+        return self.cube.samples(metric)
+
+    def __contains__(self, metric):
+        return metric in self.cube.metrics
+
+
+# Database ditulis ke file sementara lalu di-rename, sehingga file di `path` selalu lengkap
+# Nama file sementara unik agar dua thread yang membangun database yang sama tidak saling menimpa
+def _temporary_path(path):
+    tmp = Path(path).with_name(f"{Path(path).name}.{uuid.uuid4().hex}.tmp")
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    return tmp
+
+
+# Jumlah cube hidup per file database sementara (lihat SQLiteCube.temporary)
+_temporary_refs = {}
+_temporary_lock = threading.Lock()
+
+
+def _release_temporary(path):
+    with _temporary_lock:
+        _temporary_refs[path] -= 1
+        if _temporary_refs[path] > 0:
+            return
+        del _temporary_refs[path]
+        Path(path).unlink(missing_ok=True)
+
+
+def _sql_value(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# Tambahkan potongan data ke tabel; kolom tanggal disimpan sebagai teks ISO
+def _append(connection, chunk):
+    chunk = chunk.copy()
+    for col in chunk.columns:
+        if isinstance(chunk[col].dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(chunk[col]):
+            chunk[col] = chunk[col].astype(str)
+    chunk.to_sql(TABLE_NAME, connection, if_exists="append", index=False)
+
+
+# Satu indeks (dimensi, metrik utama) per dimensi: filter, GROUP BY dan kuartil metrik utama
+# (cnt) cukup memindai indeks
+def _create_indexes(connection, columns, dimensions=None, metrics=None):
+    dimensions = [col for col in (dimensions or CUBE_DIMENSIONS) if col in columns]
+    metrics = [col for col in (metrics or CUBE_METRICS) if col in columns]
+    for dim in dimensions:
+        connection.execute(f"CREATE INDEX IF NOT EXISTS idx_{dim} ON {TABLE_NAME} ({dim}, {metrics[0]})")
+    connection.execute("ANALYZE")
@@ -0,0 +1,172 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+# Hasil benchmark startup (satu baris JSON per halaman per run)
+STARTUP_FILE = Path(__file__).resolve().parent.parent / "reports" / "startup.jsonl"
+
+DASHBOARD = Path(__file__).resolve().parent / "dashboard.py"
+DAY_CSV = Path(__file__).resolve().parent.parent / "Data" / "day.csv"
+
+# Halaman yang membutuhkan data sesi (data unggahan dan data bersih) sebelum dirender
+DATA_PAGES = {"views.assessing", "views.cleaning", "views.initial_analysis", "views.clustering",
+              "views.time_series", "views.correlation_anova"}
+
+# Pustaka berat yang dicatat saat pertama kali dimuat oleh sebuah halaman
+HEAVY_MODULES = ["pandas", "numpy", "scipy", "matplotlib", "seaborn", "pyarrow"]
+
+RENDER_TIMEOUT = 300
+
+
+# Data contoh untuk halaman yang membutuhkan data: day.csv mentah dan hasil pembersihannya (mode bawaan),
+# disimpan sebagai pickle agar proses anak cukup memuat pandas untuk membacanya
+def prepare_data(directory):
+    from analytics import CLEANING_MODES, clean_dataset
+    from fingerprint import fingerprint_file
+    from ingestion import read_bike_file
+    from pipeline import clean_fingerprint
+
+    df = read_bike_file(DAY_CSV)
+    mode = next(iter(CLEANING_MODES.values()))
+    fingerprint = fingerprint_file(DAY_CSV)
+    df.to_pickle(Path(directory) / "df.pkl")
+    clean_dataset(df, mode=mode).to_pickle(Path(directory) / "df_clean.pkl")
+    meta = {"df_fingerprint": fingerprint, "df_clean_fingerprint": clean_fingerprint(fingerprint, mode=mode)}
+    (Path(directory) / "meta.json").write_text(json.dumps(meta))
+
+
+# Ukur satu halaman di proses baru (dijalankan oleh proses induk dengan --child):
+#   import_streamlit_ms : waktu impor streamlit
+#   seed_ms             : waktu menyiapkan data sesi (pandas + baca pickle), hanya halaman berdata
+#   first_render_ms     : rerun pertama (impor modul halaman + render), sama seperti sesi baru di server baru
+#   page_import_ms      : bagian first_render_ms untuk mengimpor modul halaman
+#   complete_ms         : sampai hasil analisis latar belakang tampil (sama dengan first_render_ms jika tanpa job)
+#   warm_render_ms      : rerun berikutnya, modul dan cache sudah hangat
+def measure_page(menu, page, data_dir=None):
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    import_streamlit_ms = (time.perf_counter() - started) * 1000
+
+    sys.path.insert(0, str(DASHBOARD.parent))
+    from views import PAGES
+    from views.common import JOB_POLL_SECONDS
+
+    module_name = PAGES[menu][page]
+    # State awal sesi sama seperti dashboard.py; halaman berdata mendapat handle ke store
+    session = {"df_handle": None, "df_clean_handle": None, "df_fingerprint": None, "df_clean_fingerprint": None,
+               "upload_fingerprint": None, "df_columnar": None, "incremental_handle": None, "appended": [],
+               "clean_params": None}
+    started = time.perf_counter()
+    if data_dir is not None and module_name in DATA_PAGES:
+        import pandas as pd
+        from views.common import shared_store
+
+        data_dir = Path(data_dir)
+        meta = json.loads((data_dir / "meta.json").read_text())
+        for name in ["df", "df_clean"]:
+            fingerprint = meta[f"{name}_fingerprint"]
+            session[f"{name}_handle"] = shared_store().put(fingerprint, pd.read_pickle(data_dir / f"{name}.pkl"))
+            session[f"{name}_fingerprint"] = fingerprint
+    seed_ms = (time.perf_counter() - started) * 1000
+
+    app = AppTest.from_file(str(DASHBOARD), default_timeout=RENDER_TIMEOUT)
+    app.query_params["menu"] = menu
+    if page is not None:
+        app.query_params["page"] = page
+    for key, value in session.items():
+        app.session_state[key] = value
+    loaded_before = set(sys.modules)
+
+    started = time.perf_counter()
+    app.run()
+    first_render_ms = (time.perf_counter() - started) * 1000
+    if app.exception:
+        raise RuntimeError(f"{menu} / {page}: {app.exception[0].value}")
+    records = app.session_state["recorder"].records
+    page_import_ms = sum(record["wall_ms"] for record in records if record["stage"].startswith("import "))
+
+    # Selama job latar belakang berjalan halaman menampilkan progres dengan tombol "Batalkan"
+    complete_ms = first_render_ms
+    while any(button.label == "Batalkan" for button in app.button):
+        time.sleep(JOB_POLL_SECONDS)
+        app.run()
+        complete_ms = (time.perf_counter() - started) * 1000
+    loaded = set(sys.modules) - loaded_before
+
+    started = time.perf_counter()
+    app.run()
+    warm_render_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "menu": menu,
+        "page": page,
+        "module": module_name,
+        "import_streamlit_ms": round(import_streamlit_ms, 1),
+        "seed_ms": round(seed_ms, 1),
+        "first_render_ms": round(first_render_ms, 1),
+        "page_import_ms": round(page_import_ms, 1),
+        "complete_ms": round(complete_ms, 1),
+        "warm_render_ms": round(warm_render_ms, 1),
+        "new_modules": len(loaded),
+        "heavy_modules": [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def run_child(menu, page, data_dir):
+    command = [sys.executable, __file__, "--child", menu, page or "", data_dir]
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=DASHBOARD.parent)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "proses anak gagal")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ukur waktu startup dashboard dan waktu render pertama tiap halaman")
+    parser.add_argument("--pages", nargs="+", help="Modul halaman yang diukur (misalnya views.conclusion); bawaan semua halaman")
+    parser.add_argument("--repeat", type=int, default=1, help="Jumlah proses baru per halaman (waktu terbaik yang dicatat)")
+    parser.add_argument("-o", "--output", default=str(STARTUP_FILE), help="File JSON lines untuk menyimpan hasil")
+    parser.add_argument("--child", nargs=3, metavar=("MENU", "PAGE", "DATA_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        menu, page, data_dir = args.child
+        print(json.dumps(measure_page(menu, page or None, data_dir)))
+        return 0
+
+    from views import PAGES
+
+    pages = [(menu, page, module) for menu, sub_menus in PAGES.items() for page, module in sub_menus.items()
+             if args.pages is None or module in args.pages]
+    run = {
+        "run": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as tmp, open(output, "a") as log:
+        if any(module in DATA_PAGES for _, _, module in pages):
+            prepare_data(tmp)
+        for menu, page, module in pages:
+            measurements = [run_child(menu, page, tmp) for _ in range(args.repeat)]
+            record = dict(run, **min(measurements, key=lambda result: result["first_render_ms"]))
+            log.write(json.dumps(record) + "\n")
+            log.flush()
+            heavy = ", ".join(record["heavy_modules"]) or "-"
+            seed = f", data {record['seed_ms']:.0f} ms" if record["seed_ms"] >= 1 else ""
+            complete = f", hasil lengkap {record['complete_ms']:.0f} ms" if record["complete_ms"] > record["first_render_ms"] else ""
+            print(f"{module}: render pertama {record['first_render_ms']:.0f} ms (impor halaman {record['page_import_ms']:.0f} ms{seed}){complete}, "
+                  f"render hangat {record['warm_render_ms']:.0f} ms, streamlit {record['import_streamlit_ms']:.0f} ms, "
+                  f"{record['new_modules']} modul baru [{heavy}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fingerprint import fingerprint_file
+from ingestion import read_bike_csv_chunked, read_columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional; tanpa pyarrow dipakai format kolom .npy
+    pa = None
+    pq = None
+
+
+HAS_PYARROW = pq is not None
+
+# Folder data proyek dan lokasi bawaan salinan kolumnar dari file CSV di dalamnya
+DATA_DIR = Path(__file__).resolve().parent.parent / "Data"
+STORE_DIR = DATA_DIR / "columnar"
+
+# Salinan kolumnar data unggahan dashboard, satu file per sidik jari isi file (lihat store_frame)
+UPLOAD_DIR = Path(os.environ.get("DASHBOARD_UPLOAD_DIR", Path(tempfile.gettempdir()) / "bike_dashboard" / "uploads"))
+
+# Jumlah baris per row group; statistik min/max per row group dipakai untuk melewati baris
+ROW_GROUP_SIZE = 100_000
+
+META_NAME = "meta.json"
+
+# Operator filter baris, format sama dengan filter pyarrow: [("season", "==", 1), ("hr", "in", [7, 8])]
+FILTER_OPERATORS = {
+    "==": lambda values, value: values == value,
+    "!=": lambda values, value: values != value,
+    "<": lambda values, value: values < value,
+    "<=": lambda values, value: values <= value,
+    ">": lambda values, value: values > value,
+    ">=": lambda values, value: values >= value,
+    "in": lambda values, value: np.isin(values, list(value)),
+}
+
+
+def default_format():
+    return "parquet" if HAS_PYARROW else "npy"
+
+
+def _suffix(fmt):
+    return ".parquet" if (fmt or default_format()) == "parquet" else ".cols"
+
+
+# Path salinan kolumnar untuk sebuah file CSV
+def columnar_path(csv_path, store_dir=STORE_DIR, fmt=None):
+    return Path(store_dir) / f"{Path(csv_path).stem}{_suffix(fmt)}"
+
+
+# Identitas file sumber: ukuran dan waktu modifikasi untuk cek cepat, sidik jari untuk kepastian
+def _source_info(csv_path):
+    stat = os.stat(csv_path)
+    return {"source": str(csv_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# Konversi CSV ke format kolumnar sekali. Kolom cuaca float32, tanggal sebagai kategori
+# dan kode sebagai int8 (skema ringkas yang sama dengan loader bertahap).
+def convert(csv_path, store_dir=STORE_DIR, fmt=None):
+    target = columnar_path(csv_path, store_dir, fmt)
+    df = read_bike_csv_chunked(csv_path)
+    write_frame(df, target, dict(_source_info(csv_path), fingerprint=fingerprint_file(csv_path)), fmt)
+    return target
+
+
+# Salinan kolumnar DataFrame yang sudah di-parse (data unggahan), dengan nama sidik jari isinya.
+# Isi file dengan sidik jari yang sama tidak pernah berubah, jadi file yang sudah ada dipakai ulang.
+def store_frame(df, fingerprint, store_dir=UPLOAD_DIR, fmt=None):
+    target = Path(store_dir) / f"{fingerprint}{_suffix(fmt)}"
+    if not target.exists():
+        write_frame(df, target, {"fingerprint": fingerprint}, fmt)
+    return target
+
+
+# Tulis DataFrame ke `target` (Parquet atau folder .npy) beserta info sumbernya
+def write_frame(df, target, info, fmt=None):
+    fmt = fmt or default_format()
+    if fmt == "parquet" and not HAS_PYARROW:
+        raise ImportError("Format parquet membutuhkan pyarrow")
+
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"bike_source": json.dumps(info).encode()})
+        # Ditulis ke file sementara di folder yang sama lalu diganti secara atomik (seperti format .npy),
+        # sehingga pembaca bersamaan atau proses yang berhenti di tengah tidak meninggalkan file terpotong
+        tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            pq.write_table(table, tmp, row_group_size=ROW_GROUP_SIZE)
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return target
+
+    _write_npy_store(df, target, info)
+    return target
+
+
+# Format .npy: satu file per kolom (bisa di-memory-map) ditambah meta.json berisi tipe,
+# kategori tanggal dan statistik min/max per row group. Kolom teks disimpan sebagai kategori.
+# Folder ditulis dengan nama sementara yang unik lalu di-rename; penulis lain yang lebih dulu
+# selesai tidak ditimpa sebagian.
+def _write_npy_store(df, target, info):
+    tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+    tmp.mkdir(parents=True)
+    try:
+        _write_npy_columns(df, tmp, info)
+        shutil.rmtree(target, ignore_errors=True)
+        try:
+            tmp.rename(target)
+        except OSError:
+            # Penulis lain baru saja menulis folder yang sama
+            if not target.exists():
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _write_npy_columns(df, folder, info):
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            values = values.astype("category")
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            columns[col] = {"dtype": "category", "categories": values.cat.categories.astype(str).tolist()}
+            values = values.cat.codes
+        else:
+            columns[col] = {"dtype": str(values.dtype)}
+        np.save(folder / f"{col}.npy", values.to_numpy())
+
+    row_groups = []
+    for start in range(0, len(df), ROW_GROUP_SIZE):
+        stop = min(start + ROW_GROUP_SIZE, len(df))
+        stats = {}
+        for col, spec in columns.items():
+            if spec["dtype"] != "category":
+                chunk = df[col].to_numpy()[start:stop]
+                stats[col] = [np.nanmin(chunk).item(), np.nanmax(chunk).item()]
+        row_groups.append({"start": start, "stop": stop, "stats": stats})
+
+    meta = dict(info, rows=len(df), columns=columns, row_groups=row_groups)
+    (folder / META_NAME).write_text(json.dumps(meta))
+
+
+# Nama kolom salinan kolumnar, tanpa membaca datanya
+def table_columns(path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pq.read_schema(path).names
+    return list(json.loads((path / META_NAME).read_text())["columns"])
+
+
+def _read_source_info(path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        metadata = pq.read_schema(path).metadata or {}
+        return json.loads(metadata.get(b"bike_source", b"{}"))
+    return json.loads((path / META_NAME).read_text())
+
+
+# Salinan kolumnar yang masih sesuai dengan CSV sumber; dikonversi ulang jika CSV berubah
+def ensure_columnar(csv_path, store_dir=STORE_DIR, fmt=None):
+    target = columnar_path(csv_path, store_dir, fmt)
+    if target.exists():
+        stored = _read_source_info(target)
+        current = _source_info(csv_path)
+        if stored.get("size") == current["size"] and stored.get("mtime_ns") == current["mtime_ns"]:
+            return target
+        if stored.get("fingerprint") == fingerprint_file(csv_path):
+            return target
+    return convert(csv_path, store_dir, fmt)
+
+
+# Row group yang mungkin berisi baris sesuai filter (berdasarkan statistik min/max)
+def _group_may_match(stats, filters):
+    for col, op, value in filters:
+        if col not in stats:
+            continue
+        low, high = stats[col]
+        if op == "==" and not low <= value <= high:
+            return False
+        if op == "in" and not any(low <= item <= high for item in value):
+            return False
+        if op == "<" and not low < value:
+            return False
+        if op == "<=" and not low <= value:
+            return False
+        if op == ">" and not high > value:
+            return False
+        if op == ">=" and not high >= value:
+            return False
+    return True
+
+
+# Mask filter untuk satu potongan kolom; kolom kategori dibandingkan lewat label kategorinya
+def _filter_mask(spec, values, op, value):
+    if spec["dtype"] == "category":
+        matches = FILTER_OPERATORS[op](np.array(spec["categories"], dtype=object), value)
+        return np.append(matches, False)[values]  # kode -1 (kosong) tidak pernah cocok
+    return FILTER_OPERATORS[op](values, value)
+
+
+def _read_npy_store(path, columns, filters, memory_map):
+    path = Path(path)
+    meta = json.loads((path / META_NAME).read_text())
+    columns = list(columns or meta["columns"])
+    mmap_mode = "r" if memory_map else None
+    arrays = {col: np.load(path / f"{col}.npy", mmap_mode=mmap_mode) for col in set(columns) | {f[0] for f in filters or []}}
+
+    if filters:
+        groups = [g for g in meta["row_groups"] if _group_may_match(g["stats"], filters)]
+        positions = []
+        for group in groups:
+            mask = np.ones(group["stop"] - group["start"], dtype=bool)
+            for col, op, value in filters:
+                mask &= _filter_mask(meta["columns"][col], arrays[col][group["start"]:group["stop"]], op, value)
+            positions.append(np.flatnonzero(mask) + group["start"])
+        rows = np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+        arrays = {col: arrays[col][rows] for col in columns}
+
+    data = {}
+    for col in columns:
+        spec = meta["columns"][col]
+        if spec["dtype"] == "category":
+            data[col] = pd.Categorical.from_codes(np.asarray(arrays[col]), categories=spec["categories"])
+        else:
+            data[col] = arrays[col]
+    # Kolom di-memory-map sehingga hanya halaman file milik kolom/baris terpilih yang dibaca
+    return pd.DataFrame(data, columns=columns)
+
+
+# Baca hanya kolom dan row group yang dibutuhkan dari salinan kolumnar
+def read_table(path, columns=None, filters=None, memory_map=True):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        if not HAS_PYARROW:
+            raise ImportError("Membaca file parquet membutuhkan pyarrow")
+        table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=memory_map)
+        return table.to_pandas()
+    return _read_npy_store(path, columns, filters, memory_map)
+
+
+# Nama kolom sumber data halaman: DataFrame, salinan kolumnar atau file CSV
+def source_columns(source):
+    if isinstance(source, pd.DataFrame):
+        return list(source.columns)
+    if Path(source).suffix == ".csv":
+        return read_columns(source)
+    return table_columns(source)
+
+
+# Kolom `columns` yang ada di sumber data halaman; kolom lain tidak dibaca dari disk (salinan kolumnar,
+# misalnya data unggahan lewat store_frame, atau CSV lewat load_columns) dan tidak ikut disimpan di cache halaman
+def read_source(source, columns):
+    available = set(source_columns(source))
+    columns = [col for col in columns if col in available]
+    if isinstance(source, pd.DataFrame):
+        return source[columns]
+    if Path(source).suffix == ".csv":
+        return load_columns(source, columns=columns)
+    return read_table(source, columns=columns)
+
+
+# Konversi (jika perlu) lalu baca sebuah CSV dengan pemangkasan kolom dan baris.
+# Jika folder salinan tidak bisa ditulis (misalnya deployment read-only), CSV dibaca langsung.
+def load_columns(csv_path, columns=None, filters=None, store_dir=STORE_DIR):
+    try:
+        path = ensure_columnar(csv_path, store_dir)
+    except OSError:
+        df = read_bike_csv_chunked(csv_path)
+        for col, op, value in filters or []:
+            df = df[FILTER_OPERATORS[op](df[col].astype(str) if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col], value)]
+        return df[columns or df.columns].reset_index(drop=True)
+    return read_table(path, columns=columns, filters=filters)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi CSV Bike Sharing ke format kolumnar")
+    parser.add_argument("inputs", nargs="*", default=[str(path) for path in sorted(DATA_DIR.glob("*.csv"))],
+                        help="File CSV (bawaan: semua CSV di Data/)")
+    parser.add_argument("-o", "--output", default=str(STORE_DIR), help="Folder tujuan (bawaan: Data/columnar/)")
+    parser.add_argument("--format", choices=["parquet", "npy"], default=default_format())
+    args = parser.parse_args(argv)
+
+    for csv_path in args.inputs:
+        target = convert(csv_path, args.output, args.format)
+        print(f"{csv_path} -> {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from ingestion import BIKE_SCHEMA, WEATHER_COLUMNS, read_bike_file
+from timeseries import DATA_DIR
+
+
+# Dataset sumber untuk data sintetis
+SOURCES = {"day": DATA_DIR / "day.csv", "hour": DATA_DIR / "hour.csv"}
+
+# Deviasi standar noise: relatif untuk jumlah penyewaan, absolut untuk kolom cuaca (skala 0-1)
+COUNT_NOISE = 0.1
+WEATHER_NOISE = 0.02
+
+
+# Data sintetis sebesar `scale` kali dataset asli dengan skema dan distribusi yang sama.
+# Baris asli diulang per salinan; tiap salinan digeser sejumlah minggu penuh agar kolom
+# weekday tetap cocok dengan tanggal, lalu kolom cuaca dan jumlah penyewaan diberi noise
+# sehingga nilainya tidak sekadar duplikat. Kolom kode (musim, cuaca, dst.) tidak diubah.
+def generate(source, scale=1, seed=0):
+    base = read_bike_file(SOURCES.get(source, source))
+    # Skala 1 adalah data asli tanpa noise
+    if scale == 1:
+        return base
+    rng = np.random.default_rng(seed)
+    n = len(base)
+    copy = np.repeat(np.arange(scale), n)
+
+    df = pd.DataFrame({col: np.tile(base[col].to_numpy(), scale) for col in base.columns})
+
+    if "dteday" in df.columns:
+        # Format teks hanya dibuat untuk tiap tanggal unik per salinan, lalu disebar lewat kode
+        codes, uniques = pd.factorize(base["dteday"])
+        dates = pd.to_datetime(uniques)
+        period = ((dates.max() - dates.min()).days // 7 + 1) * 7
+        offsets = (np.arange(scale) * period).astype("timedelta64[D]")
+        shifted = dates.to_numpy()[None, :] + offsets[:, None]
+        labels = pd.DatetimeIndex(shifted.ravel()).strftime("%Y-%m-%d").to_numpy()
+        df["dteday"] = labels[copy * len(uniques) + np.tile(codes, scale)]
+    if "instant" in df.columns:
+        df["instant"] = np.arange(1, len(df) + 1, dtype="int32")
+
+    for col in WEATHER_COLUMNS:
+        if col in df.columns:
+            noise = rng.normal(0, WEATHER_NOISE, len(df))
+            df[col] = np.clip(df[col].to_numpy() + noise, 0, 1).round(6)
+
+    # cnt selalu casual + registered seperti pada data asli
+    for col in ["casual", "registered"]:
+        if col in df.columns:
+            noise = rng.normal(1, COUNT_NOISE, len(df))
+            df[col] = np.maximum(np.rint(df[col].to_numpy() * noise), 0).astype(BIKE_SCHEMA[col])
+    if {"casual", "registered", "cnt"} <= set(df.columns):
+        df["cnt"] = (df["casual"] + df["registered"]).astype(BIKE_SCHEMA["cnt"])
+    return df
+
+
+# Tulis data sintetis ke CSV dengan format yang sama seperti Data/*.csv
+def write_csv(df, path):
+    df.to_csv(path, index=False)
+    return path
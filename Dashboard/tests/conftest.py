@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Modul dashboard diimpor langsung dari folder Dashboard/, sama seperti saat streamlit run Dashboard/dashboard.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+# Folder Data/ berisi day.csv dan hour.csv asli
+@pytest.fixture
+def data_dir():
+    return Path(__file__).resolve().parents[2] / "Data"
+
+
+# Data sintetis harian (kode kategori int8, cuaca, jumlah penyewaan) sebanyak n baris
+def day_frame(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "season": rng.integers(1, 5, n).astype("int8"),
+        "weathersit": rng.integers(1, 4, n).astype("int8"),
+        "workingday": rng.integers(0, 2, n).astype("int8"),
+        "temp": rng.random(n),
+        "hum": rng.random(n),
+        "casual": rng.integers(0, 3000, n),
+        "registered": rng.integers(0, 7000, n),
+        "cnt": rng.lognormal(8, 0.5, n).round(),
+    })
+
+
+@pytest.fixture
+def make_day_frame():
+    return day_frame
+
+# Data sintetis per jam (dteday, hr, kalender, cuaca, jumlah penyewaan) selama n_days hari
+def hour_frame(n_days=400, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2012-01-01", periods=n_days, freq="D")
+    df = pd.DataFrame({"dteday": np.repeat(days.strftime("%Y-%m-%d"), 24), "hr": np.tile(np.arange(24), n_days)})
+    df["season"] = (days.month.to_numpy().repeat(24) - 1) // 3 + 1
+    df["weekday"] = ((days.dayofweek.to_numpy() + 1) % 7).repeat(24)
+    df["workingday"] = (days.dayofweek.to_numpy().repeat(24) < 5).astype("int8")
+    df["weathersit"] = rng.integers(1, 4, len(df))
+    df["yr"] = 1
+    df["casual"] = rng.poisson(10 + 40 * np.sin(np.pi * df["hr"] / 24))
+    df["registered"] = rng.poisson(40 + 160 * np.sin(np.pi * df["hr"] / 24))
+    df["cnt"] = df["casual"] + df["registered"]
+    return df
+
+
+@pytest.fixture
+def make_hour_frame():
+    return hour_frame
+
+
+# Dashboard lengkap di AppTest (satu sesi baru per test)
+@pytest.fixture
+def dashboard_app():
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(str(Path(__file__).resolve().parents[1] / "dashboard.py"), default_timeout=300)
+
+
+# File unggahan per kunci widget st.file_uploader (None = uploader utama di Data Gathering)
+@pytest.fixture
+def uploads(monkeypatch):
+    import streamlit as st
+
+    files = {}
+    monkeypatch.setattr(st, "file_uploader", lambda *args, key=None, **kwargs: files.get(key))
+    return files
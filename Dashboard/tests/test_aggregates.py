@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateCube
+
+
+# Kolom dimensi bertipe int8 seperti hasil ingestion; hr * hr * count melebihi batas int8
+def test_corr_matches_pandas_on_int8_dimensions():
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame({
+        "season": rng.integers(1, 5, n).astype("int8"),
+        "weathersit": rng.integers(1, 4, n).astype("int8"),
+        "workingday": rng.integers(0, 2, n).astype("int8"),
+        "holiday": rng.integers(0, 2, n).astype("int8"),
+        "mnth": rng.integers(1, 13, n).astype("int8"),
+        "yr": rng.integers(0, 2, n).astype("int8"),
+        "hr": rng.integers(0, 24, n).astype("int8"),
+        "casual": rng.integers(0, 400, n).astype("int32"),
+        "registered": rng.integers(0, 900, n).astype("int32"),
+    })
+    df["cnt"] = df["casual"] + df["registered"] + df["hr"].astype("int32") * 10
+
+    columns = ["hr", "mnth", "season", "cnt"]
+    cube = AggregateCube(df)
+    expected = df[columns].astype("float64").corr()
+    np.testing.assert_allclose(cube.corr(columns).to_numpy(), expected.to_numpy(), atol=1e-9)
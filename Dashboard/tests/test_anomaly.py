@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from anomaly import DEFAULT_WINDOW, StreamingDetector, baseline_keys, detect_anomalies
+
+
+# Baseline = median `window` pengamatan sebelumnya pada deret musim x hari x jam yang sama
+def test_baseline_matches_grouped_rolling_median(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    result = detect_anomalies(df)
+
+    expected = df.groupby(baseline_keys(df))["cnt"].transform(
+        lambda s: s.shift().rolling(DEFAULT_WINDOW, min_periods=4).median())
+    np.testing.assert_allclose(result["baseline"].to_numpy(), expected.to_numpy())
+    assert result["anomaly"].sum() > 0
+
+
+# Lonjakan yang disisipkan terdeteksi sebagai anomali arah naik
+def test_injected_spike_detected(make_hour_frame):
+    df = make_hour_frame()
+    spike = len(df) - 24 * 7 + 12
+    df.loc[spike, "cnt"] *= 10
+    result = detect_anomalies(df).iloc[spike]
+    assert result["anomaly"] and result["direction"] == "Lonjakan"
+
+
+# Detektor streaming yang dipanaskan dengan data lama memberi skor yang sama dengan deteksi batch
+def test_streaming_matches_batch(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    split = 12_000
+    expected = detect_anomalies(df).iloc[split:]
+
+    detector = StreamingDetector().warm(df.iloc[:split])
+    scored = pd.concat([detector.score(df.iloc[start:start + 1000]) for start in range(split, len(df), 1000)])
+    assert detector.n_seen == len(df)
+    np.testing.assert_allclose(scored["baseline"].to_numpy(), expected["baseline"].to_numpy())
+    np.testing.assert_allclose(scored["score"].to_numpy(), expected["score"].to_numpy())
+    np.testing.assert_array_equal(scored["anomaly"].to_numpy(), expected["anomaly"].to_numpy())
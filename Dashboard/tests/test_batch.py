@@ -0,0 +1,25 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+import batch
+from artifacts import report_index
+
+
+# File bernama sama dari folder berbeda mendapat folder laporan sendiri; isi yang sama hanya diproses sekali
+def test_same_stem_reports_do_not_collide(data_dir, tmp_path, capsys):
+    day = pd.read_csv(data_dir / "day.csv")
+    for folder, rows in (("a", day.iloc[:365]), ("b", day.iloc[365:])):
+        (tmp_path / folder).mkdir()
+        rows.to_csv(tmp_path / folder / "day.csv", index=False)
+    (tmp_path / "c").mkdir()
+    shutil.copy(tmp_path / "a" / "day.csv", tmp_path / "c" / "day.csv")
+
+    inputs = [str(tmp_path / folder / "day.csv") for folder in "abc"]
+    assert batch.main([*inputs, "-o", str(tmp_path / "reports"), "-j", "2", "--resamples", "50"]) == 0
+
+    index = report_index(tmp_path / "reports")
+    assert len(index) == 2
+    assert all(Path(directory).name.startswith("day-") for directory in index.values())
+    assert "dilewati" in capsys.readouterr().out
@@ -0,0 +1,39 @@
+import json
+
+import pandas as pd
+
+from benchmark import compare, load_results
+from synthetic import generate
+
+
+# Data sintetis berskala: jumlah baris berlipat, weekday tetap cocok dengan tanggal, cnt = casual + registered
+def test_generated_data_keeps_calendar_and_totals():
+    base = generate("day")
+    df = generate("day", scale=3)
+
+    assert len(df) == 3 * len(base)
+    assert df["dteday"].nunique() == 3 * base["dteday"].nunique()
+    assert ((pd.to_datetime(df["dteday"]).dt.dayofweek + 1) % 7 == df["weekday"]).all()
+    assert (df["cnt"] == df["casual"] + df["registered"]).all()
+    assert df["instant"].tolist() == list(range(1, len(df) + 1))
+
+
+# Catatan terakhir per (dataset, skala, stage) menjadi baseline; stage yang lebih lambat dari toleransi dilaporkan
+def test_compare_flags_regressions(tmp_path, capsys):
+    path = tmp_path / "benchmark.jsonl"
+    records = [
+        {"dataset": "day", "scale": 1, "stage": "read_csv", "wall_s": 2.0},
+        {"dataset": "day", "scale": 1, "stage": "read_csv", "wall_s": 1.0},
+        {"dataset": "day", "scale": 1, "stage": "clean", "wall_s": 1.0},
+    ]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    baseline = load_results(path)
+    assert baseline[("day", 1, "read_csv")]["wall_s"] == 1.0
+
+    regressions = compare([
+        {"dataset": "day", "scale": 1, "stage": "read_csv", "wall_s": 1.1},
+        {"dataset": "day", "scale": 1, "stage": "clean", "wall_s": 2.0},
+        {"dataset": "hour", "scale": 1, "stage": "clean", "wall_s": 5.0},
+    ], baseline)
+    assert [record["stage"] for record in regressions] == ["clean"]
+    assert "REGRESI" in capsys.readouterr().out
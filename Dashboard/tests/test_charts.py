@@ -0,0 +1,15 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from charts import draw_season_means_bar, render_chart
+
+
+# Grafik digambar tanpa pyplot: bytes gambar dikembalikan dan tidak ada figure yang tertinggal
+@pytest.mark.parametrize("image_format, header", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_render_chart_returns_image_bytes(image_format, header):
+    season_means = pd.Series([2604.1, 4992.3, 5644.3, 4728.2], index=pd.Index([1, 2, 3, 4], name="season"))
+    image = render_chart(draw_season_means_bar, season_means, image_format=image_format)
+    assert image.startswith(header)
+    assert plt.get_fignums() == []
+
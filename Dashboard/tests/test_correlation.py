@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from correlation import CorrelationStats, correlation_matrix, numeric_columns
+
+
+# Pearson dan Spearman sama dengan pandas; p-value sama dengan scipy
+@pytest.mark.parametrize("method, test", [("pearson", stats.pearsonr), ("spearman", stats.spearmanr)])
+def test_matches_pandas_and_scipy(data_dir, method, test):
+    df = pd.read_csv(data_dir / "day.csv")
+    columns = ["temp", "hum", "windspeed", "season", "cnt"]
+    result = correlation_matrix(df, method, columns)
+
+    assert result["n"] == len(df)
+    np.testing.assert_allclose(result["r"].to_numpy(), df[columns].corr(method).to_numpy(), atol=1e-10)
+    expected = test(df["hum"], df["cnt"])
+    np.testing.assert_allclose(result["p"].loc["hum", "cnt"], expected.pvalue, rtol=1e-6)
+
+
+# Baris dengan nilai kosong dilewati untuk semua pasangan kolom
+def test_rows_with_missing_values_skipped(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    df.loc[::10, "hum"] = np.nan
+    columns = ["temp", "hum", "cnt"]
+    result = correlation_matrix(df, "pearson", columns)
+
+    assert result["n"] == df[columns].notna().all(axis=1).sum()
+    np.testing.assert_allclose(result["r"].to_numpy(), df[columns].dropna().corr().to_numpy(), atol=1e-10)
+
+
+# Statistik per potongan yang digabung, atau ditambah lalu dikurangi, sama dengan statistik satu kali jalan
+def test_merge_and_subtract_match_single_pass(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    columns = numeric_columns(df)
+    whole = CorrelationStats.from_frame(df, columns)
+
+    merged = CorrelationStats.from_frame(df.iloc[:5000], columns).merge(CorrelationStats.from_frame(df.iloc[5000:], columns))
+    np.testing.assert_allclose(merged.pearson().to_numpy(), whole.pearson().to_numpy(), atol=1e-10)
+
+    extra = df.iloc[:1000]
+    updated = CorrelationStats.from_frame(df, columns)
+    updated.update(extra)
+    updated.update(extra, weights=-np.ones(len(extra)))
+    assert updated.n == whole.n
+    np.testing.assert_allclose(updated.pearson().to_numpy(), whole.pearson().to_numpy(), atol=1e-10)
+
+
+def test_unknown_method_rejected():
+    with pytest.raises(ValueError):
+        correlation_matrix(pd.DataFrame({"x": [1.0, 2.0], "y": [2.0, 1.0]}), "kendall")
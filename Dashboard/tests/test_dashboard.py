@@ -0,0 +1,16 @@
+import io
+
+
+# Setelah day.csv diunggah, semua halaman (tiap bagian dan fragment-nya) dirender tanpa error
+def test_every_page_renders_with_uploaded_data(data_dir, dashboard_app, uploads):
+    uploads[None] = io.BytesIO((data_dir / "day.csv").read_bytes())
+
+    app = dashboard_app.run()
+    assert not app.exception
+    for menu in app.sidebar.selectbox[0].options:
+        app.sidebar.selectbox[0].set_value(menu).run()
+        pages = app.sidebar.radio[0].options if app.sidebar.radio else [None]
+        for page in pages:
+            if page is not None:
+                app.sidebar.radio[0].set_value(page).run()
+            assert not app.exception, (menu, page, app.exception)
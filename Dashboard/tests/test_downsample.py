@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from downsample import SeriesPyramid, downsample, lttb, minmax
+
+
+def noisy_series(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2011-01-01", periods=n, freq="h")
+    return pd.Series(rng.normal(100, 20, n).cumsum(), index=index)
+
+
+# Min/max mempertahankan puncak dan lembah tiap bucket tanpa melebihi n_out titik
+def test_minmax_keeps_extremes():
+    series = noisy_series()
+    reduced = minmax(series, 500)
+    assert len(reduced) <= 500
+    assert reduced.index.is_monotonic_increasing
+    assert reduced.max() == series.max() and reduced.min() == series.min()
+    assert reduced.index.isin(series.index).all()
+
+
+# LTTB menghasilkan tepat n_out titik termasuk titik pertama dan terakhir
+def test_lttb_keeps_endpoints():
+    series = noisy_series()
+    reduced = lttb(series, 400)
+    assert len(reduced) == 400
+    assert reduced.index[0] == series.index[0] and reduced.index[-1] == series.index[-1]
+    assert reduced.index.is_monotonic_increasing
+
+
+# Deret yang sudah cukup kecil dikembalikan apa adanya
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_short_series_unchanged(method):
+    series = noisy_series(n=100)
+    assert downsample(series, 200, method) is series
+
+
+# Zoom ke rentang sempit memakai level detail; rentang penuh memakai level kasar
+def test_pyramid_window_uses_detailed_level_for_zoom():
+    series = noisy_series()
+    pyramid = SeriesPyramid(series)
+    assert len(pyramid.levels) > 1 and len(pyramid.levels[-1]) <= 1000 < len(series)
+
+    zoomed = pyramid.window(series.index[1000], series.index[1199], 400)
+    pd.testing.assert_series_equal(zoomed, series.iloc[1000:1200])
+
+    full = pyramid.window(series.index[0], series.index[-1], 400)
+    assert len(full) <= 400
+    assert full.max() == series.max() and full.min() == series.min()
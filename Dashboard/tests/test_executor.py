@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+from executor import JobCancelled, JobExecutor
+
+
+# Job menunggu sampai `release` diset, melaporkan progres di tiap langkah
+def waiting_task(release, calls, steps=100):
+    def task(progress):
+        calls.append(1)
+        for step in range(steps):
+            progress(step, steps, f"Langkah {step}")
+            if release.wait(0.01):
+                break
+        return "selesai"
+    return task
+
+
+# Kunci yang sama hanya dijalankan sekali untuk semua sesi yang memintanya
+def test_same_key_runs_once():
+    executor, release, calls = JobExecutor(max_workers=2), threading.Event(), []
+    first = executor.submit("analisis", waiting_task(release, calls), owner="sesi-a")
+    second = executor.submit("analisis", waiting_task(release, calls), owner="sesi-b")
+    assert first is second and first.owners == {"sesi-a", "sesi-b"}
+
+    release.set()
+    assert first.wait(10) and first.result() == "selesai"
+    assert calls == [1] and first.status == "done" and first.progress == 1.0
+
+
+# Job yang ditinggalkan semua pemiliknya dibatalkan pada laporan progres berikutnya
+def test_orphaned_job_cancelled():
+    executor, release, calls = JobExecutor(max_workers=1), threading.Event(), []
+    job = executor.submit("analisis", waiting_task(release, calls, steps=10_000), owner="sesi-a")
+    executor.release("sesi-a")
+    job.wait(10)
+    assert job.status == "cancelled"
+    with pytest.raises(JobCancelled):
+        job.result()
+    assert executor.get("analisis") is None
+    release.set()
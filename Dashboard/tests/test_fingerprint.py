@@ -0,0 +1,18 @@
+from fingerprint import derive_fingerprint, fingerprint_bytes, fingerprint_file
+
+
+# Sidik jari file yang dibaca per blok sama dengan sidik jari isinya
+def test_file_fingerprint_matches_bytes(tmp_path):
+    data = b"dteday,cnt\n" + b"2011-01-01,985\n" * 1000
+    path = tmp_path / "day.csv"
+    path.write_bytes(data)
+    assert fingerprint_file(path, block_size=64) == fingerprint_bytes(data)
+    assert fingerprint_bytes(data) != fingerprint_bytes(data + b"\n")
+
+
+# Sidik jari turunan bergantung pada induk dan tiap parameter
+def test_derived_fingerprint_depends_on_parameters():
+    parent = fingerprint_bytes(b"data")
+    assert derive_fingerprint(parent, "clean", 1.0) == derive_fingerprint(parent, "clean", 1.0)
+    assert derive_fingerprint(parent, "clean", 1.0) != derive_fingerprint(parent, "clean", 1.5)
+    assert derive_fingerprint(parent, "clean") != derive_fingerprint(fingerprint_bytes(b"other"), "clean")
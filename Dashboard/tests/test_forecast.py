@@ -0,0 +1,69 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from forecast import REQUIRED_COLUMNS, RidgeForecaster, ScenarioGrid, train
+
+
+# with_alpha menghitung ulang smearing Duan untuk koefisien baru, sama dengan melatih ulang dari awal
+def test_with_alpha_matches_retraining(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    model, metrics = train(df, alpha=1.0)
+    refit, refit_metrics = train(df, alpha=100.0)
+
+    switched = model.with_alpha(100.0)
+    np.testing.assert_allclose(switched.coef, refit.coef)
+    assert switched.smearing != model.smearing
+    assert np.isclose(switched.smearing, refit.smearing)
+    assert model.alpha == 1.0 and model.n_rows == switched.n_rows == len(df)
+
+
+# Melatih per potongan memberi model yang sama dengan melatih sekaligus
+def test_partial_fit_matches_single_fit(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    full, _ = train(df, holdout=0)
+    spec = full.spec
+    model = RidgeForecaster(spec)
+    for start in range(0, len(df), 5000):
+        chunk = df.iloc[start:start + 5000]
+        model.partial_fit(spec.matrix(chunk), chunk["cnt"].to_numpy())
+
+    np.testing.assert_allclose(model.coef, full.coef)
+    assert np.isclose(model.smearing, full.smearing)
+
+
+# day.csv (tanpa kolom hr) cukup untuk melatih model harian dan menyusun grid skenario
+def test_daily_data_trains_daily_model(data_dir):
+    df = pd.read_csv(data_dir / "day.csv")[REQUIRED_COLUMNS]
+    model, metrics = train(df)
+    assert not model.spec.hourly
+    assert metrics and model.n_rows == len(df)
+
+    grid = ScenarioGrid(model.spec, df)
+    assert len(grid) == (df["yr"] == df["yr"].max()).sum()
+
+
+# Unggahan harian (tanpa kolom hr) dipakai langsung oleh halaman prediksi sebagai model harian
+def test_prediction_page_uses_daily_upload(data_dir, dashboard_app, uploads):
+    day = pd.read_csv(data_dir / "day.csv")
+    uploads[None] = io.BytesIO(day.to_csv(index=False).encode())
+
+    app = dashboard_app.run()
+    app.sidebar.selectbox[0].set_value("Analisis Statistik").run()
+    app.sidebar.radio[0].set_value("Prediksi Penyewaan").run()
+    assert not app.exception
+    assert not app.info
+    assert any("data harian" in text.value and f"**{len(day)}**" in text.value for text in app.markdown)
+
+
+# Unggahan tanpa semua kolom fitur: model dilatih dari Data/hour.csv dan halaman memberi tahu
+def test_prediction_page_notes_fallback(data_dir, dashboard_app, uploads):
+    day = pd.read_csv(data_dir / "day.csv").drop(columns="windspeed")
+    uploads[None] = io.BytesIO(day.to_csv(index=False).encode())
+
+    app = dashboard_app.run()
+    app.sidebar.selectbox[0].set_value("Analisis Statistik").run()
+    app.sidebar.radio[0].set_value("Prediksi Penyewaan").run()
+    assert not app.exception
+    assert any("Data/hour.csv" in info.value for info in app.info)
@@ -0,0 +1,25 @@
+import io
+
+import pandas as pd
+
+
+# Tambah Data Baru memakai pengali IQR dari halaman Cleaning Data, lalu halaman itu mengunci mode dan pengalinya
+def test_append_keeps_cleaning_multiplier(data_dir, dashboard_app, uploads):
+    day = pd.read_csv(data_dir / "day.csv")
+    uploads[None] = io.BytesIO(day.iloc[:700].to_csv(index=False).encode())
+
+    app = dashboard_app.run()
+    app.sidebar.radio[0].set_value("Cleaning Data").run()
+    app.slider[0].set_value(2.0).run()
+
+    app.sidebar.radio[0].set_value("Data Gathering").run()
+    uploads["append_file"] = io.BytesIO(day.iloc[700:].to_csv(index=False).encode())
+    app.run()
+    assert not app.exception
+    assert app.session_state["incremental_handle"].get().multiplier == 2.0
+    # Mode berurutan yang dipilih diganti mode serentak; pengguna diberi tahu
+    assert any("mode serentak" in info.value for info in app.info)
+
+    app.sidebar.radio[0].set_value("Cleaning Data").run()
+    assert (app.radio[0].disabled, app.radio[0].value) == (True, "Serentak (semua kolom)")
+    assert (app.slider[0].disabled, app.slider[0].value) == (True, 2.0)
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateCube
+from incremental import IncrementalDataset
+
+
+# Salinan dataset (seperti yang dikembalikan SharedStore.get) bisa ditambah data tanpa mengubah aslinya
+def test_copy_is_independent_snapshot(make_day_frame):
+    dataset = IncrementalDataset(make_day_frame(2000, 0))
+    before = dataset.cube()
+    n_clean, correlation, masks = before.n_rows, dataset.correlation.result()["r"], [mask.copy() for mask in dataset.masks]
+
+    copy = dataset.copy()
+    assert copy.append(make_day_frame(3000, 1)) > 0
+
+    assert dataset.n_raw == 2000 and copy.n_raw == 5000
+    assert dataset.cube().n_rows == n_clean
+    pd.testing.assert_frame_equal(dataset.correlation.result()["r"], correlation)
+    for mask, original in zip(dataset.masks, masks):
+        np.testing.assert_array_equal(mask, original)
+
+
+# Cube inkremental memberi rata-rata dan korelasi yang sama dengan cube dari data bersih gabungan
+def test_cube_matches_clean_frame(make_day_frame):
+    dataset = IncrementalDataset(make_day_frame(2000, 0)).copy()
+    dataset.append(make_day_frame(500, 1))
+    cube, expected = dataset.cube(), AggregateCube(dataset.clean_frame())
+    assert cube.n_rows == expected.n_rows
+    pd.testing.assert_series_equal(cube.mean("season", "cnt"), expected.mean("season", "cnt"), check_dtype=False)
+    np.testing.assert_allclose(cube.corr(["season", "cnt"]).to_numpy(), expected.corr(["season", "cnt"]).to_numpy())
@@ -0,0 +1,54 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from ingestion import BIKE_SCHEMA, read_bike_csv, read_bike_csv_chunked
+
+
+CSV = (
+    "instant,dteday,season,yr,mnth,hr,holiday,weekday,workingday,weathersit,temp,atemp,hum,windspeed,casual,registered,cnt\n"
+    "1,2011-01-01,1,0,1,0,0,6,0,1,0.24,0.2879,0.81,0.0,3,13,16\n"
+    "2,2011-01-01,1,0,1,1,0,6,0,1,0.22,0.2727,0.8,0.0,8,32,40\n"
+    "3,2011-01-02,1,0,1,2,0,0,0,2,0.22,0.2727,0.8,0.1,5,27,32\n"
+)
+
+
+# Kolom yang dikenal diparse dengan skema eksplisit (kode int8, jumlah int32)
+def test_explicit_schema(data_dir):
+    df = read_bike_csv((data_dir / "day.csv").read_bytes())
+    assert len(df) == 731
+    assert {col: str(dtype) for col, dtype in df.dtypes.items()} == {col: BIKE_SCHEMA[col] for col in df.columns}
+
+
+# Nilai kosong tidak sesuai skema: parse ulang dengan tipe bawaan pandas
+def test_schema_fallback_on_missing_values():
+    df = read_bike_csv(CSV.replace(",3,13,16", ",,13,16").encode())
+    assert df["casual"].isna().sum() == 1
+    assert df["cnt"].tolist() == [16, 40, 32]
+
+
+# Loader bertahap: tipe ringkas, tanggal kategori, nilai sama dengan parse biasa walau dibaca per potongan
+def test_chunked_reader_matches_exact_parse():
+    data = CSV.encode()
+    chunked = read_bike_csv_chunked(data, chunksize=2)
+    exact = read_bike_csv(data)
+
+    assert chunked["season"].dtype == "int8"
+    assert chunked["temp"].dtype == "float32"
+    assert isinstance(chunked["dteday"].dtype, pd.CategoricalDtype)
+    assert chunked["dteday"].astype(str).tolist() == exact["dteday"].tolist()
+    np.testing.assert_allclose(chunked["temp"], exact["temp"], rtol=1e-6)
+    assert chunked["cnt"].tolist() == exact["cnt"].tolist()
+    # Objek file (misalnya file unggahan) bisa dibaca berulang
+    assert read_bike_csv_chunked(io.BytesIO(data), chunksize=2).equals(chunked)
+
+
+# Nilai kosong di kolom kode: dibaca ulang dengan tipe bawaan seperti read_bike_csv
+def test_chunked_reader_falls_back_when_data_does_not_fit_schema():
+    data = CSV.replace("1,1,0,6,0,1,0.22", "1,1,0,6,0,,0.22").encode()
+    df = read_bike_csv_chunked(data, chunksize=2)
+
+    assert df["weathersit"].isna().sum() == 1
+    assert df["season"].dtype == "int64"
+    assert isinstance(df["dteday"].dtype, pd.CategoricalDtype)
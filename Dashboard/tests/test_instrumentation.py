@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from instrumentation import StageRecorder, profile_block, set_memory_tracing
+
+
+# Stage anak selesai sebelum induknya; memori puncak anak ikut terhitung di induk; log JSON per baris
+def test_nested_stages_recorded_and_logged(tmp_path):
+    recorder = StageRecorder(tmp_path / "stages.jsonl", page="Analisis Awal")
+    set_memory_tracing(True)
+    try:
+        with recorder.stage("page"):
+            with recorder.stage("load", rows=10):
+                np.ones(2_000_000).sum()
+    finally:
+        set_memory_tracing(False)
+
+    table = recorder.table()
+    assert table["stage"].tolist() == ["load", "page"]
+    load, page = recorder.records
+    assert load["peak_mb"] > 10 and page["peak_mb"] >= load["peak_mb"]
+    assert page["wall_ms"] >= load["wall_ms"]
+
+    logged = [json.loads(line) for line in (tmp_path / "stages.jsonl").read_text().splitlines()]
+    assert [record["stage"] for record in logged] == ["load", "page"]
+    assert logged[0]["rows"] == 10 and logged[0]["page"] == "Analisis Awal"
+    assert logged[0]["run"] == logged[1]["run"]
+
+
+# Tanpa tracemalloc hanya waktu yang dicatat
+def test_time_only_without_memory_tracing():
+    recorder = StageRecorder()
+    with recorder.stage("read"):
+        pass
+    assert list(recorder.table().columns) == ["stage", "wall_ms", "cpu_ms"]
+
+
+def test_profile_block_writes_profile(tmp_path):
+    with profile_block(tmp_path) as result:
+        sorted(range(100_000), key=lambda value: -value)
+    assert Path(result["path"]).parent == tmp_path and Path(result["path"]).exists()
+    assert "function calls" in result["summary"]
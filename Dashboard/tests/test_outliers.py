@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from outliers import count_outliers, inlier_mask, remove_outliers, split_numeric_columns
+
+
+# Filter IQR per kolom seperti versi lama di dashboard.py (kuartil dihitung ulang setelah tiap kolom)
+def filter_per_column(df, columns, multiplier):
+    for col in columns:
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        iqr = q3 - q1
+        df = df[(df[col] >= q1 - multiplier * iqr) & (df[col] <= q3 + multiplier * iqr)]
+    return df
+
+
+@pytest.mark.parametrize("name", ["day.csv", "hour.csv"])
+@pytest.mark.parametrize("multiplier", [1.0, 1.5])
+def test_sequential_mode_matches_per_column_filter(data_dir, name, multiplier):
+    df = pd.read_csv(data_dir / name)
+    binary_columns, continuous_columns = split_numeric_columns(df)
+    assert "workingday" in binary_columns and "cnt" in continuous_columns
+
+    expected = filter_per_column(df, continuous_columns, multiplier)
+    pd.testing.assert_frame_equal(remove_outliers(df, continuous_columns, multiplier), expected)
+
+
+# Mode serentak memakai kuartil data awal untuk semua kolom
+def test_simultaneous_mode_uses_initial_quartiles(data_dir):
+    df = pd.read_csv(data_dir / "day.csv")
+    columns = ["temp", "hum", "windspeed", "cnt"]
+    expected = np.ones(len(df), dtype=bool)
+    for col in columns:
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        expected &= df[col].between(q1 - (q3 - q1), q3 + (q3 - q1)).to_numpy()
+
+    mask = inlier_mask(df, columns, multiplier=1.0, mode="simultaneous")
+    np.testing.assert_array_equal(mask, expected)
+    assert mask.sum() < len(df)
+
+
+def test_count_outliers_matches_bounds():
+    df = pd.DataFrame({"x": [1, 2, 3, 4, 5, 100], "y": [-50, 2, 3, 4, 5, 6]})
+    assert count_outliers(df, ["x", "y"]).to_dict() == {"x": 1, "y": 1}
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        inlier_mask(pd.DataFrame({"x": [1, 2, 3]}), ["x"], mode="per-kolom")
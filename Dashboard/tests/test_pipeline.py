@@ -0,0 +1,43 @@
+import pandas as pd
+
+import pipeline
+from pipeline import clean_fingerprint, run_pipeline, run_stages, stage_fingerprints
+from shared_store import SharedStore
+
+
+# Parameter dinormalisasi: 1 dan 1.0, serta parameter bawaan yang tidak ditulis, memberi sidik jari yang sama
+def test_fingerprints_normalize_parameters():
+    assert clean_fingerprint("fp", multiplier=1) == clean_fingerprint("fp", multiplier=1.0) == clean_fingerprint("fp")
+    assert clean_fingerprint("fp", mode="simultaneous") != clean_fingerprint("fp")
+
+    before, after = stage_fingerprints("fp"), stage_fingerprints("fp", multiplier=1.5)
+    assert before["prepare"] == after["prepare"]
+    assert before["clean"] != after["clean"]
+
+
+# Bungkus fungsi tahap agar tiap pemanggilannya tercatat
+def counted(name, func, calls):
+    def stage(df, **kwargs):
+        calls.append(name)
+        return func(df, **kwargs)
+    return stage
+
+
+# Pipeline lewat store sama dengan run_stages; mengganti pengali hanya menghitung ulang tahap clean
+def test_pipeline_reuses_unchanged_stages(data_dir, monkeypatch):
+    df = pd.read_csv(data_dir / "day.csv")
+    expected = {multiplier: run_stages(df, multiplier=multiplier) for multiplier in (1.0, 1.5)}
+    calls = []
+    monkeypatch.setattr(pipeline, "STAGES", [(name, counted(name, func, calls), keys) for name, func, keys in pipeline.STAGES])
+
+    store = SharedStore()
+    store.put("fp", df)
+    first = run_pipeline(store, "fp")
+    pd.testing.assert_frame_equal(first["clean"][1].get(), expected[1.0])
+    assert first["clean"][0] == clean_fingerprint("fp")
+
+    second = run_pipeline(store, "fp", multiplier=1.5)
+    pd.testing.assert_frame_equal(second["clean"][1].get(), expected[1.5])
+    assert calls == ["prepare", "clean", "clean"]
+    # Data masukan tidak berubah
+    assert df["dteday"].dtype == object
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from incremental import ValueCounts
+from profiler import DuplicateCounter
+
+
+def chunks(n_chunks, size, duplicate_every=10):
+    for index in range(n_chunks):
+        ids = np.arange(index * size, (index + 1) * size)
+        # Tiap baris ke-`duplicate_every` mengulang baris dari potongan pertama
+        ids[::duplicate_every] = ids[::duplicate_every] % size
+        yield pd.DataFrame({"id": ids, "value": ids * 2})
+
+
+# Potongan terakhir tepat mengisi buffer sampai ditulis ke disk, sehingga buffer kosong saat count()
+@pytest.mark.parametrize("memory_hashes", [3000, 3500])
+def test_duplicate_count_when_last_chunk_spills(memory_hashes):
+    counter = DuplicateCounter(memory_hashes=memory_hashes, partitions=8)
+    frames = list(chunks(20, 1000))
+    for frame in frames:
+        counter.add(frame)
+    assert counter.spill_dir is not None
+    assert counter.count() == int(pd.concat(frames).duplicated().sum())
+
+
+def test_duplicate_count_in_memory():
+    counter = DuplicateCounter()
+    frames = list(chunks(5, 1000))
+    for frame in frames:
+        counter.add(frame)
+    assert counter.spill_dir is None
+    assert counter.count() == int(pd.concat(frames).duplicated().sum())
+
+
+# Galat kuantil yang dilaporkan mencakup pembulatan ulang setiap kali resolusi digandakan dan saat merge
+def test_sketch_error_bounds_quantiles():
+    rng = np.random.default_rng(1)
+    parts = [rng.lognormal(3, 1, 2000) * (index + 1) for index in range(10)]
+    sketch = ValueCounts(max_values=64)
+    for values in parts:
+        sketch.add(values)
+    other = ValueCounts(parts[0][:500] * 7, max_values=64)
+    merged = sketch.merge(other)
+
+    q = np.linspace(0, 1, 41)
+    for result, values in [(sketch, np.concatenate(parts)), (merged, np.concatenate([*parts, parts[0][:500] * 7]))]:
+        assert result.resolution > 0
+        assert np.abs(result.quantile(q) - np.quantile(values, q)).max() <= result.error + 1e-9
@@ -0,0 +1,44 @@
+import threading
+from pathlib import Path
+
+import numpy as np
+
+import resampling
+
+
+# Resampling paralel dipanggil dari thread lain, seperti skrip dashboard di server Streamlit (lihat executor.py)
+def test_parallel_resampling_from_worker_thread():
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=2000), rng.normal(0.5, size=2000)
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault(
+        "test", resampling.permutation_test(a, b, n_resamples=200, seed=1, workers=2)))
+    thread.start()
+    thread.join(120)
+
+    assert result["test"]["n_resamples"] == 200
+    assert result["test"]["p_value"] < 0.01
+    # Hasil paralel dapat diulang untuk seed yang sama
+    assert resampling.permutation_test(a, b, n_resamples=200, seed=1, workers=2) == result["test"]
+
+
+# Satu pool dipakai beberapa uji; hasilnya sama dengan pool baru per uji dan file data sementara dihapus
+def test_shared_pool_matches_pool_per_test():
+    rng = np.random.default_rng(1)
+    a, b = rng.normal(size=1000), rng.normal(0.2, size=1000)
+    with resampling.resampling_pool(2) as pool:
+        shared = (resampling.permutation_test(a, b, n_resamples=100, seed=3, workers=pool),
+                  resampling.bootstrap_diff_ci(a, b, n_resamples=100, seed=3, workers=pool),
+                  resampling.permutation_anova([a, b], n_resamples=100, seed=3, workers=pool))
+        assert list(Path(pool._dir.name).iterdir()) == []
+
+    assert shared == (resampling.permutation_test(a, b, n_resamples=100, seed=3, workers=2),
+                      resampling.bootstrap_diff_ci(a, b, n_resamples=100, seed=3, workers=2),
+                      resampling.permutation_anova([a, b], n_resamples=100, seed=3, workers=2))
+
+
+def test_resampling_workers_capped(monkeypatch):
+    monkeypatch.setattr(resampling.os, "cpu_count", lambda: 64)
+    assert resampling.resampling_workers(resampling.PARALLEL_MIN_ROWS - 1) is None
+    assert resampling.resampling_workers(resampling.PARALLEL_MIN_ROWS) == resampling.DEFAULT_PROCESS_WORKERS
+    assert resampling.resampling_workers(resampling.PARALLEL_MIN_ROWS, max_workers=2) == 2
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from segmentation import RENTAL_LABELS, segment, segment_counts, segment_within_groups
+
+
+# Aturan categorize_rental lama di dashboard.py: Low < Q1 <= Medium <= Q3 < High
+def categorize(values, q1, q3):
+    return ["Low Rental" if value < q1 else "High Rental" if value > q3 else "Medium Rental" for value in values]
+
+
+def test_segment_matches_row_by_row_rule(data_dir):
+    cnt = pd.read_csv(data_dir / "hour.csv")["cnt"]
+    q1, q3 = cnt.quantile(0.25), cnt.quantile(0.75)
+    categories = segment(cnt, labels=RENTAL_LABELS)
+
+    assert list(categories.astype(str)) == categorize(cnt, q1, q3)
+    expected = pd.Series(categorize(cnt, q1, q3)).value_counts().reindex(RENTAL_LABELS)
+    assert segment_counts(categories).tolist() == expected.tolist()
+
+
+# Kuantil dihitung per kelompok; nilai kosong tidak masuk segmen mana pun
+def test_segment_within_groups_uses_group_quartiles(data_dir):
+    df = pd.read_csv(data_dir / "day.csv")
+    df.loc[::50, "cnt"] = np.nan
+    categories = segment_within_groups(df, "cnt", "season", labels=RENTAL_LABELS)
+
+    valid = df["cnt"].notna().to_numpy()
+    assert (categories.codes == -1).tolist() == (~valid).tolist()
+    for season, group in df[valid].groupby("season"):
+        q1, q3 = group["cnt"].quantile(0.25), group["cnt"].quantile(0.75)
+        assert list(categories[group.index].astype(str)) == categorize(group["cnt"], q1, q3)
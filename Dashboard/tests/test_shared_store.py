@@ -0,0 +1,63 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from shared_store import SharedStore
+
+
+def frame(rows, value=0):
+    return pd.DataFrame({"x": np.full(rows, value, dtype="int64")})
+
+
+# Data yang dibuang saat memori penuh dibuat ulang oleh loader tanpa menahan lock store
+def test_reload_runs_outside_lock():
+    store = SharedStore(budget_bytes=frame(1000).memory_usage(deep=True).sum() * 1.5)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(10)
+        return frame(1000, 1)
+
+    evicted = store.put("evicted", frame(1000, 1), loader=slow_loader)
+    other = store.put("other", frame(1000, 2))
+    assert store.stats().set_index("key").loc["evicted", "loaded"] == False  # noqa: E712
+
+    result = {}
+    reader = threading.Thread(target=lambda: result.setdefault("frame", evicted.get()))
+    reader.start()
+    assert started.wait(10)
+    # Sesi lain tetap bisa membaca selama loader berjalan
+    other_result = {}
+    other_reader = threading.Thread(target=lambda: other_result.setdefault("frame", other.get()))
+    other_reader.start()
+    other_reader.join(2)
+    read_while_loading = "frame" in other_result
+    release.set()
+    other_reader.join(10)
+    assert read_while_loading
+    assert other_result["frame"]["x"].iloc[0] == 2
+    reader.join(10)
+    assert result["frame"]["x"].iloc[0] == 1
+
+
+# Entri tanpa loader (data unggahan) bisa dilepas dari memori setelah loader dari salinan di disk dipasang
+def test_held_entry_evictable_after_loader_set():
+    budget = frame(1000).memory_usage(deep=True).sum() * 1.5
+    store = SharedStore(budget_bytes=budget)
+    upload = store.put("upload", frame(1000, 1))
+    other = store.put("other", frame(1000, 2))
+    assert store.total_bytes() > budget
+
+    store.set_loader("upload", lambda: frame(1000, 1))
+    assert store.total_bytes() <= budget
+    assert upload.get()["x"].iloc[0] == 1
+    assert other.get()["x"].iloc[0] == 2
+
+
+# Copy-on-write diaktifkan sekali saat modul halaman diimpor, bukan oleh pembuatan store
+def test_copy_on_write_enabled_on_import():
+    import views.common  # noqa: F401
+
+    assert pd.options.mode.copy_on_write
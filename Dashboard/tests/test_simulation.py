@@ -0,0 +1,24 @@
+import threading
+
+import numpy as np
+
+from simulation import BATCH_DAYS, DemandModel, simulate, simulation_workers
+
+
+def test_simulation_workers_cap():
+    assert simulation_workers(10) is None
+    assert simulation_workers(10_000_000, max_workers=1) == 1
+
+
+# Simulasi paralel dari thread job latar belakang (seperti halaman Simulasi Armada) sama dengan hasil berurutan
+def test_parallel_simulation_from_worker_thread(make_hour_frame):
+    model = DemandModel(make_hour_frame())
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault(
+        "parallel", simulate(model, 3, 1, n_days=2 * BATCH_DAYS, seed=1, workers=2)))
+    thread.start()
+    thread.join(120)
+
+    sequential = simulate(model, 3, 1, n_days=2 * BATCH_DAYS, seed=1)
+    for name in ("peaks", "totals", "peak_hours"):
+        np.testing.assert_array_equal(result["parallel"][name], sequential[name])
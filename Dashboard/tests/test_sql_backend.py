@@ -0,0 +1,50 @@
+import gc
+
+import numpy as np
+import pandas as pd
+
+from sql_backend import SQLiteCube
+
+
+# File database sementara dihapus setelah cube terakhir yang memakainya dibuang
+def test_temporary_database_removed_with_last_cube(make_day_frame, tmp_path):
+    path = tmp_path / "cube.db"
+    first = SQLiteCube.temporary(make_day_frame(), path)
+    second = SQLiteCube.temporary(make_day_frame(), path)
+    assert path.exists() and second.n_rows == 500
+
+    del first
+    gc.collect()
+    assert path.exists()
+    assert second.mean("season", "cnt").notna().all()
+
+    del second
+    gc.collect()
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+# Data untuk database hanya dimuat jika database belum ada
+def test_temporary_database_loads_source_only_when_building(make_day_frame, tmp_path):
+    path = tmp_path / "cube.db"
+    calls = []
+
+    def load():
+        calls.append(1)
+        return make_day_frame()
+
+    first = SQLiteCube.temporary(load, path)
+    second = SQLiteCube.temporary(load, path)
+    assert len(calls) == 1
+    assert second.n_rows == first.n_rows == 500
+
+
+# Statistik deskriptif melewati nilai kosong seperti pandas
+def test_describe_skips_missing_values(make_day_frame, tmp_path):
+    df = make_day_frame()
+    df.loc[::7, "cnt"] = np.nan
+    cube = SQLiteCube.from_frame(df, tmp_path / "cube.db")
+
+    expected = df.groupby("season")["cnt"].describe()
+    pd.testing.assert_frame_equal(cube.describe("season", "cnt"), expected, check_names=False, check_index_type=False)
+    pd.testing.assert_series_equal(cube.mean("season", "cnt"), df.groupby("season")["cnt"].mean(), check_names=False, check_index_type=False)
@@ -0,0 +1,13 @@
+from startup_benchmark import run_child
+
+
+# Tiap halaman diukur di proses baru: halaman Kesimpulan tidak memuat pustaka berat sama sekali,
+# dan Data Gathering hanya memuat pustaka yang dipakainya (tanpa scipy, matplotlib, seaborn)
+def test_pages_import_only_what_they_use():
+    conclusion = run_child("Kesimpulan", None, "")
+    assert conclusion["module"] == "views.conclusion"
+    assert conclusion["heavy_modules"] == []
+
+    gathering = run_child("Data Wrangling", "Data Gathering", "")
+    assert "pandas" in gathering["heavy_modules"]
+    assert not {"scipy", "matplotlib", "seaborn"} & set(gathering["heavy_modules"])
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+import storage
+
+needs_pyarrow = pytest.mark.skipif(not storage.HAS_PYARROW, reason="pyarrow tidak tersedia")
+
+
+def sample_csv(path):
+    pd.DataFrame({
+        "dteday": ["2011-01-01", "2011-01-02", "2011-01-03"],
+        "season": [1, 1, 1],
+        "temp": [0.3, 0.4, 0.2],
+        "cnt": [985, 801, 1349],
+    }).to_csv(path, index=False)
+    return path
+
+
+@needs_pyarrow
+def test_parquet_written_without_leftover_temp_file(tmp_path):
+    csv_path = sample_csv(tmp_path / "day.csv")
+    target = storage.convert(csv_path, tmp_path / "store", "parquet")
+    assert storage.read_table(target)["cnt"].tolist() == [985, 801, 1349]
+    assert [path.name for path in target.parent.iterdir()] == [target.name]
+
+
+# Penulisan yang gagal di tengah jalan tidak meninggalkan file parquet terpotong di path akhir
+@needs_pyarrow
+def test_failed_parquet_write_leaves_no_target(tmp_path, monkeypatch):
+    csv_path = sample_csv(tmp_path / "day.csv")
+
+    def broken_write(table, where, **kwargs):
+        with open(where, "wb") as file:
+            file.write(b"PAR1")
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(storage.pq, "write_table", broken_write)
+    with pytest.raises(OSError):
+        storage.convert(csv_path, tmp_path / "store", "parquet")
+    assert list((tmp_path / "store").rglob("*")) == []
+
+
+# Folder .npy ditulis lewat folder sementara bernama unik; folder sementara sisa penulis lain tidak diganggu
+def test_npy_store_written_through_unique_temp_dir(tmp_path):
+    csv_path = sample_csv(tmp_path / "day.csv")
+    store_dir = tmp_path / "store"
+    store_dir.mkdir()
+    (store_dir / "day.cols.tmp").mkdir()
+    target = storage.convert(csv_path, store_dir, "npy")
+    storage.convert(csv_path, store_dir, "npy")
+
+    assert storage.read_table(target)["cnt"].tolist() == [985, 801, 1349]
+    assert sorted(path.name for path in store_dir.iterdir()) == ["day.cols", "day.cols.tmp"]
+
+
+# Salinan data unggahan: hanya kolom yang diminta yang dibaca, dari DataFrame, CSV maupun salinan kolumnar
+@pytest.mark.parametrize("fmt", [pytest.param("parquet", marks=needs_pyarrow), "npy"])
+def test_read_source_reads_only_requested_columns(tmp_path, fmt):
+    csv_path = sample_csv(tmp_path / "day.csv")
+    df = pd.read_csv(csv_path)
+    target = storage.store_frame(df, "abc123", tmp_path / "uploads", fmt)
+    assert storage.store_frame(df, "abc123", tmp_path / "uploads", fmt) == target
+    assert storage.source_columns(target) == ["dteday", "season", "temp", "cnt"]
+
+    for source in (df, target):
+        pruned = storage.read_source(source, ["dteday", "cnt", "hr"])
+        assert list(pruned.columns) == ["dteday", "cnt"]
+        assert pruned["cnt"].tolist() == [985, 801, 1349]
+        assert pruned["dteday"].astype(str).tolist() == df["dteday"].tolist()
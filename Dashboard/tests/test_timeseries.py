@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from timeseries import WEEKDAY_LABELS, HourlySeries, build_hourly_index
+
+
+# Index per jam sama untuk kolom tanggal teks dan kategori (hasil loader bertahap)
+def test_hourly_index_from_text_and_categorical_dates(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv", nrows=500)
+    expected = pd.to_datetime(df["dteday"]) + pd.to_timedelta(df["hr"], unit="h")
+
+    index = build_hourly_index(df)
+    np.testing.assert_array_equal(index.to_numpy(), expected.to_numpy())
+    categorical = build_hourly_index(df.astype({"dteday": "category"}))
+    np.testing.assert_array_equal(categorical.to_numpy(), index.to_numpy())
+
+
+# Resampling harian sama dengan total per tanggal; jam yang tidak tercatat di hour.csv dihitung 0
+def test_resample_fills_missing_hours(data_dir):
+    df = pd.read_csv(data_dir / "hour.csv")
+    series = HourlySeries(df.sample(frac=1, random_state=0))
+
+    hourly = series.resample("h")
+    assert len(hourly) == (series.end - series.start) // pd.Timedelta(hours=1) + 1 > len(df)
+    assert (hourly["cnt"] == 0).sum() == len(hourly) - len(df)
+
+    daily = series.resample("D")
+    expected = df.groupby("dteday")[["cnt", "casual", "registered"]].sum()
+    np.testing.assert_array_equal(daily.to_numpy(), expected.to_numpy())
+    assert series.resample("D") is daily
+
+
+# Profil jam x hari sama dengan rata-rata groupby; tanpa kolom weekday hari dihitung dari tanggal
+def test_hour_weekday_profile(make_hour_frame):
+    df = make_hour_frame(n_days=60)
+    expected = df.groupby(["hr", "weekday"])["cnt"].mean().unstack()
+    expected.columns = WEEKDAY_LABELS
+
+    for frame in (df, df.drop(columns="weekday")):
+        profile = HourlySeries(frame).hour_weekday_profile()
+        assert profile.shape == (24, 7)
+        np.testing.assert_allclose(profile.to_numpy(), expected.to_numpy())
+
+
+# Rolling dan expanding dihitung dari hasil resampling
+def test_rolling_and_expanding(make_hour_frame):
+    series = HourlySeries(make_hour_frame(n_days=60))
+    daily = series.resample("D")["cnt"]
+    pd.testing.assert_series_equal(series.rolling("D", 7), daily.rolling(7, min_periods=1).mean())
+    pd.testing.assert_series_equal(series.expanding("D", "max"), daily.expanding().max())
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from downsample import SeriesPyramid
+
+
+# Lokasi dataset per jam bawaan repository
+DATA_DIR = Path(__file__).resolve().parent.parent / "Data"
+HOUR_CSV = DATA_DIR / "hour.csv"
+
+# Resolusi resampling yang didukung (label -> frekuensi pandas)
+FREQUENCIES = {"Per Jam": "h", "Harian": "D", "Mingguan": "W", "Bulanan": "MS"}
+
+TIME_SERIES_METRICS = ["cnt", "casual", "registered"]
+
+# Nama hari sesuai kode kolom weekday (0 = Minggu)
+WEEKDAY_LABELS = ["Minggu", "Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu"]
+
+
+# Index waktu per jam dari kolom tanggal (dteday) dan jam (hr)
+def build_hourly_index(df):
+    dates = df["dteday"]
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        # Konversi tiap tanggal unik sekali saja, lalu sebarkan lewat kode kategori
+        dates = pd.to_datetime(dates.cat.categories).to_numpy()[dates.cat.codes.to_numpy()]
+    else:
+        dates = pd.to_datetime(dates).to_numpy()
+    dates = dates.astype("datetime64[h]")
+    hours = df["hr"].to_numpy().astype("timedelta64[h]")
+    return pd.DatetimeIndex(dates + hours, name="waktu")
+
+
+# Deret waktu per jam dengan cache hasil resampling per frekuensi
+class HourlySeries:
+    def __init__(self, df, metrics=None):
+        self.metrics = [col for col in (metrics or TIME_SERIES_METRICS) if col in df.columns]
+        index = build_hourly_index(df)
+        order = np.argsort(index.to_numpy(), kind="stable")
+
+        self.frame = pd.DataFrame({col: df[col].to_numpy()[order] for col in self.metrics}, index=index[order])
+        self.hours = df["hr"].to_numpy()[order].astype("int64")
+        if "weekday" in df.columns:
+            self.weekdays = df["weekday"].to_numpy()[order].astype("int64")
+        else:
+            self.weekdays = ((self.frame.index.dayofweek + 1) % 7).to_numpy()
+        self._resampled = {}
+        self._pyramids = {}
+
+    @property
+    def start(self):
+        return self.frame.index[0]
+
+    @property
+    def end(self):
+        return self.frame.index[-1]
+
+    # Total per periode; jam yang tidak tercatat dihitung 0
+    def resample(self, freq, agg="sum"):
+        key = (freq, agg)
+        if key not in self._resampled:
+            self._resampled[key] = self.frame.resample(freq).agg(agg)
+        return self._resampled[key]
+
+    # Piramida multi-resolusi dari hasil resampling, untuk grafik yang di-zoom
+    def pyramid(self, freq, metric="cnt"):
+        key = (freq, metric)
+        if key not in self._pyramids:
+            self._pyramids[key] = SeriesPyramid(self.resample(freq)[metric])
+        return self._pyramids[key]
+
+    # Jendela bergulir (rolling) sepanjang `window` periode
+    def rolling(self, freq, window, agg="mean", metric="cnt"):
+        return self.resample(freq)[metric].rolling(window, min_periods=1).agg(agg)
+
+    # Jendela kumulatif (expanding) dari awal data
+    def expanding(self, freq, agg="mean", metric="cnt"):
+        return self.resample(freq)[metric].expanding(min_periods=1).agg(agg)
+
+    # Rata-rata metrik per jam (baris) x hari (kolom), dihitung dengan satu bincount
+    def hour_weekday_profile(self, metric="cnt"):
+        cell = self.hours * 7 + self.weekdays
+        totals = np.bincount(cell, weights=self.frame[metric].to_numpy(), minlength=24 * 7)
+        counts = np.bincount(cell, minlength=24 * 7)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = totals / counts
+        return pd.DataFrame(means.reshape(24, 7), index=pd.RangeIndex(24, name="hr"), columns=WEEKDAY_LABELS)
@@ -0,0 +1,21 @@
+# Menu -> sub-menu -> modul halaman (satu modul per halaman dengan fungsi render()).
+# dashboard.py mengimpor modul halaman saat halaman pertama kali dibuka, sehingga pustaka berat
+# (pandas, seaborn, matplotlib, scipy) hanya dimuat jika dibutuhkan; modul tetap ada di sys.modules
+# sehingga pembukaan berikutnya tidak memuat ulang apa pun.
+PAGES = {
+    "Data Wrangling": {
+        "Data Gathering": "views.gathering",
+        "Assessing Data": "views.assessing",
+        "Cleaning Data": "views.cleaning",
+    },
+    "Analisis Statistik": {
+        "Analisis Awal": "views.initial_analysis",
+        "Analisis Clustering Manual": "views.clustering",
+        "Analisis Time Series": "views.time_series",
+        "Analisis Korelasi dan Uji ANOVA": "views.correlation_anova",
+        "Prediksi Penyewaan": "views.prediction",
+        "Deteksi Anomali": "views.anomalies",
+        "Simulasi Armada": "views.fleet",
+    },
+    "Kesimpulan": {None: "views.conclusion"},
+}
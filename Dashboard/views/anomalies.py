@@ -0,0 +1,132 @@
+import pandas as pd
+import streamlit as st
+
+import charts
+from anomaly import ANOMALY_COLUMNS, DEFAULT_THRESHOLD, DEFAULT_WINDOW, StreamingDetector, detect_anomalies
+from charts import CHART_DPI
+from downsample import downsample, pixel_points
+from fingerprint import fingerprint_bytes
+from ingestion import read_bike_csv
+from storage import read_source
+from timeseries import HOUR_CSV, TIME_SERIES_METRICS
+from views.common import cached_file_fingerprint, run_in_background, session_source, stage
+from views.figures import show_chart
+
+
+# Data per jam untuk deteksi anomali di-cache per sidik jari data sumber (DataFrame, salinan kolumnar atau path CSV),
+# hanya kolom yang dipakai deteksi anomali
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_hourly_frame(fingerprint, _source):
+    return read_source(_source, [*ANOMALY_COLUMNS, *TIME_SERIES_METRICS])
+
+
+# Sumber data: file yang diunggah jika memiliki kolom per jam, selain itu Data/hour.csv
+def load_hourly_frame():
+    source = session_source(ANOMALY_COLUMNS)
+    if source is not None:
+        return st.session_state.df_fingerprint, cached_hourly_frame(st.session_state.df_fingerprint, source)
+
+    fingerprint = cached_file_fingerprint(str(HOUR_CSV), HOUR_CSV.stat().st_mtime)
+    return fingerprint, cached_hourly_frame(fingerprint, str(HOUR_CSV))
+
+
+# Skor anomali seluruh data di-cache per sidik jari data dan parameter
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_anomalies(fingerprint, metric, window, threshold, _df, _progress=None):
+    return detect_anomalies(_df, metric, window=window, threshold=threshold, progress=_progress)
+
+
+# Detektor streaming yang buffernya diisi dari seluruh data sumber; tiap sesi memakai salinannya sendiri
+@st.cache_resource(max_entries=8, show_spinner=False)
+def cached_warm_detector(fingerprint, metric, window, threshold, _df):
+    return StreamingDetector(metric, window=window, threshold=threshold).warm(_df)
+
+
+def render():
+    page_anomali()
+
+
+# Halaman Deteksi Anomali; parameter hanya menjalankan ulang fragment ini
+@st.fragment
+def page_anomali():
+    st.subheader("Deteksi Anomali Penyewaan Per Jam 🚨")
+    with stage("hourly frame"):
+        fingerprint, df = load_hourly_frame()
+
+    st.write("Tiap jam dibandingkan dengan baseline musiman: median dan MAD beberapa pengamatan terakhir pada musim, hari "
+             "dan jam yang sama. Jam dengan skor z robust melebihi batas ditandai sebagai anomali tanpa menghapus barisnya.")
+    col_metric, col_window, col_threshold = st.columns(3)
+    metric = col_metric.selectbox("Metrik", [col for col in TIME_SERIES_METRICS if col in df.columns])
+    window = col_window.slider("Panjang baseline (minggu)", 4, 13, DEFAULT_WINDOW)
+    threshold = col_threshold.slider("Batas skor z robust", 2.5, 8.0, DEFAULT_THRESHOLD, step=0.5)
+
+    def task(progress):
+        return cached_anomalies(fingerprint, metric, window, threshold, df, _progress=progress)
+
+    result = run_in_background(("anomaly", fingerprint, metric, window, threshold), task, "Menghitung skor anomali")
+    if result is None:
+        return
+
+    flagged = result[result["anomaly"]]
+    n_spikes = int((flagged["score"] > 0).sum())
+    st.write(f"📌 **{len(flagged):,}** dari **{len(result):,}** jam ditandai anomali ({len(flagged) / len(result):.1%}): "
+             f"**{n_spikes:,}** lonjakan dan **{len(flagged) - n_spikes:,}** penurunan.")
+
+    # Rentang waktu grafik; bawaan 4 minggu terakhir
+    first, last = result.index[0].to_pydatetime(), result.index[-1].to_pydatetime()
+    start, end = st.slider("Rentang waktu", min_value=first, max_value=last,
+                           value=(max(first, last - pd.Timedelta(weeks=4)), last), format="YYYY-MM-DD")
+    figsize = (10, 5)
+    shown = result.loc[start:end]
+    shown_flagged = shown[shown["anomaly"]]
+    max_points = pixel_points(figsize, CHART_DPI)
+    show_chart(charts.draw_anomaly_line, fingerprint,
+               downsample(shown[metric], max_points), downsample(shown["baseline"].dropna(), max_points),
+               shown_flagged.loc[shown_flagged["score"] > 0, metric], shown_flagged.loc[shown_flagged["score"] < 0, metric],
+               key=(metric, window, threshold, start, end), title=f"Anomali Penyewaan Per Jam ({metric})", figsize=figsize)
+
+    st.write("### Anomali Terbesar")
+    strongest = flagged.reindex(flagged["score"].abs().sort_values(ascending=False).index).head(20)
+    st.dataframe(strongest[[metric, "baseline", "score", "direction", "season", "weekday", "hr"]].round(2))
+
+    section_streaming(fingerprint, df, metric, window, threshold)
+
+
+# Pemantauan data baru: baris per jam yang diunggah diskor dengan detektor streaming (memori tetap per deret).
+# Detektor sesi melanjutkan dari data sumber, sehingga unggahan berikutnya memakai baseline yang sudah diperbarui.
+def section_streaming(fingerprint, df, metric, window, threshold):
+    st.write("### 📡 Pemantauan Data Baru (Streaming)")
+    detector_key = (fingerprint, metric, window, threshold)
+    if st.session_state.get("anomaly_detector_key") != detector_key:
+        st.session_state.anomaly_detector = cached_warm_detector(fingerprint, metric, window, threshold, df).copy()
+        st.session_state.anomaly_detector_key = detector_key
+        st.session_state.anomaly_scored = []
+        st.session_state.anomaly_alerts = []
+    detector = st.session_state.anomaly_detector
+
+    new_file = st.file_uploader("Pilih file CSV berisi baris per jam yang baru", type=["csv"], key="anomaly_file")
+    if new_file is not None:
+        data = new_file.getvalue()
+        new_fingerprint = fingerprint_bytes(data)
+        if new_fingerprint not in st.session_state.anomaly_scored:
+            new_rows = read_bike_csv(data)
+            missing = [col for col in [*ANOMALY_COLUMNS, metric] if col not in new_rows.columns]
+            if missing:
+                st.error(f"Data baru tidak dapat diskor: kolom tidak ditemukan {missing}")
+                return
+            with stage("anomaly stream"):
+                scored = detector.score(new_rows)
+            st.session_state.anomaly_scored.append(new_fingerprint)
+            st.session_state.anomaly_alerts.append(scored[scored["anomaly"]])
+
+    st.caption(f"Detektor: {detector.n_seen:,} baris diproses, state {detector.nbytes / 1024:.0f} KB "
+               f"({len(st.session_state.anomaly_scored)} file baru).")
+    alerts = [alert for alert in st.session_state.anomaly_alerts if not alert.empty]
+    if not st.session_state.anomaly_scored:
+        return
+    if not alerts:
+        st.success("✅ Tidak ada anomali pada data baru.")
+        return
+    alerts = pd.concat(alerts)
+    st.error(f"🚨 {len(alerts)} jam anomali pada data baru")
+    st.dataframe(alerts[[metric, "baseline", "score", "direction"]].round(2))
@@ -0,0 +1,66 @@
+import pandas as pd
+import streamlit as st
+
+import charts
+from profiler import profile_frame
+from views.common import run_in_background, session_frame, stage
+from views.figures import show_chart
+
+
+# Profil data halaman Assessing Data (satu lintasan per potongan) di-cache per sidik jari data
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_profile(fingerprint, _df, _progress=None):
+    return profile_frame(_df, multiplier=1.5, progress=_progress)
+
+
+# Halaman Assessing Data
+def render():
+    if st.session_state.df_handle is None:
+        st.warning("Silakan unggah data terlebih dahulu di Data Gathering!")
+        return
+    df, fingerprint = session_frame("df"), st.session_state.df_fingerprint
+
+    st.subheader("Pengecekan Kualitas Data")
+
+    with stage("assess"):
+        assessment = run_in_background(("profile", fingerprint), lambda progress: cached_profile(fingerprint, df, _progress=progress),
+                                       "Memprofilkan data")
+    if assessment is None:
+        return
+
+    st.write("Jumlah Missing Values:")
+    st.write(assessment["missing"])
+
+    st.write("Jumlah Data Duplikat:", assessment["duplicates"])
+
+    st.write("Deskripsi Statistik Dataset:")
+    st.write(assessment["describe"])
+    errors = assessment["errors"]
+    if (errors["quantile"].fillna(0) > 0).any():
+        approximate = errors.index[errors["quantile"].fillna(0) > 0].tolist()
+        st.caption(f"Kuartil dan jumlah outlier kolom {', '.join(approximate)} adalah perkiraan "
+                   f"(galat maksimal per kolom: {errors.loc[approximate, 'quantile'].round(6).to_dict()})")
+
+    # Deteksi Outlier Menggunakan IQR
+    st.subheader("Deteksi Outlier Menggunakan IQR")
+    continuous_columns = assessment["continuous_columns"]
+
+    # Jumlah outlier per variabel, kuartil semua kolom dihitung sekaligus
+    outlier_series = assessment["outliers"]
+    outlier_counts = outlier_series[outlier_series > 0].to_dict()
+
+    # Tampilkan jumlah variabel yang memiliki outlier
+    if outlier_counts:
+        st.write(f"Jumlah variabel yang memiliki outlier: **{len(outlier_counts)}** dari {len(continuous_columns)}")
+        df_outlier_info = pd.DataFrame(outlier_counts.items(), columns=["Variabel", "Jumlah Outlier"])
+        df_outlier_info.index += 1  # Menambahkan nomor urut
+        st.dataframe(df_outlier_info)  # Menampilkan dalam format tabel interaktif
+    else:
+        st.success("Tidak ada outlier yang terdeteksi dalam dataset.")
+
+    # Visualisasi Outlier
+    st.subheader("Visualisasi Outlier")
+    if continuous_columns:
+        show_chart(charts.draw_boxplot, fingerprint, df, columns=continuous_columns, figsize=(10, 5))
+    else:
+        st.warning("Tidak ada variabel kontinu untuk divisualisasikan.")
@@ -0,0 +1,94 @@
+import streamlit as st
+
+import charts
+from analytics import CLEANING_MODES
+from outliers import split_numeric_columns
+from pipeline import DEFAULT_MULTIPLIER, prepare_dates, run_pipeline
+from views.common import session_frame, set_session_frame, shared_store, stage
+from views.figures import show_chart
+
+
+# Jumlah baris data hasil tahap prepare yang ditampilkan
+PREVIEW_ROWS = 1000
+
+
+# Tahap pipeline (prepare -> clean) per data sumber dan parameter, dipakai bersama semua sesi lewat store.
+# Tahap yang sudah ada tidak dihitung ulang: mengubah mode atau pengali IQR hanya menjalankan tahap clean.
+def load_clean_dataset(fingerprint, mode, multiplier):
+    return run_pipeline(shared_store(), fingerprint, mode=mode, multiplier=multiplier)
+
+
+def render():
+    if st.session_state.df_handle is None:
+        st.warning("Silakan unggah data terlebih dahulu di Data Gathering!")
+        return
+    page_cleaning_data(st.session_state.df_fingerprint)
+
+
+# Halaman Cleaning Data; dijalankan sebagai fragment sehingga mengganti mode pembersihan atau pengali IQR
+# hanya menjalankan ulang halaman ini
+@st.fragment
+def page_cleaning_data(fingerprint):
+    st.subheader("Data Setelah Dibersihkan")
+
+    # Pilih mode pembersihan dan pengali IQR (batas Q1 - k*IQR sampai Q3 + k*IQR).
+    # Setelah Tambah Data Baru, data bersih berasal dari rangkuman inkremental (mode serentak dengan pengali
+    # IQR saat data pertama ditambahkan), sehingga pilihan dikunci agar sama dengan data halaman analisis.
+    incremental = session_frame("incremental")
+    col_mode, col_multiplier = st.columns(2)
+    modes = list(CLEANING_MODES)
+    if incremental is not None:
+        col_mode.radio("Mode pembersihan outlier", modes, index=list(CLEANING_MODES.values()).index("simultaneous"),
+                       horizontal=True, disabled=True)
+        col_multiplier.slider("Pengali IQR", 0.5, 3.0, incremental.multiplier, step=0.25, disabled=True)
+        st.info("Data sudah ditambah lewat *Tambah Data Baru*: pembersihan memakai mode serentak dengan pengali IQR "
+                f"{incremental.multiplier:g} dari rangkuman inkremental. Unggah ulang data untuk mengganti parameter.")
+        with stage("clean"):
+            prepared = prepare_dates(session_frame("df"))
+            clean_fingerprint = st.session_state.df_clean_fingerprint
+            clean_handle = st.session_state.df_clean_handle
+            df_cleaned_final = clean_handle.get()
+    else:
+        cleaning_mode = col_mode.radio("Mode pembersihan outlier", modes, horizontal=True)
+        multiplier = col_multiplier.slider("Pengali IQR", 0.5, 3.0, DEFAULT_MULTIPLIER, step=0.25)
+        # Dipakai sebagai parameter pembersihan saat data pertama kali ditambah (lihat views/gathering.py)
+        st.session_state.clean_params = {"mode": CLEANING_MODES[cleaning_mode], "multiplier": multiplier}
+
+        # Tanggal dikonversi di tahap prepare dan outlier dihapus di tahap clean; hasil tiap tahap disimpan di store
+        # sehingga data unggahan tidak diubah dan kunjungan ulang ke halaman ini tidak menghitung apa pun lagi
+        with stage("clean"):
+            stages = load_clean_dataset(fingerprint, CLEANING_MODES[cleaning_mode], multiplier)
+            prepared = stages["prepare"][1].get()
+            clean_fingerprint, clean_handle = stages["clean"]
+            df_cleaned_final = clean_handle.get()
+
+    # Menampilkan data tanpa waktu di Streamlit
+    st.dataframe(prepared.head(PREVIEW_ROWS), column_config={"dteday": st.column_config.DateColumn(format="YYYY-MM-DD")})
+    if len(prepared) > PREVIEW_ROWS:
+        st.caption(f"Menampilkan {PREVIEW_ROWS:,} dari {len(prepared):,} baris.")
+
+    # Deteksi kolom numerik dan biner
+    binary_columns, continuous_columns = split_numeric_columns(prepared)
+
+    # Cek apakah data tidak kosong setelah pembersihan
+    if not df_cleaned_final.empty:
+        set_session_frame("df_clean", clean_handle)
+        st.session_state.df_clean_fingerprint = clean_fingerprint
+
+        st.subheader("Statistik Data Setelah Cleaning")
+        numeric_columns = df_cleaned_final.select_dtypes(include='number').columns
+        st.write(df_cleaned_final[numeric_columns].describe())
+
+        st.subheader("Visualisasi Data Setelah Outlier Dihapus")
+        if continuous_columns:
+            show_chart(charts.draw_boxplot, clean_fingerprint, df_cleaned_final, columns=continuous_columns, figsize=(10, 5))
+        else:
+            st.warning("Tidak ada variabel kontinu untuk divisualisasikan.")
+
+        st.write(f"📌 **Jumlah data sebelum pembersihan:** `{len(prepared)}`")
+        st.write(f"📌 **Jumlah data setelah pembersihan:** `{len(df_cleaned_final)}`")
+
+        if len(df_cleaned_final) < len(prepared) * 0.1:
+            st.warning("⚠️ Data yang tersisa kurang dari 10% setelah pembersihan outlier. Pertimbangkan untuk menaikkan pengali IQR.")
+    else:
+        st.warning("❗ Data menjadi kosong setelah pembersihan outlier. Silakan naikkan pengali IQR atau cek dataset.")
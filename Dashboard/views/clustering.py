@@ -0,0 +1,82 @@
+import streamlit as st
+
+import charts
+from segmentation import RENTAL_LABELS, segment, segment_counts, segment_within_groups
+from views.figures import show_chart
+from views.results import load_session_results, show_report_chart
+
+
+def render():
+    loaded = load_session_results()
+    if loaded is not None:
+        page_clustering(*loaded)
+
+
+# Segmentasi penyewaan; pilihan metrik/kelompok hanya menggambar ulang grafik segmentasi
+@st.fragment
+def fragment_rental_segmentation(load_clean, clean_fingerprint, results):
+    df_cleaned_final = load_clean()
+
+    # Pilih metrik dan kelompok segmentasi
+    col_metric, col_group = st.columns(2)
+    segment_metric = col_metric.selectbox("Metrik", ["cnt", "casual", "registered"])
+    group_options = {"Tanpa kelompok": None, "Per musim": "season", "Per cuaca": "weathersit", "Per hari kerja": "workingday"}
+    if "hr" in df_cleaned_final.columns:
+        group_options["Per jam"] = "hr"
+    segment_group = group_options[col_group.selectbox("Segmentasi kuartil", list(group_options))]
+
+    # Segmentasi bawaan (cnt tanpa kelompok) sudah ada di hasil analisis
+    if segment_metric == "cnt" and segment_group is None:
+        show_report_chart("rental_segments_bar", clean_fingerprint, results)
+        return
+
+    # Kategori rental berdasarkan kuartil: Low < Q1 <= Medium <= Q3 < High
+    if segment_group is None:
+        rental_category = segment(df_cleaned_final[segment_metric], quantiles=(0.25, 0.75), labels=RENTAL_LABELS)
+    else:
+        rental_category = segment_within_groups(df_cleaned_final, segment_metric, segment_group, quantiles=(0.25, 0.75), labels=RENTAL_LABELS)
+
+    # Hitung jumlah masing-masing kategori
+    category_counts = segment_counts(rental_category)
+
+    # Visualisasi jumlah penyewaan berdasarkan kategori
+    show_chart(charts.draw_category_counts_bar, clean_fingerprint, category_counts, key=(segment_metric, segment_group), figsize=(8, 5))
+
+
+# Halaman Analisis Clustering Manual
+def page_clustering(load_clean, clean_fingerprint, results):
+    st.subheader("📊 **Analisis Segmentasi Data dengan Clustering**")
+    st.markdown("### 🔍 **Pembagian Kategori Penyewaan Sepeda**")
+
+    fragment_rental_segmentation(load_clean, clean_fingerprint, results)
+
+    # Insight
+    st.markdown("""
+    ## 🔎 **Insight dari Clustering Penyewaan Sepeda**  
+
+    **1️⃣ "Medium Rental" Mendominasi** 📈  
+    ✅ Sebagian besar hari dalam dataset berada dalam kategori **Medium Rental**, dengan **299 hari** di dalamnya.  
+    ✅ Ini menunjukkan bahwa pola penyewaan sepeda cenderung **berada di tingkat menengah**, bukan ekstrem rendah atau tinggi.  
+
+    **2️⃣ "Low" dan "High Rental" Memiliki Jumlah yang Sama** ⚖️  
+    ✅ Kategori **Low Rental** dan **High Rental** masing-masing terjadi selama **150 hari**.  
+    ✅ Artinya, jumlah hari dengan penyewaan yang sangat rendah **sama banyaknya** dengan jumlah hari dengan penyewaan tinggi.  
+
+    **3️⃣ Distribusi yang Simetris** 📊  
+    ✅ Penyebaran data menunjukkan bahwa jumlah penyewaan **berpusat di kategori Medium**, dengan jumlah hari di kategori Low dan High yang seimbang.  
+    ✅ Hal ini bisa menunjukkan **tren musiman**, cuaca, atau faktor eksternal lain yang memengaruhi pola penyewaan sepeda.  
+
+    **4️⃣ Potensi untuk Meningkatkan High Rental** 🚀  
+    ✅ Karena jumlah hari dengan penyewaan tinggi **tidak mendominasi**, ada **peluang untuk meningkatkan jumlah hari** dalam kategori High Rental.  
+    ✅ Beberapa strategi yang bisa diterapkan:  
+    🔹 **Promosi atau diskon** di akhir pekan untuk menarik lebih banyak pelanggan.  
+    🔹 **Event atau kampanye khusus** untuk mendorong penggunaan sepeda lebih sering.  
+    🔹 **Penyediaan fasilitas tambahan** seperti layanan antar-jemput atau diskon bagi pelanggan tetap.  
+
+    ---
+
+    ## 📌 **Kesimpulan**  
+    Data menunjukkan bahwa tren penyewaan sepeda **lebih sering berada di level menengah** dibandingkan ekstrem rendah atau tinggi.  
+    Namun, ada **potensi besar untuk meningkatkan jumlah hari dengan penyewaan tinggi** melalui strategi bisnis yang tepat.  
+    🚴💡 Dengan optimalisasi layanan dan promosi yang tepat, jumlah penyewaan dapat **didorong ke level yang lebih tinggi!**  
+    """)
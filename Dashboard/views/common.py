@@ -0,0 +1,115 @@
+import os
+import sys
+
+import streamlit as st
+
+from executor import JobExecutor
+from fingerprint import fingerprint_file
+from shared_store import DEFAULT_BUDGET_BYTES, DEFAULT_TTL_SECONDS, SharedStore
+
+
+# Backend agregasi untuk Analisis Statistik (label sidebar -> backend)
+AGGREGATION_BACKENDS = {"Pandas (memori)": "pandas", "SQLite (disk)": "sqlite"}
+
+# Batas memori (MB) dan TTL (detik) store DataFrame bersama
+STORE_BUDGET_BYTES = int(float(os.environ.get("DASHBOARD_STORE_BUDGET_MB", DEFAULT_BUDGET_BYTES / 2**20)) * 2**20)
+STORE_TTL_SECONDS = float(os.environ.get("DASHBOARD_STORE_TTL", DEFAULT_TTL_SECONDS))
+
+# Interval pembaruan progres job latar belakang, dan lama menunggu job sebelum progres ditampilkan
+# (job yang hasilnya sudah ada di cache selesai dalam waktu ini dan langsung dirender)
+JOB_POLL_SECONDS = 0.5
+JOB_INLINE_WAIT_SECONDS = 0.3
+
+
+# Copy-on-write pandas untuk seluruh proses, diatur sekali saat modul ini pertama kali diimpor oleh dashboard.py:
+# salinan dangkal dari store bersama (lihat SharedStore.get) berbagi memori sampai salah satunya diubah.
+# pandas baru dimuat oleh halaman yang membutuhkannya, jadi biasanya cukup lewat variabel lingkungan.
+if "pandas" in sys.modules:
+    sys.modules["pandas"].set_option("mode.copy_on_write", True)
+else:
+    os.environ["PANDAS_COPY_ON_WRITE"] = "1"
+
+
+# Ukur satu stage (waktu wall, CPU, memori) dengan recorder milik sesi
+def stage(name, **labels):
+    return st.session_state.recorder.stage(name, **labels)
+
+
+# Satu store DataFrame untuk semua sesi; sesi hanya menyimpan handle ke entri store
+@st.cache_resource(show_spinner=False)
+def shared_store():
+    return SharedStore(budget_bytes=STORE_BUDGET_BYTES, ttl_seconds=STORE_TTL_SECONDS)
+
+
+# DataFrame milik sesi (salinan copy-on-write dari store) atau None
+def session_frame(name):
+    handle = st.session_state.get(f"{name}_handle")
+    return None if handle is None else handle.get()
+
+
+# Sumber data mentah sesi untuk halaman yang hanya membaca sebagian kolom (lihat storage.read_source):
+# salinan kolumnar data unggahan jika ada (lihat views/gathering.py), selain itu DataFrame sesi.
+# None jika belum ada data atau data sesi tidak memiliki semua kolom `required`.
+def session_source(required):
+    from storage import source_columns
+
+    if st.session_state.df_fingerprint is None:
+        return None
+    source = st.session_state.df_columnar or session_frame("df")
+    if source is None or not set(required) <= set(source_columns(source)):
+        return None
+    return source
+
+
+# Ganti handle sesi; referensi ke entri lama dilepas agar bisa dibuang dari store
+def set_session_frame(name, handle):
+    previous = st.session_state.get(f"{name}_handle")
+    st.session_state[f"{name}_handle"] = handle
+    if previous is not None and previous is not handle:
+        previous.release()
+
+
+# Sidik jari file lokal, dihitung ulang hanya jika waktu modifikasinya berubah
+@st.cache_data(show_spinner=False)
+def cached_file_fingerprint(path, modified):
+    return fingerprint_file(path)
+
+
+# Satu pool analisis latar belakang untuk semua sesi (lihat executor.py)
+@st.cache_resource(show_spinner=False)
+def job_executor():
+    return JobExecutor()
+
+
+# Jalankan analisis berat `task(progress)` di latar belakang dengan kunci `key` (sidik jari data + parameter).
+# Hasil dikembalikan jika job selesai dalam JOB_INLINE_WAIT_SECONDS; selain itu progres ditampilkan, None
+# dikembalikan, dan halaman dirender ulang otomatis saat job selesai. `task` menyimpan hasilnya sendiri
+# (st.cache_data) sehingga job berikutnya dengan kunci yang sama langsung selesai.
+def run_in_background(key, task, label):
+    st.session_state.active_jobs.add(key)
+    if key in st.session_state.cancelled_jobs:
+        st.info(f"{label} dibatalkan.")
+        if st.button("Jalankan ulang", key=f"restart {key}"):
+            st.session_state.cancelled_jobs.discard(key)
+            st.rerun()
+        return None
+
+    job = job_executor().submit(key, task, owner=st.session_state.session_id)
+    if job.wait(JOB_INLINE_WAIT_SECONDS):
+        return job.result()
+    show_job_progress(key, label)
+    return None
+
+
+# Progres job diperbarui tanpa menjalankan ulang halaman; saat job selesai seluruh halaman dirender ulang
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def show_job_progress(key, label):
+    job = job_executor().get(key)
+    if job is None or job.done():
+        st.rerun()
+    st.progress(job.progress, text=f"{label}: {job.message} ({job.elapsed:.0f} detik)")
+    if st.button("Batalkan", key=f"cancel {key}"):
+        # Job hanya berhenti jika tidak ada sesi lain yang masih menunggu hasilnya
+        st.session_state.cancelled_jobs.add(key)
+        job_executor().release(st.session_state.session_id, keep=st.session_state.active_jobs - {key})
+        st.rerun()
@@ -0,0 +1,32 @@
+import streamlit as st
+
+
+def render():
+    page_kesimpulan()
+
+
+# Halaman Kesimpulan
+def page_kesimpulan():
+    st.subheader("📌 Kesimpulan")
+    
+    # Menambahkan garis pemisah dekoratif
+    st.markdown("---")
+
+    # Kesimpulan Pertanyaan 1
+    st.markdown("### 💡 Kesimpulan Pertanyaan 1")
+    st.info(
+        "Cuaca dan musim berpengaruh signifikan terhadap jumlah penyewaan sepeda. "
+        "Pengguna cenderung lebih banyak menyewa sepeda pada musim gugur & musim panas. "
+        "Cuaca buruk mengurangi jumlah penyewaan secara signifikan."
+    )
+
+    # Kesimpulan Pertanyaan 2
+    st.markdown("### 💡 Kesimpulan Pertanyaan 2")
+    st.success(
+        "Penyewaan sepeda lebih tinggi pada hari kerja, kemungkinan besar karena penggunaan "
+        "untuk transportasi kerja atau sekolah. Pada akhir pekan, jumlah penyewaan berkurang, "
+        "kemungkinan karena orang lebih sedikit bepergian atau lebih memilih kendaraan lain untuk rekreasi."
+    )
+
+    # Menambahkan garis pemisah di akhir
+    st.markdown("---")
@@ -0,0 +1,162 @@
+import pandas as pd
+import streamlit as st
+
+import charts
+from correlation import correlation_matrix
+from views.common import run_in_background
+from views.figures import show_chart
+from views.results import incremental_dataset, load_session_results, show_report_chart
+
+
+# Label pilihan metode korelasi
+CORRELATION_METHODS = {"Pearson": "pearson", "Spearman (peringkat)": "spearman"}
+
+# Batas signifikansi uji korelasi
+CORRELATION_ALPHA = 0.05
+
+
+def render():
+    loaded = load_session_results()
+    if loaded is not None:
+        page_korelasi_anova(*loaded)
+
+
+# Matriks korelasi semua kolom numerik beserta p-value, di-cache per sidik jari data dan metode.
+# Pearson data hasil append diambil dari statistik yang sudah diperbarui dataset inkremental.
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_correlation(fingerprint, method, _load, _progress=None):
+    dataset = incremental_dataset(fingerprint) if method == "pearson" else None
+    if dataset is not None:
+        return dataset.correlation.result()
+    return correlation_matrix(_load(), method, progress=_progress)
+
+
+# Pasangan kolom dengan korelasi signifikan, diurutkan dari |r| terbesar
+def significant_pairs(correlation, alpha=CORRELATION_ALPHA):
+    r, p = correlation["r"], correlation["p"]
+    rows = [{"Variabel 1": left, "Variabel 2": right, "r": r.at[left, right], "p-value": p.at[left, right]}
+            for i, left in enumerate(r.columns) for right in r.columns[i + 1:] if p.at[left, right] < alpha]
+    pairs = pd.DataFrame(rows, columns=["Variabel 1", "Variabel 2", "r", "p-value"])
+    return pairs.reindex(pairs["r"].abs().sort_values(ascending=False).index).reset_index(drop=True)
+
+
+# Matriks korelasi lengkap; mengganti metode hanya menjalankan ulang bagian ini
+@st.fragment
+def fragment_correlation_matrix(load_clean, clean_fingerprint):
+    st.write("### 🧮 Matriks Korelasi Semua Variabel Numerik")
+    label = st.radio("Metode korelasi", list(CORRELATION_METHODS), horizontal=True)
+    method = CORRELATION_METHODS[label]
+
+    def task(progress):
+        return cached_correlation(clean_fingerprint, method, load_clean, _progress=progress)
+
+    if clean_fingerprint is None:
+        correlation = task(None)
+    else:
+        correlation = run_in_background(("correlation", clean_fingerprint, method), task, "Menghitung matriks korelasi")
+    if correlation is None:
+        return
+
+    show_chart(charts.draw_correlation_significance, clean_fingerprint, correlation["r"], correlation["p"],
+               key=(method,), figsize=(10, 8))
+    st.caption(f"Korelasi {label} dari {correlation['n']:,} baris; * = signifikan (p-value < {CORRELATION_ALPHA}).")
+    st.dataframe(significant_pairs(correlation).head(10).round(4), hide_index=True)
+
+
+# Halaman Analisis Korelasi dan Uji ANOVA
+def page_korelasi_anova(load_clean, clean_fingerprint, results):
+    # Judul dan Header
+    st.subheader("📊 Hubungan Antar Variabel & Uji ANOVA")
+
+    # 📌 Heatmap Korelasi antara musim, cuaca, dan jumlah penyewaan
+    st.write("### 🔥 Heatmap Korelasi antara Musim, Cuaca, dan Penyewaan")
+    show_report_chart("correlation_heatmap_anova", clean_fingerprint, results)
+
+    # 🔍 Insight Korelasi
+    st.markdown(
+        """
+        **🔹 Insight:**
+        - 📈 **Musim memiliki korelasi positif (0.43)** dengan penyewaan sepeda, artinya lebih banyak sepeda disewa saat musim gugur.
+        - 🌧️ **Cuaca memiliki korelasi negatif (-0.23)**, menunjukkan bahwa semakin buruk cuaca, semakin sedikit sepeda yang disewa.
+        - 🌤️ **Musim dan cuaca hampir tidak berkorelasi (0.018)**, artinya kondisi cuaca tidak selalu mengikuti pola musim.
+        """
+    )
+
+    fragment_correlation_matrix(load_clean, clean_fingerprint)
+
+    # 📌 Uji Normalitas (Shapiro-Wilk, atau D'Agostino-Pearson untuk lebih dari 5000 sampel)
+    normality = results["stats"]["normality"]
+    st.write(f"### 🧪 Uji Normalitas {normality['test']}")
+    p_shapiro = normality["p_value"]
+    st.write(f"📌 **p-value = {p_shapiro:.5f}**")
+
+    if p_shapiro > 0.05:
+        st.success("✅ Data terdistribusi normal. Lanjutkan dengan uji parametrik seperti ANOVA.")
+    else:
+        st.warning("⚠️ Data tidak terdistribusi normal. Pertimbangkan uji non-parametrik seperti Mann-Whitney.")
+
+    # 📌 Uji ANOVA
+    st.write("### 🏆 Uji ANOVA: Perbedaan Penyewaan Berdasarkan Musim")
+    anova_result = results["stats"]["anova"]
+    st.write(f"📌 **F-statistic = {anova_result['statistic']:.2f}, p-value = {anova_result['p_value']:.5f}**")
+
+    if anova_result["p_value"] < 0.05:
+        st.success("✅ Hasil ANOVA menunjukkan ada **perbedaan signifikan** dalam penyewaan berdasarkan musim.")
+    else:
+        st.warning("⚠️ Tidak ada perbedaan signifikan dalam penyewaan berdasarkan musim.")
+
+    # 📌 ANOVA permutasi dan interval kepercayaan rata-rata tiap musim (tidak bergantung asumsi normalitas)
+    st.write("### 🔁 ANOVA Permutasi & Interval Kepercayaan Bootstrap per Musim")
+    permutation = results["stats"]["permutation_anova"]
+    st.write(f"📌 **F-statistic = {permutation['statistic']:.2f}, p-value permutasi = {permutation['p_value']:.5f}** ({permutation['n_resamples']} resample)")
+
+    season_intervals = results["tables"]["season_intervals"].rename(columns={"estimate": "Rata-rata", "low": "Batas Bawah 95%", "high": "Batas Atas 95%"})
+    st.dataframe(season_intervals[["Rata-rata", "Batas Bawah 95%", "Batas Atas 95%"]].round(0))
+
+    # 📌 Visualisasi Rata-rata Penyewaan Berdasarkan Cuaca
+    st.write("### Rata-rata Penyewaan Berdasarkan Kategori Cuaca")
+
+    show_report_chart("weather_category_bar", clean_fingerprint, results)
+
+    st.markdown(
+        """
+        **🔹 Insight:**
+        - 🌞 **Cuaca Cerah (Kategori 1)** memiliki penyewaan tertinggi (**4.876** sepeda/hari).
+        - ☁️ **Cuaca Mendung (Kategori 2)** menurunkan penyewaan menjadi **4.035** sepeda/hari.
+        - ⛈️ **Cuaca Buruk (Kategori 3)** sangat mengurangi penyewaan (**1.803** sepeda/hari).
+        - **Strategi Bisnis**: 🚲 **Promosi diskon atau layanan tambahan** saat cuaca buruk dapat membantu meningkatkan penyewaan.
+        """
+    )
+
+    # 📌 Visualisasi Rata-rata Penyewaan Berdasarkan Musim
+    st.write("### Rata-rata Penyewaan Berdasarkan Kategori Musim")
+
+    show_report_chart("season_category_bar", clean_fingerprint, results)
+
+    st.markdown(
+        """
+        **🔹 Insight:**
+        - 🍁 **Musim Gugur (Fall) memiliki penyewaan tertinggi** (**5.644** sepeda/hari).
+        - 🌱 **Musim Semi (Spring) memiliki penyewaan terendah** (**2.604** sepeda/hari).
+        - 📊 **Polanya: Spring → Summer → Fall (puncak) → Winter**.
+        - **Strategi Bisnis**:
+        - 🚴 **Tambahkan sepeda lebih banyak saat musim gugur** karena permintaan tinggi.
+        - 🎯 **Gunakan promo & event saat musim semi** untuk meningkatkan penyewaan.
+        """
+    )
+
+    # 📌 Kesimpulan dan Rekomendasi
+    st.write("### 🎯 Kesimpulan & Rekomendasi")
+    st.markdown(
+        """
+        ✅ **Kesimpulan:**
+        - 📆 **Musim gugur adalah waktu terbaik** untuk bisnis rental sepeda.
+        - 🌧️ **Cuaca buruk sangat memengaruhi penyewaan** sepeda.
+        - 📊 Uji ANOVA menunjukkan **perbedaan signifikan** dalam jumlah penyewaan berdasarkan musim.
+
+        🎯 **Rekomendasi:**
+        - 🚴 **Sediakan lebih banyak sepeda di musim gugur** untuk memenuhi permintaan.
+        - 💰 **Buat promo khusus saat musim semi & cuaca buruk** untuk meningkatkan penyewaan.
+        - 🛠️ **Pertimbangkan sepeda tahan cuaca** untuk meningkatkan jumlah penyewaan sepanjang tahun.
+        """
+    )
@@ -0,0 +1,25 @@
+import streamlit as st
+
+import charts
+from charts import render_chart
+from views.common import stage
+
+
+# Cache bytes grafik per sidik jari data dan parameter grafik (maksimal 64 grafik, LRU).
+# `key` berisi parameter tambahan yang menentukan data grafik tetapi tidak diteruskan ke fungsi gambar.
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_chart(chart_name, fingerprint, params, key, _data):
+    return render_chart(getattr(charts, chart_name), *_data, **params)
+
+
+# Tampilkan grafik dari cache; tanpa sidik jari grafik selalu digambar ulang
+def show_chart(draw, fingerprint, *data, key=(), **params):
+    with stage(f"chart {draw.__name__}"):
+        if fingerprint is None:
+            image = render_chart(draw, *data, **params)
+        else:
+            image = cached_chart(draw.__name__, fingerprint, params, key, data)
+    if params.get("image_format") == "svg":
+        image = image.decode()
+    with stage(f"st.image {draw.__name__}"):
+        st.image(image, use_container_width=True)
@@ -0,0 +1,116 @@
+import numpy as np
+import streamlit as st
+
+import charts
+from executor import DEFAULT_PROCESS_WORKERS
+from simulation import (DEFAULT_RENTALS_PER_BIKE, DEFAULT_SERVICE_LEVEL, SIMULATION_COLUMNS, DemandModel, fleet_size, fleet_table,
+                        service_curve, simulate, simulate_scenarios, simulation_workers)
+from storage import read_source
+from timeseries import HOUR_CSV
+from views.common import cached_file_fingerprint, run_in_background, session_source, stage
+from views.figures import show_chart
+
+
+# Pilihan jumlah hari simulasi per skenario
+SIMULATION_DAYS = [50_000, 100_000, 200_000, 500_000, 1_000_000]
+
+
+# Model permintaan dibangun sekali per sidik jari data sumber dan dipakai bersama semua sesi
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_demand_model(fingerprint, _source):
+    return DemandModel(read_source(_source, [*SIMULATION_COLUMNS, "yr"]))
+
+
+# Sumber data: file yang diunggah jika memiliki kolom per jam, selain itu Data/hour.csv
+def load_demand_model():
+    source = session_source(SIMULATION_COLUMNS)
+    if source is not None:
+        return st.session_state.df_fingerprint, cached_demand_model(st.session_state.df_fingerprint, source)
+
+    fingerprint = cached_file_fingerprint(str(HOUR_CSV), HOUR_CSV.stat().st_mtime)
+    return fingerprint, cached_demand_model(fingerprint, str(HOUR_CSV))
+
+
+# Hasil simulasi di-cache per sidik jari data dan skenario; tingkat layanan dihitung dari hasil ini tanpa simulasi ulang
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_simulation(fingerprint, season, workingday, weathersit, n_days, growth, _model, _progress=None):
+    return simulate(_model, season, workingday, weathersit, n_days=n_days, growth=growth,
+                    workers=simulation_workers(n_days, DEFAULT_PROCESS_WORKERS), progress=_progress)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def cached_scenarios(fingerprint, n_days, growth, _model, _progress=None):
+    return simulate_scenarios(_model, n_days=n_days, growth=growth, workers=simulation_workers(n_days, DEFAULT_PROCESS_WORKERS), progress=_progress)
+
+
+def render():
+    page_simulasi_armada()
+
+
+# Halaman Simulasi Armada; dijalankan sebagai fragment sehingga mengubah skenario hanya menjalankan ulang halaman ini
+@st.fragment
+def page_simulasi_armada():
+    st.subheader("Simulasi Kebutuhan Jumlah Sepeda (Monte Carlo) 🚲")
+    with stage("demand model"):
+        fingerprint, model = load_demand_model()
+    year_text = f" tahun {2011 + model.year}" if model.year is not None else ""
+    st.write(f"Permintaan tiap jam disampel dari distribusi empiris penyewaan per musim, cuaca, hari kerja dan jam "
+             f"({model.n_rows:,} jam data{year_text}), dengan korelasi antar jam dalam satu hari sebesar "
+             f"**{model.day_correlation:.2f}**. Jumlah sepeda yang dibutuhkan satu hari ditentukan oleh jam tersibuknya.")
+
+    col_days, col_growth = st.columns(2)
+    n_days = col_days.select_slider("Jumlah hari simulasi per skenario", SIMULATION_DAYS, value=200_000)
+    growth = 1 + col_growth.slider("Pertumbuhan permintaan (%)", -20, 50, 0, step=5) / 100
+    col_level, col_rate = st.columns(2)
+    service_level = col_level.slider("Tingkat layanan (proporsi hari semua permintaan terpenuhi)", 0.80, 0.99,
+                                     DEFAULT_SERVICE_LEVEL, step=0.01)
+    rentals_per_bike = col_rate.slider("Penyewaan per sepeda per jam", 0.5, 3.0, DEFAULT_RENTALS_PER_BIKE, step=0.5)
+
+    # 📌 Kebutuhan sepeda per musim dan hari kerja
+    st.write("### Kebutuhan Sepeda per Musim dan Hari Kerja")
+    results = run_in_background(
+        ("fleet scenarios", fingerprint, n_days, growth),
+        lambda progress: cached_scenarios(fingerprint, n_days, growth, model, _progress=progress),
+        "Mensimulasikan semua skenario",
+    )
+    if results is None:
+        return
+    table = fleet_table(results, service_level, rentals_per_bike)
+    table["season"] = table["season"].map(charts.SEASON_LABELS)
+    table["workingday"] = table["workingday"].map({0: "Libur/Akhir Pekan", 1: "Hari Kerja"})
+    st.dataframe(table.rename(columns={"season": "Musim", "workingday": "Hari", "mean_peak": "Rata-rata Jam Tersibuk",
+                                       "mean_total": "Rata-rata Penyewaan Harian", "fleet": "Kebutuhan Sepeda",
+                                       "busiest_hour": "Jam Tersibuk Tersering"}).round(0), hide_index=True)
+    st.caption(f"{len(results) * n_days:,} hari disimulasikan; kebutuhan sepeda = kuantil {service_level:.0%} "
+               f"permintaan jam tersibuk / {rentals_per_bike:g} penyewaan per sepeda per jam.")
+
+    # 📌 Skenario tertentu, termasuk cuaca tetap
+    st.write("### Skenario Tertentu")
+    col_season, col_day, col_weather = st.columns(3)
+    season_options = {label: code for code, label in charts.SEASON_LABELS.items()}
+    season = season_options[col_season.selectbox("Musim", list(season_options), index=2)]
+    workingday = {"Hari Kerja": 1, "Libur/Akhir Pekan": 0}[col_day.radio("Hari", ["Hari Kerja", "Libur/Akhir Pekan"])]
+    weather_options = {"Sesuai data": None, **{label: code for code, label in charts.WEATHER_LABELS.items()}}
+    weathersit = weather_options[col_weather.selectbox("Cuaca", list(weather_options))]
+    if not model.supports(season, workingday):
+        st.warning("Data tidak memiliki jam untuk kombinasi musim dan hari ini.")
+        return
+
+    if weathersit is None:
+        result = results[(season, workingday)]
+    else:
+        result = run_in_background(
+            ("fleet simulation", fingerprint, season, workingday, weathersit, n_days, growth),
+            lambda progress: cached_simulation(fingerprint, season, workingday, weathersit, n_days, growth, model, _progress=progress),
+            "Mensimulasikan skenario",
+        )
+        if result is None:
+            return
+
+    fleet = fleet_size(result["peaks"], service_level, rentals_per_bike)
+    st.write(f"📌 Dibutuhkan **{fleet:,}** sepeda agar semua permintaan terpenuhi pada **{service_level:.0%}** hari "
+             f"(rata-rata jam tersibuk {result['peaks'].mean():,.0f} penyewaan, rata-rata {result['totals'].mean():,.0f} penyewaan per hari).")
+    peaks = result["peaks"] / rentals_per_bike
+    fleets = np.unique(np.linspace(peaks.min(), peaks.max(), 200).astype("int64"))
+    show_chart(charts.draw_service_curve, fingerprint, service_curve(result["peaks"], fleets, rentals_per_bike), fleet, service_level,
+               key=(season, workingday, weathersit, n_days, growth, service_level, rentals_per_bike), figsize=(8, 5))
@@ -0,0 +1,142 @@
+import pandas as pd
+import streamlit as st
+
+from fingerprint import derive_fingerprint, fingerprint_bytes
+from ingestion import COMPACT_THRESHOLD_BYTES, read_bike_csv, read_bike_csv_chunked
+from pipeline import DEFAULT_PARAMS, prepare_dates
+from views.common import session_frame, set_session_frame, shared_store, stage
+
+
+# `uploaded_file` adalah file unggahan Streamlit, `data` isinya
+def parse_dataset(uploaded_file, data):
+    # File besar dibaca bertahap langsung dari file unggahan dengan tipe ringkas agar memori puncak tetap kecil
+    if len(data) > COMPACT_THRESHOLD_BYTES:
+        return read_bike_csv_chunked(uploaded_file)
+    return read_bike_csv(data)
+
+
+# Hasil parsing dipakai bersama oleh semua sesi yang mengunggah file yang sama.
+# Byte file tidak disimpan sebagai loader; loader dari salinan di disk dipasang oleh store_upload.
+def load_dataset(fingerprint, uploaded_file, data):
+    return shared_store().get_or_create(fingerprint, lambda: parse_dataset(uploaded_file, data), keep_loader=False)
+
+
+# Salinan kolumnar data unggahan (lihat storage.store_frame): halaman yang hanya membutuhkan sebagian kolom
+# (deret waktu, anomali, prediksi, simulasi) membaca kolom itu saja dari disk. Salinan ini juga menjadi loader
+# entri store, sehingga data unggahan bisa dilepas dari memori saat melebihi budget walaupun masih dipakai sesi.
+# None jika folder tidak bisa ditulis (data unggahan lalu tetap di memori selama dipakai).
+def store_upload(fingerprint):
+    from storage import read_table, store_frame
+
+    try:
+        path = store_frame(session_frame("df"), fingerprint)
+    except OSError:
+        return None
+    shared_store().set_loader(fingerprint, lambda: read_table(path))
+    return path
+
+
+# Halaman Data Gathering: unggah CSV dan parse sekali per sidik jari file
+def render():
+    st.subheader("Upload Dataset Bike Sharing Harian dalam CSV ")
+    uploaded_file = st.file_uploader("Pilih file CSV", type=["csv"])
+    if uploaded_file is not None:
+        data = uploaded_file.getvalue()
+        fingerprint = fingerprint_bytes(data)
+        # Parse ulang hanya jika file yang diunggah berbeda
+        if st.session_state.upload_fingerprint != fingerprint:
+            with stage("parse"):
+                set_session_frame("df", load_dataset(fingerprint, uploaded_file, data))
+            with stage("columnar copy"):
+                st.session_state.df_columnar = store_upload(fingerprint)
+            set_session_frame("df_clean", None)
+            set_session_frame("incremental", None)
+            st.session_state.upload_fingerprint = fingerprint
+            st.session_state.df_fingerprint = fingerprint
+            st.session_state.appended = []
+        st.write("### Data yang Diunggah:")
+        # Setelah Tambah Data Baru, data gabungan tidak disusun hanya untuk menampilkan beberapa baris pertamanya
+        incremental = session_frame("incremental")
+        st.dataframe(session_frame("df").head() if incremental is None else incremental.head())
+        section_append_data()
+
+
+# Data gabungan menggantikan data sesi lewat sidik jari turunan. Dataset inkremental disimpan di store bersama,
+# dan data bersihnya langsung dipakai halaman analisis: cube diambil dari rangkuman inkremental
+# (lihat views/results.load_cube), tanpa pembersihan dan agregasi ulang seluruh data. Data mentah dan data
+# bersih gabungan baru disusun dari potongan dataset saat halaman yang membutuhkannya dibuka.
+def publish_incremental(incremental, fingerprint):
+    from incremental import dataset_key, incremental_clean_fingerprint
+
+    clean_fingerprint = incremental_clean_fingerprint(fingerprint, incremental.multiplier)
+    store = shared_store()
+    set_session_frame("incremental", store.put(dataset_key(clean_fingerprint), incremental))
+    set_session_frame("df", store.put(fingerprint, None, loader=incremental.frame))
+    st.session_state.df_columnar = None
+    set_session_frame("df_clean", store.put(clean_fingerprint, None, loader=lambda: prepare_dates(incremental.clean_frame())))
+    st.session_state.df_fingerprint = fingerprint
+    st.session_state.df_clean_fingerprint = clean_fingerprint
+
+
+# Parameter pembersihan yang dipilih di halaman Cleaning Data (bawaan pipeline jika belum dibuka)
+def clean_params():
+    return st.session_state.clean_params or DEFAULT_PARAMS
+
+
+# Tambah baris baru (misalnya data satu hari) ke data yang sudah diunggah. Batas IQR, rata-rata
+# kelompok, korelasi dan input uji statistik diperbarui dari baris baru saja (lihat incremental.py).
+def section_append_data():
+    st.write("### Tambah Data Baru (Inkremental)")
+    appended_file = st.file_uploader("Pilih file CSV berisi baris baru", type=["csv"], key="append_file")
+    if appended_file is None and st.session_state.incremental_handle is None:
+        return
+
+    # Modul inkremental (beserta scipy) baru dimuat saat ada data tambahan
+    from incremental import IncrementalDataset, summarize
+
+    if appended_file is not None:
+        data = appended_file.getvalue()
+        append_fingerprint = fingerprint_bytes(data)
+        if append_fingerprint not in st.session_state.appended:
+            try:
+                with stage("append"):
+                    # Salinan dataset dari store (lihat IncrementalDataset.copy), sehingga sesi lain yang
+                    # memakai dataset yang sama tidak ikut berubah
+                    incremental = session_frame("incremental")
+                    if incremental is None:
+                        # Pengali IQR mengikuti pilihan terakhir di halaman Cleaning Data
+                        incremental = IncrementalDataset(session_frame("df"), multiplier=clean_params()["multiplier"])
+                    flipped = incremental.append(parse_dataset(appended_file, data))
+            except ValueError as error:
+                st.error(f"Data baru tidak dapat ditambahkan: {error}")
+                return
+            st.session_state.appended.append(append_fingerprint)
+            st.session_state.last_flipped = flipped
+            publish_incremental(incremental, derive_fingerprint(st.session_state.df_fingerprint, "append", append_fingerprint))
+
+    incremental = session_frame("incremental")
+    if incremental is None:
+        return
+
+    with stage("incremental summary"):
+        summary = summarize(incremental)
+    # Rangkuman inkremental hanya mendukung mode simultan; halaman analisis memakai data bersih ini
+    if clean_params()["mode"] != "simultaneous":
+        st.info("Setelah data ditambahkan, pembersihan outlier memakai mode serentak (semua kolom) untuk semua halaman analisis.")
+    st.write(f"📌 **{len(st.session_state.appended)}** file ditambahkan, total **{summary['n_raw']}** baris "
+             f"(**{summary['n_clean']}** setelah pembersihan outlier mode serentak, pengali IQR {incremental.multiplier:g}). "
+             f"Baris lama yang status outlier-nya berubah pada penambahan terakhir: **{st.session_state.last_flipped}**")
+    st.write("Batas IQR terbaru:")
+    st.dataframe(summary["bounds"])
+    st.write("Rata-rata penyewaan per musim, cuaca dan hari kerja:")
+    st.dataframe(pd.concat({"Musim": summary["season_means"], "Cuaca": summary["weather_means"],
+                            "Hari kerja": summary["workingday_means"]}).to_frame())
+    st.write("Korelasi:")
+    st.dataframe(summary["correlation"])
+    pearson = summary["pearson"]
+    st.write(f"Korelasi Pearson semua kolom numerik ({pearson['n']} baris bersih, diperbarui dari jumlah dan hasil kali silang):")
+    correlation_tab, pvalue_tab = st.tabs(["Koefisien r", "p-value"])
+    correlation_tab.dataframe(pearson["r"].round(3))
+    pvalue_tab.dataframe(pearson["p"])
+    st.write(f"Uji t Welch hari kerja vs akhir pekan: t = {summary['ttest']['statistic']:.3f}, p = {summary['ttest']['p_value']:.3g}; "
+             f"ANOVA musim: F = {summary['anova']['statistic']:.3f}, p = {summary['anova']['p_value']:.3g}")
@@ -0,0 +1,196 @@
+import streamlit as st
+
+import charts
+import resampling
+from resampling import resampling_workers
+from views.common import run_in_background
+from views.results import current_backend, load_cube, load_session_results, run_resampling, show_report_chart
+
+
+def render():
+    loaded = load_session_results()
+    if loaded is not None:
+        page_analisis_awal(*loaded)
+
+
+# Uji permutasi dan bootstrap hari kerja vs akhir pekan dengan jumlah resample tertentu, dihitung dari cube
+def workday_resampling(load_clean, clean_fingerprint, backend, n_resamples, progress=None):
+    report = progress or (lambda done, total, message: None)
+    cube = load_cube(clean_fingerprint, load_clean, backend)
+    workday_rentals = cube.samples("cnt", workingday=1)
+    weekend_rentals = cube.samples("cnt", workingday=0)
+    workers = resampling_workers(cube.n_rows)
+    report(0, 2, "Uji permutasi")
+    permutation = run_resampling(resampling.permutation_test, clean_fingerprint, workday_rentals, weekend_rentals, n_resamples=n_resamples, workers=workers)
+    report(1, 2, "Bootstrap selisih rata-rata")
+    interval = run_resampling(resampling.bootstrap_diff_ci, clean_fingerprint, workday_rentals, weekend_rentals, n_resamples=n_resamples, workers=workers)
+    return permutation, interval
+
+
+# Uji resampling hari kerja vs akhir pekan; slider jumlah resample hanya menjalankan ulang bagian ini
+# Jumlah resample bawaan memakai hasil yang sudah dihitung; nilai lain dihitung di latar belakang
+@st.fragment
+def fragment_workday_resampling(load_clean, clean_fingerprint, results):
+    n_resamples = st.select_slider("Jumlah resample", options=[1000, 2000, 5000, 10000], value=2000)
+    if n_resamples == results["stats"]["n_resamples"]:
+        permutation = results["stats"]["permutation"]
+        interval = results["stats"]["bootstrap_diff"]
+    else:
+        backend = current_backend()
+
+        def task(progress):
+            return workday_resampling(load_clean, clean_fingerprint, backend, n_resamples, progress)
+
+        if clean_fingerprint is None:
+            resampled = task(None)
+        else:
+            resampled = run_in_background(("resampling", clean_fingerprint, backend, n_resamples), task, "Menghitung uji resampling")
+        if resampled is None:
+            return
+        permutation, interval = resampled
+    st.write(f"🔁 **Uji permutasi ({permutation['n_resamples']} resample):** selisih rata-rata = {permutation['statistic']:.0f}, p-value = {permutation['p_value']:.5f}")
+    st.write(f"🎯 **Interval kepercayaan bootstrap 95% untuk selisih rata-rata:** {interval['low']:.0f} sampai {interval['high']:.0f}")
+
+
+# Halaman Analisis Awal: statistik musim/cuaca, korelasi dan uji hari kerja vs akhir pekan
+def page_analisis_awal(load_clean, clean_fingerprint, results):
+    season_stats = results["tables"]["season_stats"]
+    st.write("### Statistik Deskriptif Jumlah Penyewaan Berdasarkan Musim")
+    st.write(season_stats)
+    # Insight Musim:
+    st.write("📌 **Insight Musim:**")
+    st.write("""
+    - **Musim Gugur (Fall) memiliki penyewaan tertinggi**, kemungkinan karena cuaca yang lebih nyaman untuk bersepeda.
+    - **Musim Dingin (Winter) memiliki penyewaan terendah**, mungkin disebabkan oleh suhu dingin dan kondisi yang kurang mendukung.
+    """)
+
+    weather_stats = results["tables"]["weather_stats"]
+    st.write("### Statistik Deskriptif Jumlah Penyewaan Berdasarkan Cuaca")
+    st.write(weather_stats)
+    # Insight Cuaca:
+    st.write("📌 **Insight Cuaca:**")
+    st.write("""
+    - **Penyewaan tertinggi terjadi saat cuaca cerah atau sedikit berawan (kategori 1).**
+    - **Saat cuaca buruk (hujan deras atau salju, kategori 3), penyewaan turun drastis.**
+    - Ini menunjukkan bahwa kondisi cuaca sangat berpengaruh terhadap keputusan orang untuk menyewa sepeda.
+    """)
+
+    st.write("### Korelasi Faktor Cuaca & Musim dengan Penyewaan Sepeda")
+    show_report_chart("correlation_heatmap", clean_fingerprint, results)
+    # Insight Korelasi
+    st.write("📌 **Insight Korelasi:**")
+    st.write("""
+    - **Cuaca memiliki korelasi negatif dengan penyewaan sepeda (-0.234)**, artinya semakin buruk cuaca, semakin sedikit sepeda yang disewa.
+    - **Musim juga mempengaruhi penyewaan**, tetapi tidak sebesar pengaruh cuaca.
+    """)
+
+    # Visualisasi Rata-rata Penyewaan Sepeda pada Hari Kerja vs Akhir Pekan
+    st.write("### Rata-rata Penyewaan Sepeda pada Hari Kerja vs Akhir Pekan")
+
+    show_report_chart("workingday_bar", clean_fingerprint, results)
+
+    # Menampilkan insight di bawah grafik
+    st.write("📌 **Insight Hari Kerja vs Akhir Pekan:**")
+    st.write("""
+    - **Penyewaan lebih tinggi pada hari kerja dibandingkan akhir pekan.**
+    - Ini menunjukkan bahwa sepeda lebih banyak digunakan sebagai alat transportasi sehari-hari, bukan hanya untuk rekreasi.
+    """)
+
+    # Uji Statistik (T-Test)
+    t_stat, p_value = results["stats"]["ttest"]["statistic"], results["stats"]["ttest"]["p_value"]
+
+    # Menampilkan hasil uji t-test
+    st.write(f"📊 **Hasil Uji t-test:** t-statistic = {t_stat:.2f}, p-value = {p_value:.5f}")
+    st.write("📌 P-value yang sangat kecil mengindikasikan bahwa perbedaan jumlah penyewaan antara hari kerja dan akhir pekan signifikan secara statistik, bukan terjadi secara kebetulan.")
+
+    # Uji permutasi dan interval kepercayaan bootstrap untuk hari kerja vs akhir pekan
+    fragment_workday_resampling(load_clean, clean_fingerprint, results)
+
+    
+    # Menghitung rata-rata jumlah penyewaan sepeda per musim
+    season_means = results["tables"]["season_means"]
+
+    # Plot visualisasi untuk musim
+    st.write("### Rata-rata Penyewaan Sepeda Berdasarkan Musim")
+    show_report_chart("season_means_bar", clean_fingerprint, results)
+
+    # Mengonversi indeks menjadi label musim (salinan, hasil analisis di-cache)
+    season_means = season_means.rename(index=charts.SEASON_LABELS)
+
+    # Menampilkan Insight
+    st.write("### 📌 **Insight Penyewaan Sepeda Berdasarkan Musim**")
+    st.markdown("""
+    1️⃣ **Musim panas (Summer) memiliki jumlah penyewaan tertinggi**  
+    🔹 Musim panas (season 3) memiliki rata-rata penyewaan sepeda tertinggi dibandingkan musim lainnya.  
+    🔹 Hal ini mungkin disebabkan oleh cuaca yang lebih mendukung untuk bersepeda, seperti suhu yang nyaman dan kondisi jalan yang lebih baik.  
+
+    2️⃣ **Musim dingin (Winter) memiliki jumlah penyewaan terendah**  
+    🔹 Musim dingin (season 1) menunjukkan rata-rata penyewaan yang jauh lebih rendah dibandingkan musim lainnya.  
+    🔹 Ini bisa disebabkan oleh kondisi cuaca yang lebih ekstrem, seperti suhu dingin, hujan, atau salju yang membuat orang enggan bersepeda.  
+
+    3️⃣ **Musim semi (Spring) dan musim gugur (Fall) memiliki jumlah penyewaan yang hampir sama**  
+    🔹 Musim semi (season 2) dan musim gugur (season 4) memiliki jumlah penyewaan yang relatif mirip.  
+    🔹 Ini menunjukkan bahwa kedua musim ini menawarkan kondisi yang cukup nyaman bagi pengguna sepeda.  
+
+    4️⃣ **Cuaca berpengaruh terhadap tren penggunaan sepeda**  
+    🔹 Bisa disimpulkan bahwa semakin baik cuaca dan kondisi lingkungan, semakin tinggi minat masyarakat dalam menyewa sepeda.  
+
+    ---
+
+    ### 🎯 **Rekomendasi Berdasarkan Insight:**  
+    ✅ **Promosi penyewaan sepeda lebih agresif di musim dingin**  
+    📌 Operator penyewaan sepeda bisa menawarkan diskon atau promosi khusus di musim dingin untuk meningkatkan jumlah penyewaan.  
+
+    ✅ **Persiapan lebih banyak sepeda di musim panas**  
+    📌 Karena permintaan meningkat di musim panas, perusahaan bisa menyiapkan lebih banyak sepeda agar bisa memenuhi kebutuhan pelanggan.  
+
+    ✅ **Analisis lebih lanjut tentang faktor lain**  
+    📌 Perlu dianalisis apakah faktor lain seperti hari libur atau hari kerja juga berpengaruh terhadap jumlah penyewaan.  
+
+    ---
+
+    🚴‍♂️ **Kesimpulan:**  
+    Musim berperan penting dalam tren penyewaan sepeda, dengan musim panas sebagai puncaknya dan musim dingin sebagai yang terendah.  
+
+    """)
+
+
+    # Visualisasi untuk kondisi cuaca
+    st.write("### Rata-rata Penyewaan Sepeda Berdasarkan Kondisi Cuaca")
+
+    show_report_chart("weather_means_bar", clean_fingerprint, results)
+
+    # **Insight**
+    st.write("### 📌 **Insight Penyewaan Sepeda Berdasarkan Cuaca**")
+    st.markdown(f"""
+    1️⃣ **Cuaca yang lebih cerah meningkatkan jumlah penyewaan sepeda** 🏖️  
+    🔹 Pada kondisi cuaca **Clear/Few Clouds/Partly Cloudy**, rata-rata penyewaan sepeda adalah yang tertinggi (**{season_means[1]:.0f} penyewaan**).  
+    🔹 Ini menunjukkan bahwa orang lebih suka menyewa sepeda saat cuaca cerah.  
+
+    2️⃣ **Cuaca berkabut atau mendung sedikit mengurangi penyewaan** 🌫️  
+    🔹 Pada kondisi **Mist/Cloudy**, rata-rata penyewaan turun menjadi **{season_means[2]:.0f} penyewaan**.  
+    🔹 Meskipun lebih rendah dari kondisi cerah, jumlah penyewaan masih cukup tinggi, menunjukkan bahwa kabut atau mendung tidak terlalu berdampak besar pada keputusan penyewaan.  
+
+    3️⃣ **Cuaca hujan atau salju drastis menurunkan penyewaan sepeda** ☔❄️  
+    🔹 Pada kondisi **Light Rain/Snow**, rata-rata penyewaan turun drastis menjadi **{season_means[3]:.0f} penyewaan**.  
+    🔹 Ini masuk akal karena hujan atau salju membuat kondisi jalan lebih berbahaya dan kurang nyaman untuk bersepeda.  
+
+    ---
+
+    ### 🎯 **Rekomendasi berdasarkan insight:**  
+    ✅ **Menyesuaikan jumlah sepeda berdasarkan cuaca** ☀️🌧️  
+    📌Saat cuaca cerah, pastikan jumlah sepeda yang tersedia cukup untuk memenuhi permintaan yang tinggi.  
+    📌 Saat cuaca buruk (hujan/salju), operator bisa mengurangi jumlah sepeda yang disediakan atau menawarkan layanan promosi khusus untuk menarik pelanggan.  
+
+    ✅ **Mempersiapkan layanan tambahan untuk kondisi cuaca buruk** ☂️  
+    📌 Menyediakan perlengkapan tambahan seperti jas hujan atau payung bagi pengguna sepeda saat kondisi mendung/hujan ringan agar penyewaan tetap berjalan.  
+    📌 Menawarkan harga diskon atau promo khusus pada hari-hari dengan cuaca buruk untuk meningkatkan jumlah penyewaan.  
+
+    ✅ **Melakukan prediksi tren penyewaan berbasis cuaca** 📊  
+    📌 Dengan menggunakan data cuaca sebelumnya, bisa dibuat model prediksi untuk memperkirakan jumlah penyewaan berdasarkan kondisi cuaca (lihat *Prediksi Penyewaan*).  
+
+    ---
+
+    🚴‍♂️ **Kesimpulan:**  
+    Cuaca berperan besar dalam jumlah penyewaan sepeda, di mana kondisi cerah mendorong lebih banyak penyewaan, sedangkan hujan atau salju secara signifikan menurunkannya.
+    """)
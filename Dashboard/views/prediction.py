@@ -0,0 +1,74 @@
+import time
+
+import streamlit as st
+
+import charts
+from forecast import DEFAULT_ALPHA, FORECAST_COLUMNS, REQUIRED_COLUMNS, ScenarioGrid, train
+from storage import read_source
+from timeseries import HOUR_CSV
+from views.common import cached_file_fingerprint, session_source, stage
+from views.figures import show_chart
+
+
+# Model prediksi dilatih sekali per sidik jari data sumber dan dipakai bersama semua sesi.
+# Matriks fitur skenario (satu tahun data terakhir) dibangun sekali bersama modelnya.
+@st.cache_resource(max_entries=4, show_spinner="Melatih model prediksi...")
+def cached_forecaster(fingerprint, _source):
+    df = read_source(_source, FORECAST_COLUMNS)
+    model, metrics = train(df)
+    return model, metrics, ScenarioGrid(model.spec, df)
+
+
+# Sumber data model: file yang diunggah jika memiliki fitur lengkap (per jam atau harian), selain itu Data/hour.csv
+def load_forecaster():
+    source = session_source(REQUIRED_COLUMNS)
+    if source is not None:
+        return st.session_state.df_fingerprint, cached_forecaster(st.session_state.df_fingerprint, source)
+    if st.session_state.df_fingerprint is not None:
+        st.info("Data yang diunggah tidak memiliki semua kolom fitur model, jadi model dilatih dari `Data/hour.csv`.")
+
+    fingerprint = cached_file_fingerprint(str(HOUR_CSV), HOUR_CSV.stat().st_mtime)
+    return fingerprint, cached_forecaster(fingerprint, str(HOUR_CSV))
+
+
+# Model prediksi memakai data mentah (per jam atau harian), tidak membutuhkan data bersih
+def render():
+    page_prediksi()
+
+
+# Halaman Prediksi Penyewaan; dijalankan sebagai fragment sehingga mengubah skenario hanya menghitung ulang prediksi.
+# Model tidak dilatih ulang: skenario cuaca cukup mengubah kolom matriks fitur, dan alpha lain diselesaikan dari XᵀX yang tersimpan.
+@st.fragment
+def page_prediksi():
+    st.subheader("Prediksi Penyewaan Berdasarkan Cuaca dan Kalender 🔮")
+    fingerprint, (model, metrics, grid) = load_forecaster()
+
+    calendar = "jam x hari kerja" if model.spec.hourly else "hari kerja (data harian)"
+    st.write(f"Model regresi ridge (log jumlah penyewaan) dengan fitur suhu, suhu terasa, kelembapan, kecepatan angin, cuaca, musim, "
+             f"{calendar} dan tren tahun, dilatih pada **{model.n_rows}** baris.")
+    if metrics:
+        st.write(f"📌 Evaluasi pada 20% data paling akhir: R² = **{metrics['r2']:.3f}**, MAE = **{metrics['mae']:.1f}** penyewaan per baris")
+
+    col_temp, col_hum, col_weather, col_alpha = st.columns(4)
+    temp_shift = col_temp.slider("Perubahan suhu (°C)", -10, 10, 0)
+    hum_shift = col_hum.slider("Perubahan kelembapan (%)", -30, 30, 0)
+    weather_options = {"Sesuai data": None, **{label: code for code, label in charts.WEATHER_LABELS.items()}}
+    weathersit = weather_options[col_weather.selectbox("Cuaca", list(weather_options))]
+    alpha = col_alpha.select_slider("Regularisasi (alpha)", [0.01, 0.1, 1.0, 10.0, 100.0], value=DEFAULT_ALPHA)
+
+    with stage("forecast score"):
+        started = time.perf_counter()
+        scenario_model = model if alpha == model.alpha else model.with_alpha(alpha)
+        predicted = grid.score(scenario_model, temp_shift=temp_shift, hum_shift=hum_shift, weathersit=weathersit)
+        baseline = grid.score(scenario_model)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    change = (predicted.sum() / baseline.sum() - 1) * 100
+    actual_text = f"; aktual {grid.actual.sum():,.0f}" if grid.actual is not None else ""
+    st.write(f"📌 Total prediksi setahun ({grid.index[0].year}): **{predicted.sum():,.0f}** penyewaan "
+             f"(**{change:+.1f}%** dibanding cuaca sesuai data{actual_text})")
+    st.caption(f"{len(grid)} baris skenario dihitung dalam {elapsed_ms:.1f} ms")
+
+    actual = grid.daily(grid.actual) if grid.actual is not None else None
+    show_chart(charts.draw_forecast_line, fingerprint, grid.daily(predicted), grid.daily(baseline), actual,
+               key=(temp_shift, hum_shift, weathersit, alpha), figsize=(10, 5))
@@ -0,0 +1,146 @@
+import os
+import tempfile
+from pathlib import Path
+
+import streamlit as st
+
+import resampling
+from aggregates import AggregateCube
+from analytics import analyze, report_chart_inputs
+from artifacts import REPORTS_DIR, MANIFEST_NAME, read_report, report_index
+from resampling import resampling_workers
+from sql_backend import SQLiteCube
+from views.common import AGGREGATION_BACKENDS, run_in_background, shared_store, stage
+from views.figures import show_chart
+
+
+# Folder database SQLite per sidik jari data bersih (nama file diberi pid, lihat cached_sqlite_cube)
+SQLITE_DIR = Path(os.environ.get("DASHBOARD_SQLITE_DIR", Path(tempfile.gettempdir()) / "bike_dashboard"))
+
+
+# Dataset inkremental (Tambah Data Baru di Data Gathering) untuk data bersih ini, None jika bukan hasil append
+def incremental_dataset(clean_fingerprint):
+    from incremental import dataset_key
+
+    try:
+        return shared_store().acquire(dataset_key(clean_fingerprint)).get()
+    except KeyError:
+        return None
+
+
+# Cube agregat dibangun sekali per data bersih dan dipakai bersama oleh semua analisis.
+# Data bersih hasil append memakai cube dari rangkuman inkremental, tanpa agregasi ulang seluruh data.
+# `_load` mengembalikan data bersih dan hanya dipanggil jika cube harus dibangun.
+@st.cache_resource(max_entries=8, show_spinner=False)
+def cached_cube(fingerprint, _load):
+    dataset = incremental_dataset(fingerprint)
+    if dataset is not None:
+        return dataset.cube()
+    return AggregateCube(_load())
+
+
+# Database SQLite dibangun sekali per data bersih; file yang sudah ada dipakai ulang.
+# File dihapus saat cube keluar dari cache dan tidak lagi dipakai job mana pun (lihat SQLiteCube.temporary).
+# Jumlah pemakai file dihitung per proses, jadi nama file memuat pid agar proses server lain
+# tidak memakai (atau menghapus) database milik proses ini.
+@st.cache_resource(max_entries=8, show_spinner=False)
+def cached_sqlite_cube(fingerprint, _load):
+    return SQLiteCube.temporary(_load, SQLITE_DIR / f"{fingerprint}.{os.getpid()}.db")
+
+
+# Backend agregasi yang dipilih di sidebar
+def current_backend():
+    return AGGREGATION_BACKENDS[st.session_state.get("aggregation_backend", "Pandas (memori)")]
+
+
+# Backend diberikan oleh pemanggil karena fungsi ini juga dijalankan di thread latar belakang (tanpa session_state).
+# `load_clean` adalah fungsi tanpa argumen yang mengembalikan data bersih (lihat load_session_results).
+def load_cube(fingerprint, load_clean, backend):
+    if fingerprint is None:
+        return AggregateCube(load_clean())
+    if backend == "sqlite":
+        return cached_sqlite_cube(fingerprint, load_clean)
+    return cached_cube(fingerprint, load_clean)
+
+
+# Laporan hasil batch (Dashboard/batch.py) dibaca ulang hanya jika ada manifest yang berubah
+@st.cache_data(show_spinner=False)
+def cached_report_index(signature):
+    return report_index(REPORTS_DIR)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_report(directory, modified):
+    return read_report(directory)
+
+
+def find_report(clean_fingerprint):
+    manifests = sorted(REPORTS_DIR.glob(f"*/{MANIFEST_NAME}"))
+    signature = tuple((str(path), path.stat().st_mtime) for path in manifests)
+    return cached_report_index(signature).get(clean_fingerprint)
+
+
+# Tabel dan statistik halaman analisis di-cache per sidik jari data bersih
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_analysis(fingerprint, backend, _cube, _progress=None):
+    return analyze(_cube, workers=resampling_workers(_cube.n_rows), progress=_progress)
+
+
+# Hasil analisis: dari laporan batch jika tersedia, selain itu dihitung dari cube di latar belakang
+# (None selama job masih berjalan, progresnya ditampilkan di halaman)
+def load_results(clean_fingerprint, load_clean):
+    if clean_fingerprint is None:
+        cube = AggregateCube(load_clean())
+        return analyze(cube, workers=resampling_workers(cube.n_rows))
+    directory = find_report(clean_fingerprint)
+    if directory is not None:
+        return cached_report(directory, (Path(directory) / MANIFEST_NAME).stat().st_mtime)
+
+    backend = current_backend()
+    return run_in_background(
+        ("analysis", clean_fingerprint, backend),
+        lambda progress: cached_analysis(clean_fingerprint, backend, load_cube(clean_fingerprint, load_clean, backend), _progress=progress),
+        "Menghitung analisis")
+
+
+# Fungsi pemuat data bersih sesi, sidik jarinya dan hasil analisisnya; None jika data belum dibersihkan
+# atau analisis masih berjalan. Data bersih hanya dimuat oleh bagian halaman yang membutuhkan barisnya.
+# Dengan backend SQLite, analisis dihitung dari database sehingga data bersih dilepas dari store
+# (dibuat ulang oleh loader-nya jika halaman lain memintanya lagi).
+def load_session_results():
+    clean_handle = st.session_state.df_clean_handle
+    if clean_handle is None:
+        st.warning("Silakan lakukan pembersihan data terlebih dahulu!")
+        return None
+
+    clean_fingerprint = st.session_state.df_clean_fingerprint
+    with stage("analysis"):
+        results = load_results(clean_fingerprint, clean_handle.get)
+    if results is None:
+        return None
+    if clean_fingerprint is not None and current_backend() == "sqlite":
+        shared_store().unload(clean_handle.key)
+    return clean_handle.get, clean_fingerprint, results
+
+
+# Hasil uji resampling di-cache per sidik jari data, nama uji dan parameter
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_resampling(test_name, fingerprint, params, _inputs):
+    return getattr(resampling, test_name)(*_inputs, **params)
+
+
+def run_resampling(test, fingerprint, *inputs, **params):
+    if fingerprint is None:
+        return test(*inputs, **params)
+    return cached_resampling(test.__name__, fingerprint, params, inputs)
+
+
+# Grafik laporan: pakai gambar hasil batch jika ada, selain itu digambar (dan di-cache) seperti biasa
+def show_report_chart(name, fingerprint, results):
+    path = results.get("charts", {}).get(name)
+    if path is not None:
+        with stage(f"st.image {name}"):
+            st.image(path, use_container_width=True)
+        return
+    draw, data, params = report_chart_inputs(name, results)
+    show_chart(draw, fingerprint, *data, **params)
@@ -0,0 +1,141 @@
+import streamlit as st
+
+import charts
+from charts import CHART_DPI
+from downsample import downsample, pixel_points
+from storage import read_source
+from timeseries import FREQUENCIES, HOUR_CSV, TIME_SERIES_METRICS, HourlySeries
+from views.common import cached_file_fingerprint, session_source, stage
+from views.figures import show_chart
+from views.results import load_session_results, show_report_chart
+
+
+# Deret waktu per jam di-cache per sidik jari data sumber (DataFrame, salinan kolumnar atau path CSV).
+# Hanya kolom yang dipakai deret waktu yang dibaca (lihat storage.read_source).
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_hourly_series(fingerprint, _source):
+    return HourlySeries(read_source(_source, ["dteday", "hr", "weekday", *TIME_SERIES_METRICS]))
+
+
+# Sumber data per jam: file yang diunggah jika memiliki kolom `hr`, selain itu Data/hour.csv
+def load_hourly_series():
+    source = session_source(["hr"])
+    if source is not None:
+        return st.session_state.df_fingerprint, cached_hourly_series(st.session_state.df_fingerprint, source)
+
+    fingerprint = cached_file_fingerprint(str(HOUR_CSV), HOUR_CSV.stat().st_mtime)
+    return fingerprint, cached_hourly_series(fingerprint, str(HOUR_CSV))
+
+
+def render():
+    loaded = load_session_results()
+    if loaded is not None:
+        _, clean_fingerprint, results = loaded
+        page_time_series(clean_fingerprint, results)
+
+
+# Grafik deret waktu; resolusi, jendela dan rentang waktu hanya menjalankan ulang grafik ini
+@st.fragment
+def fragment_hourly_trend(hourly_fingerprint, hourly):
+    col_freq, col_metric, col_window = st.columns(3)
+    freq_label = col_freq.selectbox("Resolusi", list(FREQUENCIES), index=1)
+    metric = col_metric.selectbox("Metrik", hourly.metrics)
+    window_type = col_window.selectbox("Jendela", ["Rolling", "Expanding", "Tanpa"])
+    window = st.slider("Panjang jendela rolling (periode)", 2, 60, 7) if window_type == "Rolling" else None
+    sampling_methods = {"Min/Max per piksel": "minmax", "LTTB": "lttb"}
+    sampling = sampling_methods[st.radio("Downsampling", list(sampling_methods), horizontal=True)]
+
+    # Rentang waktu untuk drill-down
+    start, end = st.slider(
+        "Rentang waktu",
+        min_value=hourly.start.to_pydatetime(),
+        max_value=hourly.end.to_pydatetime(),
+        value=(hourly.start.to_pydatetime(), hourly.end.to_pydatetime()),
+        format="YYYY-MM-DD"
+    )
+
+    freq = FREQUENCIES[freq_label]
+    figsize = (10, 5)
+    max_points = pixel_points(figsize, CHART_DPI)
+
+    # Titik aktual diambil dari level piramida yang sesuai rentang zoom, maksimal satu titik per piksel
+    series = hourly.pyramid(freq, metric).window(start, end, max_points, method=sampling)
+    if window_type == "Rolling":
+        smoothed = hourly.rolling(freq, window, metric=metric)
+    elif window_type == "Expanding":
+        smoothed = hourly.expanding(freq, metric=metric)
+    else:
+        smoothed = None
+
+    if smoothed is not None:
+        smoothed = downsample(smoothed.loc[start:end], max_points, method=sampling)
+
+    show_chart(charts.draw_time_series_line, hourly_fingerprint, series, smoothed,
+               key=(freq, metric, window_type, window, start, end, sampling),
+               title=f"Penyewaan Sepeda {freq_label} ({metric})", figsize=figsize)
+
+
+# Heatmap pola jam x hari dengan pilihan metrik sendiri
+@st.fragment
+def fragment_hour_weekday_profile(hourly_fingerprint, hourly):
+    metric = st.selectbox("Metrik pola", hourly.metrics)
+    show_chart(charts.draw_hour_weekday_heatmap, hourly_fingerprint, hourly.hour_weekday_profile(metric),
+               key=(metric,), figsize=(8, 7))
+
+
+# Halaman Analisis Time Series
+def page_time_series(clean_fingerprint, results):
+    st.subheader("Tren Musiman Penyewaan Sepeda 🚴‍♂️📊")
+    
+    # Visualisasi tren musiman (rata-rata jumlah penyewaan per musim)
+    show_report_chart("seasonal_trend_line", clean_fingerprint, results)
+
+    # Insight Analysis
+    st.subheader("🔍 Insight: Tren Penyewaan Sepeda Berdasarkan Musim")
+    
+    st.markdown("""
+    ### ❄️ Penyewaan Sepeda Terendah di Musim Dingin (Winter - **2647**)
+    - Musim dingin menjadi periode dengan penyewaan sepeda paling sedikit.
+    - Cuaca ekstrem seperti suhu rendah, hujan, atau salju mungkin menjadi penyebab utama rendahnya minat pengguna.
+    - **Strategi:** Menawarkan diskon khusus atau fasilitas seperti pakaian hangat dan perlengkapan musim dingin untuk menarik penyewa.
+
+    ### 🌸 Lonjakan Signifikan di Musim Semi (Spring - **4748**)
+    - Saat cuaca mulai menghangat, penyewaan meningkat hampir **2x lipat** dibandingkan musim dingin.
+    - Banyak orang kembali beraktivitas di luar ruangan, menjadikan sepeda pilihan transportasi yang lebih populer.
+    - **Strategi:** Promosi keanggotaan atau paket langganan di awal musim semi bisa mendorong lebih banyak pelanggan.
+
+    ### ☀️ Puncak Penyewaan di Musim Panas (Summer - **5490**)
+    - Musim panas adalah periode **terbaik** untuk bisnis penyewaan sepeda.
+    - Liburan musim panas, cuaca cerah, dan lebih banyak aktivitas luar ruangan berkontribusi terhadap lonjakan ini.
+    - **Strategi:** Mengadakan event bersepeda, promo family pack, atau penyewaan dengan durasi lebih lama untuk menarik lebih banyak pelanggan.
+
+    ### 🍂 Penurunan Bertahap di Musim Gugur (Fall - **4672**)
+    - Penyewaan mulai menurun saat memasuki musim gugur, seiring cuaca yang mulai lebih dingin.
+    - Banyak orang yang mulai mengurangi aktivitas luar ruangan menjelang musim dingin.
+    - **Strategi:** Promo "Akhir Musim" atau penawaran diskon untuk langganan musim gugur bisa membantu mengurangi dampak penurunan ini.
+
+    ---
+    
+    ### 📌 **Kesimpulan & Rekomendasi**
+    🔹 **Cuaca sangat memengaruhi pola penyewaan sepeda** – memahami tren musiman bisa membantu strategi pemasaran yang lebih efektif.  
+    🔹 **Fokus pada musim dingin** dengan insentif bagi penyewa agar minat tidak terlalu menurun drastis.  
+    🔹 **Maksimalkan musim panas** dengan kampanye pemasaran dan program loyalitas.  
+    🔹 **Persiapkan strategi transisi dari musim gugur ke musim dingin** agar tidak terjadi penurunan drastis dalam penyewaan.  
+
+    🚀 **Dengan strategi yang tepat, tren musiman ini bisa dimanfaatkan untuk meningkatkan pendapatan dan memperluas jangkauan bisnis penyewaan sepeda!** 💡
+    """)
+
+    # 📌 Deret waktu per jam dari data hour.csv
+    st.subheader("⏱️ Deret Waktu Penyewaan Per Jam")
+    with stage("hourly series"):
+        hourly_fingerprint, hourly = load_hourly_series()
+
+    fragment_hourly_trend(hourly_fingerprint, hourly)
+
+    st.write("### 🗓️ Pola Penyewaan per Jam dan Hari")
+    fragment_hour_weekday_profile(hourly_fingerprint, hourly)
+
+    st.markdown("""
+    📌 **Insight:** Pada hari kerja penyewaan memuncak di jam berangkat (sekitar pukul 08.00) dan pulang kerja (sekitar pukul 17.00-18.00),
+    sedangkan pada akhir pekan penyewaan tersebar di siang hari. Pola ini memperkuat temuan bahwa sepeda banyak dipakai untuk transportasi harian.
+    """)